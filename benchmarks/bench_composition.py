@@ -0,0 +1,46 @@
+import pytest
+
+from cantok import AbstractToken, SimpleToken, TimeoutToken
+
+NAMESPACE_SIZES = [10, 1000, 10000]
+
+
+def make_namespace(size):
+    namespace = {f'variable_{index}': index for index in range(size)}
+    namespace.update({'SimpleToken': SimpleToken, 'TimeoutToken': TimeoutToken, 'stored_token': SimpleToken()})
+    return namespace
+
+
+@pytest.mark.parametrize(
+    'size',
+    NAMESPACE_SIZES,
+)
+def test_add_temporary_tokens(benchmark, size):
+    namespace = make_namespace(size)
+    code = compile('SimpleToken() + TimeoutToken(15)', '<benchmark>', 'eval')
+
+    benchmark(eval, code, namespace)
+
+
+@pytest.mark.parametrize(
+    'size',
+    NAMESPACE_SIZES,
+)
+def test_add_stored_token(benchmark, size):
+    namespace = make_namespace(size)
+    code = compile('stored_token + TimeoutToken(15)', '<benchmark>', 'eval')
+
+    benchmark(eval, code, namespace)
+
+
+def test_combine(benchmark):
+    first_token = SimpleToken()
+    second_token = TimeoutToken(15)
+
+    benchmark(AbstractToken.combine, first_token, second_token)
+
+
+def test_embed_many_tokens(benchmark):
+    tokens = [TimeoutToken(1000 + index) for index in range(1000)]
+
+    benchmark(SimpleToken, *tokens)
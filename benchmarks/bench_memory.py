@@ -0,0 +1,38 @@
+import tracemalloc
+from functools import partial
+
+import pytest
+
+from cantok import ConditionToken, CounterToken, DefaultToken, SimpleToken, TimeoutToken
+
+NUMBER_OF_TOKENS = 10000
+
+TOKENS_FABRICS = {
+    'SimpleToken': SimpleToken,
+    'DefaultToken': DefaultToken,
+    'ConditionToken': partial(ConditionToken, bool),
+    'TimeoutToken': partial(TimeoutToken, 1000),
+    'CounterToken': partial(CounterToken, 1000),
+    'SimpleToken(SimpleToken())': lambda: SimpleToken(SimpleToken()),
+}
+
+
+def measure_bytes_per_token(token_fabric):
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        tokens = [token_fabric() for _ in range(NUMBER_OF_TOKENS)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del tokens
+    return (after - before) / NUMBER_OF_TOKENS
+
+
+@pytest.mark.parametrize(
+    'token_name',
+    list(TOKENS_FABRICS),
+)
+def test_memory_per_token(benchmark, token_name):
+    bytes_per_token = benchmark.pedantic(measure_bytes_per_token, args=(TOKENS_FABRICS[token_name],), rounds=1)
+    benchmark.extra_info['bytes_per_token'] = bytes_per_token
@@ -0,0 +1,126 @@
+from functools import partial
+
+import pytest
+
+from cantok import (
+    ConditionToken,
+    CounterToken,
+    DefaultToken,
+    SharedToken,
+    SimpleToken,
+    TimeoutToken,
+)
+
+TOKENS_FABRICS = {
+    'SimpleToken': SimpleToken,
+    'DefaultToken': DefaultToken,
+    'ConditionToken': partial(ConditionToken, lambda: False),
+    'ConditionToken(min_interval)': partial(ConditionToken, lambda: False, min_interval=0.05),
+    'TimeoutToken': partial(TimeoutToken, 1000),
+    'TimeoutToken(monotonic)': partial(TimeoutToken, 1000, monotonic=True),
+    'CounterToken': partial(CounterToken, 10 ** 12),
+    'SharedToken': SharedToken,
+}
+
+
+def deep_tree(depth, leaf):
+    token = leaf
+    for _ in range(depth):
+        token = SimpleToken(token)
+    return token
+
+
+TREES_FABRICS = {
+    'deep(50, SimpleToken)': partial(deep_tree, 50, SimpleToken()),
+    'deep(50, TimeoutToken)': partial(deep_tree, 50, TimeoutToken(1000)),
+    'deep(50, ConditionToken)': partial(deep_tree, 50, ConditionToken(lambda: False)),
+    'wide(1000, SimpleToken)': lambda: SimpleToken(*(SimpleToken() for _ in range(1000))),
+    'wide(1000, TimeoutToken)': lambda: SimpleToken(*(TimeoutToken(1000 + index) for index in range(1000))),
+    'wide(1000, ConditionToken)': lambda: SimpleToken(*(ConditionToken(lambda: False) for _ in range(1000))),
+    'SimpleToken(CounterToken)': lambda: SimpleToken(CounterToken(10 ** 12)),
+    'SimpleToken(CounterToken(chunk_size))': lambda: SimpleToken(CounterToken(10 ** 12, chunk_size=100)),
+    'wide(10, deep(10, mixed))': lambda: SimpleToken(*(deep_tree(10, TimeoutToken(1000, SimpleToken())) for _ in range(10))),
+}
+
+
+@pytest.mark.parametrize(
+    'token_name',
+    list(TOKENS_FABRICS),
+)
+def test_keep_on(benchmark, token_name):
+    token = TOKENS_FABRICS[token_name]()
+
+    assert benchmark(token.keep_on)
+
+
+@pytest.mark.parametrize(
+    'token_name',
+    list(TOKENS_FABRICS),
+)
+def test_check(benchmark, token_name):
+    token = TOKENS_FABRICS[token_name]()
+
+    benchmark(token.check)
+
+
+def test_keep_on_of_cancelled_token(benchmark):
+    token = SimpleToken(SimpleToken(cancelled=True))
+
+    assert not benchmark(token.keep_on)
+
+
+@pytest.mark.parametrize(
+    'tree_name',
+    list(TREES_FABRICS),
+)
+def test_keep_on_of_tree(benchmark, tree_name):
+    token = TREES_FABRICS[tree_name]()
+
+    assert benchmark(token.keep_on)
+
+
+@pytest.mark.parametrize(
+    'token_name',
+    list(TOKENS_FABRICS),
+)
+def test_create_token(benchmark, token_name):
+    benchmark(TOKENS_FABRICS[token_name])
+
+
+@pytest.mark.parametrize(
+    'check_every',
+    [1, 10, 100],
+)
+def test_iterate(benchmark, check_every):
+    token = SimpleToken(TimeoutToken(1000))
+    iterable = range(10000)
+
+    def iterate():
+        for _ in token.iterate(iterable, check_every=check_every):
+            pass
+
+    benchmark(iterate)
+
+
+def test_while_token_loop(benchmark):
+    token = SimpleToken(TimeoutToken(1000))
+    iterable = range(10000)
+
+    def iterate():
+        for _ in iterable:
+            if not token:
+                break
+
+    benchmark(iterate)
+
+
+def test_gate(benchmark):
+    gate = SimpleToken(TimeoutToken(1000)).gate(max_latency=0.001)
+    iterable = range(10000)
+
+    def iterate():
+        for _ in iterable:
+            if not gate:
+                break
+
+    benchmark(iterate)
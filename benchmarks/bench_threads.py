@@ -0,0 +1,63 @@
+from threading import Barrier, Thread
+
+import pytest
+
+from cantok import CounterToken, SimpleToken, TimeoutToken
+
+POLLS_PER_THREAD = 10000
+
+
+def poll_in_threads(token, number_of_threads, use_check=False):
+    barrier = Barrier(number_of_threads)
+    method = token.check if use_check else token.keep_on
+
+    def poll():
+        barrier.wait()
+        for _ in range(POLLS_PER_THREAD):
+            method()
+
+    threads = [Thread(target=poll) for _ in range(number_of_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+@pytest.mark.parametrize(
+    'number_of_threads',
+    [1, 4, 16],
+)
+def test_counter_token_under_contention(benchmark, number_of_threads):
+    token = CounterToken(10 ** 12)
+
+    benchmark.pedantic(poll_in_threads, args=(token, number_of_threads), rounds=5)
+
+
+@pytest.mark.parametrize(
+    'number_of_threads',
+    [1, 4, 16],
+)
+def test_chunked_counter_token_under_contention(benchmark, number_of_threads):
+    token = CounterToken(10 ** 12, chunk_size=1024)
+
+    benchmark.pedantic(poll_in_threads, args=(token, number_of_threads), rounds=5)
+
+
+@pytest.mark.parametrize(
+    'number_of_threads',
+    [1, 4, 16],
+)
+def test_chunked_counter_token_check_under_contention(benchmark, number_of_threads):
+    token = CounterToken(10 ** 12, chunk_size=1024)
+
+    benchmark.pedantic(poll_in_threads, args=(token, number_of_threads, True), rounds=5)
+
+
+@pytest.mark.parametrize(
+    'number_of_threads',
+    [1, 4, 16],
+)
+def test_stateless_tokens_under_contention(benchmark, number_of_threads):
+    token = SimpleToken(TimeoutToken(1000), SimpleToken())
+
+    benchmark.pedantic(poll_in_threads, args=(token, number_of_threads), rounds=5)
@@ -0,0 +1,68 @@
+from threading import Event, Thread
+from time import perf_counter, process_time
+
+import pytest
+
+from cantok import ConditionToken, SimpleToken, TimeoutToken
+
+
+def start_waiter(token_fabric):
+    token = token_fabric()
+    started = Event()
+    finished = Event()
+
+    def wait():
+        started.set()
+        token.wait()
+        finished.set()
+
+    Thread(target=wait).start()
+    started.wait()
+    return (token, finished), {}
+
+
+def cancel_and_wait_for_waiter(token, finished):
+    token.cancel()
+    finished.wait()
+
+
+@pytest.mark.parametrize(
+    'token_fabric',
+    [SimpleToken, lambda: SimpleToken(TimeoutToken(1000)), lambda: ConditionToken(lambda: False)],
+    ids=['SimpleToken', 'TimeoutToken', 'ConditionToken'],
+)
+def test_wake_up_latency_of_sync_wait(benchmark, token_fabric):
+    benchmark.pedantic(cancel_and_wait_for_waiter, setup=lambda: start_waiter(token_fabric), rounds=200)
+
+
+def test_wake_up_latency_of_async_wait(benchmark):
+    import asyncio  # noqa: PLC0415
+
+    def run():
+        async def main():
+            token = SimpleToken()
+            waiter = asyncio.ensure_future(token.wait())
+            await asyncio.sleep(0)
+            start = perf_counter()
+            token.cancel()
+            await waiter
+            return perf_counter() - start
+        return asyncio.run(main())
+
+    benchmark.pedantic(run, rounds=100)
+
+
+@pytest.mark.parametrize(
+    'token_fabric',
+    [lambda: TimeoutToken(0.2), lambda: ConditionToken(lambda: False, TimeoutToken(0.2))],
+    ids=['TimeoutToken', 'ConditionToken'],
+)
+def test_cpu_usage_of_wait(benchmark, token_fabric):
+    def wait():
+        token = token_fabric()
+        start = process_time()
+        token.wait()
+        return process_time() - start
+
+    cpu_time = benchmark.pedantic(wait, rounds=3)
+    benchmark.extra_info['cpu_seconds_per_wall_second'] = cpu_time / 0.2
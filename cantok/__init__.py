@@ -1,14 +1,22 @@
+from cantok.errors import BudgetCancellationError as BudgetCancellationError
 from cantok.errors import CancellationError as CancellationError
 from cantok.errors import ConditionCancellationError as ConditionCancellationError
 from cantok.errors import CounterCancellationError as CounterCancellationError
 from cantok.errors import ImpossibleCancelError as ImpossibleCancelError
+from cantok.errors import RateCancellationError as RateCancellationError
 from cantok.errors import TimeoutCancellationError as TimeoutCancellationError
+from cantok.group import TokenGroup as TokenGroup
 from cantok.tokens.abstract.abstract_token import (
     AbstractToken as AbstractToken,
 )
+from cantok.tokens.abstract.poll_gate import PollGate as PollGate
+from cantok.tokens.abstract.snapshot import TokenSnapshot as TokenSnapshot
+from cantok.tokens.budget_token import BudgetToken as BudgetToken
 from cantok.tokens.condition_token import ConditionToken as ConditionToken
 from cantok.tokens.counter_token import CounterToken as CounterToken
 from cantok.tokens.default_token import DefaultToken as DefaultToken
+from cantok.tokens.rate_token import RateToken as RateToken
+from cantok.tokens.shared_token import SharedToken as SharedToken
 from cantok.tokens.simple_token import SimpleToken as SimpleToken
 from cantok.tokens.timeout_token import TimeoutToken as TimeoutToken
 
@@ -16,3 +16,9 @@ class TimeoutCancellationError(CancellationError):
 
 class ImpossibleCancelError(CancellationError):
     pass
+
+class BudgetCancellationError(CancellationError):
+    pass
+
+class RateCancellationError(CancellationError):
+    pass
@@ -0,0 +1,138 @@
+import weakref
+from collections import deque
+from functools import partial
+from heapq import heapify, heappop, heappush
+from itertools import count
+from threading import RLock
+from typing import Callable, Deque, Dict, Iterator, List, Tuple, Union
+
+from cantok.tokens.abstract.abstract_token import AbstractToken
+
+# How many removed entries may be left among the deadlines in addition to the ones
+# proportional to the size of the group.
+DEADLINES_RESERVE = 64
+
+
+class TokenGroup:
+    """
+    A collection of tokens that finds out which of them are cancelled in one call.
+
+    pop_cancelled() does not poll all the tokens of the group one by one: manual
+    cancellation is pushed to the group as soon as it happens, the deadlines of the
+    tokens that can be cancelled only by time are kept sorted and compared with a
+    single clock reading, and only the tokens with other automatic conditions (such
+    as ConditionToken) are polled.
+
+    The tokens should not be changed (for example, by embedding new tokens into
+    them) after they are added to the group.
+
+    >>> group = TokenGroup()
+    >>> first_token, second_token = SimpleToken(), TimeoutToken(0)
+    >>> group.add(first_token)
+    >>> group.add(second_token)
+    >>> group.pop_cancelled() == [second_token]
+    True
+    >>> len(group)
+    1
+    """
+
+    def __init__(self, *tokens: AbstractToken) -> None:
+        self._lock = RLock()
+        self._listeners: Dict[AbstractToken, Callable[[], None]] = {}
+        # Listeners only append to this deque and never take the lock: a token can be
+        # cancelled under its own lock, which pop_cancelled() may need to poll it.
+        self._pushed_tokens: Deque[AbstractToken] = deque()
+        self._tokens_to_poll: Dict[AbstractToken, None] = {}
+        # The deadlines keep only weak references, so that the removed tokens are not kept
+        # alive until their deadlines. The removed entries are dropped when they outnumber
+        # the tokens of the group.
+        self._deadlines: Dict[Callable[[], Union[int, float]], List[Tuple[Union[int, float], int, 'weakref.ref[AbstractToken]']]] = {}
+        self._deadlines_size = 0
+        self._counter = count()
+
+        for token in tokens:
+            self.add(token)
+
+    def __len__(self) -> int:
+        return len(self._listeners)
+
+    def __contains__(self, token: object) -> bool:
+        return token in self._listeners
+
+    def __iter__(self) -> Iterator[AbstractToken]:
+        return iter(list(self._listeners))
+
+    def add(self, token: AbstractToken) -> None:
+        """
+        Adds a token to the group. Does nothing if the token is already there.
+        """
+        with self._lock:
+            if token in self._listeners:
+                return
+
+            listener = partial(self._push, token)
+            self._listeners[token] = listener
+            token._add_listener(listener)
+
+            deadline = token._get_deadline()
+            if token._cancelled or token._cached_report is not None:
+                self._pushed_tokens.append(token)
+            elif deadline is not None:
+                timer, time = deadline
+                heappush(self._deadlines.setdefault(timer, []), (time, next(self._counter), weakref.ref(token)))
+                self._deadlines_size += 1
+            elif token._needs_polling():
+                self._tokens_to_poll[token] = None
+
+    def discard(self, token: AbstractToken) -> None:
+        """
+        Removes a token from the group. Does nothing if the token is not there.
+        """
+        with self._lock:
+            listener = self._listeners.pop(token, None)
+            if listener is not None:
+                token._remove_listener(listener)
+                self._tokens_to_poll.pop(token, None)
+                # The removed tokens left in the deque and among the deadlines are skipped
+                # by pop_cancelled().
+                if self._deadlines_size > 2 * len(self._listeners) + DEADLINES_RESERVE:
+                    self._compact_deadlines()
+
+    def pop_cancelled(self) -> List[AbstractToken]:
+        """
+        Removes all cancelled tokens from the group and returns them.
+        """
+        with self._lock:
+            cancelled_tokens: Dict[AbstractToken, None] = {}
+
+            while self._pushed_tokens:
+                token = self._pushed_tokens.popleft()
+                if token in self._listeners:
+                    cancelled_tokens[token] = None
+
+            for timer, deadlines in self._deadlines.items():
+                now = timer()
+                while deadlines and deadlines[0][0] <= now:
+                    expired_token = heappop(deadlines)[2]()
+                    self._deadlines_size -= 1
+                    if expired_token in self._listeners and expired_token._find_report(direct=False) is not None:
+                        cancelled_tokens[expired_token] = None
+
+            for token in list(self._tokens_to_poll):
+                if token._find_report(direct=False) is not None:
+                    cancelled_tokens[token] = None
+
+            for token in cancelled_tokens:
+                self.discard(token)
+
+            return list(cancelled_tokens)
+
+    def _compact_deadlines(self) -> None:
+        self._deadlines_size = 0
+        for deadlines in self._deadlines.values():
+            deadlines[:] = [item for item in deadlines if item[2]() in self._listeners]
+            heapify(deadlines)
+            self._deadlines_size += len(deadlines)
+
+    def _push(self, token: AbstractToken) -> None:
+        self._pushed_tokens.append(token)
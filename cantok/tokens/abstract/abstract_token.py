@@ -1,14 +1,46 @@
 import sys
+import weakref
 from abc import ABC, abstractmethod
-from threading import RLock
-from typing import Any, Awaitable, Dict, List, Optional, Union
+from asyncio import Future, Task, get_running_loop
+from itertools import islice
+from threading import Lock, RLock, Thread
+from time import time
+from types import FrameType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from cantok.errors import CancellationError
+from cantok.tokens.abstract.callback import CancellationCallback
 from cantok.tokens.abstract.cancel_cause import CancelCause
 from cantok.tokens.abstract.coroutine_wrapper import WaitCoroutineWrapper
+from cantok.tokens.abstract.descriptor import get_descriptor
+from cantok.tokens.abstract.poll_gate import PollGate
 from cantok.tokens.abstract.report import CancellationReport
+from cantok.tokens.abstract.snapshot import SnapshotNode, TokenSnapshot
+from cantok.tokens.abstract.thread_binding import watch_thread
+from cantok.tokens.abstract.watcher import watcher
 from cantok.types import IterableWithTokens
 
+if TYPE_CHECKING:  # pragma: no cover
+    from cantok.tokens.timeout_token import TimeoutToken
+
+_lock_for_creating_locks = Lock()
+
+IterableItem = TypeVar('IterableItem')
+
 
 class AbstractToken(ABC):
     """
@@ -39,15 +71,44 @@ class AbstractToken(ABC):
     ...     ...  # loop exits when token is cancelled
     """
 
+    __slots__ = (
+        '__weakref__',
+        '_cached_report',
+        '_cancelled',
+        '_lazy_lock',
+        '_listeners',
+        '_nearest_timeouts',
+        '_own_reports',
+        '_parents',
+        '_timed_tokens',
+        '_tokens',
+        '_tokens_to_poll',
+    )
+
     exception = CancellationError
     _rollback_if_nondirect_polling = False
+    _has_superpower = True
+    # Set to True in subclasses whose superpower has no state of its own (or no superpower
+    # at all): their check() does not take the lock.
+    _stateless_superpower = False
 
     def __init__(self, *tokens: 'AbstractToken', cancelled: bool = False) -> None:
+        # Everything that most tokens never need is created lazily: tokens are cheap
+        # to create in large numbers (one per request, for example).
         self._cached_report: Optional[CancellationReport] = None
+        self._own_reports: Optional[Dict[CancelCause, CancellationReport]] = None
         self._cancelled: bool = cancelled
-        self._tokens: List[AbstractToken] = self._filter_tokens(tokens)
-
-        self._lock: RLock = RLock()
+        self._parents: Optional[List[weakref.ref]] = None  # type: ignore[type-arg]
+        self._listeners: Optional[List[Callable[[], Any]]] = None
+        self._tokens: Sequence[AbstractToken] = ()
+        self._tokens_to_poll: Sequence[AbstractToken] = ()
+        self._timed_tokens: Sequence[Tuple[Callable[[], Union[int, float]], Union[int, float], AbstractToken]] = ()
+        # The timeout tokens with the nearest deadlines among all the nested tokens, one per clock.
+        self._nearest_timeouts: Sequence[TimeoutToken] = ()
+        self._lazy_lock: Optional[RLock] = None
+
+        if tokens:
+            self._embed_tokens(self._filter_tokens(tokens))
 
     def __repr__(self) -> str:
         chunks = []
@@ -80,64 +141,86 @@ class AbstractToken(ABC):
         if not isinstance(item, AbstractToken):
             raise TypeError('Cancellation Token can only be combined with another Cancellation Token.')
 
-        from cantok import DefaultToken, SimpleToken, TimeoutToken  # noqa: PLC0415
+        from cantok import DefaultToken, SharedToken, SimpleToken, TimeoutToken  # noqa: PLC0415
 
         if self._cancelled or item._cancelled:
             return SimpleToken(cancelled=True)
 
-        nested_tokens = []
+        nested_tokens: List[AbstractToken] = []
         container_token: Optional[AbstractToken] = None
 
         # Inspect the caller's frame to determine if a token is "temporary"
         # (not stored in any variable). This is robust across all Python versions,
         # unlike refcount-based detection which varies with bytecode optimizations.
-        _frame = sys._getframe(1)
-        _caller_locals = list(_frame.f_locals.values())
-        _caller_globals = list(_frame.f_globals.values())
-
-        def is_temp(token: 'AbstractToken') -> bool:
-            for v in _caller_locals:
-                if v is token:
-                    return False
-            return all(v is not token for v in _caller_globals)
-
-        _self_is_temp = is_temp(self)
-        _item_is_temp = is_temp(item)
+        # Both operands are looked up in a single pass over the caller's namespaces.
+        # If this is too expensive for you, use AbstractToken.combine() instead.
+        _self_is_temp, _item_is_temp = self._are_temporary(sys._getframe(1), item)
 
         if isinstance(self, TimeoutToken) and isinstance(item, TimeoutToken) and self._monotonic == item._monotonic:
             if self._deadline >= item._deadline and _self_is_temp:
                 if _item_is_temp:
-                    item._tokens.extend(self._tokens)
+                    item._embed_tokens(self._tokens)
                     return item
                 if self._tokens:
                     return SimpleToken(*(self._tokens), item)
                 return item
             if self._deadline < item._deadline and _item_is_temp:
                 if _self_is_temp:
-                    self._tokens.extend(item._tokens)
+                    self._embed_tokens(item._tokens)
                     return self
                 if item._tokens:
                     return SimpleToken(*(item._tokens), self)
                 return self
 
-        for token in self, item:
-            if isinstance(token, SimpleToken) and is_temp(token):
+        for token, token_is_temp in ((self, _self_is_temp), (item, _item_is_temp)):
+            if isinstance(token, SimpleToken) and token_is_temp:
                 nested_tokens.extend(token._tokens)
             elif isinstance(token, DefaultToken):
                 pass
-            elif not isinstance(token, SimpleToken) and is_temp(token) and container_token is None:
+            # The tokens embedded into a SharedToken could not be passed to another process with it.
+            elif not isinstance(token, (SimpleToken, SharedToken)) and token_is_temp and container_token is None:
                 container_token = token
             else:
                 nested_tokens.append(token)
 
         if container_token is None:
             return SimpleToken(*nested_tokens)
-        container_token._tokens.extend(container_token._filter_tokens(nested_tokens))
+        container_token._embed_tokens(container_token._filter_tokens(nested_tokens))
         return container_token
 
     def __bool__(self) -> bool:
         return self.keep_on()
 
+    @staticmethod
+    def combine(*tokens: 'AbstractToken') -> 'AbstractToken':
+        """
+        Combines tokens into one, like the + operator, but at a fixed and low cost.
+
+        Unlike +, it never guesses whether an operand is stored somewhere else, so the
+        result does not depend on the calling code: it is always a new SimpleToken
+        containing the operands, which are never modified. DefaultTokens are dropped,
+        repeated operands are embedded once, and a cancelled operand makes the result
+        cancelled.
+
+        >>> request_token = SimpleToken()
+        >>> token = AbstractToken.combine(request_token, TimeoutToken(5), TimeoutToken(3))
+        >>> token
+        SimpleToken(SimpleToken(), TimeoutToken(5), TimeoutToken(3))
+        """
+        from cantok import SimpleToken  # noqa: PLC0415
+
+        operands: List[AbstractToken] = []
+
+        for token in tokens:
+            if not isinstance(token, AbstractToken):
+                raise TypeError('Cancellation Token can only be combined with another Cancellation Token.')
+            if token._cancelled:
+                return SimpleToken(cancelled=True)
+            if all(token is not operand for operand in operands):
+                operands.append(token)
+
+        return SimpleToken(*operands)
+
     @property
     def cancelled(self) -> bool:
         """
@@ -160,7 +243,7 @@ class AbstractToken(ABC):
     def cancelled(self, new_value: bool) -> None:
         with self._lock:
             if new_value == True:
-                self._cancelled = True
+                self.cancel()
             elif self.is_cancelled():
                 raise ValueError('You cannot restore a cancelled token.')
 
@@ -176,7 +259,7 @@ class AbstractToken(ABC):
         >>> token.keep_on()
         False
         """
-        return not self.is_cancelled()
+        return self._find_report(direct=True) is None
 
     def is_cancelled(self, direct: bool = True) -> bool:
         """
@@ -193,18 +276,74 @@ class AbstractToken(ABC):
         >>> token.is_cancelled()
         True
         """
-        return self._get_report(direct=direct).cause != CancelCause.NOT_CANCELLED
+        return self._find_report(direct=direct) is not None
+
+    @property
+    def deadline(self) -> Optional[float]:
+        """
+        The nearest deadline of the token and all embedded tokens, as a value of
+        time.perf_counter(), or None if the token cannot be cancelled by time.
+
+        Only the deadlines of TimeoutToken objects are taken into account; the token
+        can still be cancelled earlier for any other reason. The deadline is known in
+        advance, so reading it does not poll the token.
+
+        >>> from time import perf_counter
+        >>>
+        >>> token = SimpleToken(TimeoutToken(5), TimeoutToken(3))
+        >>> round(token.deadline - perf_counter())
+        3
+        >>> SimpleToken().deadline is None
+        True
+        """
+        result = None
+        for timeout in self._get_nearest_timeouts():
+            deadline = timeout._get_deadline_in_perf_counter_time()
+            if result is None or deadline < result:
+                result = deadline
+        return result
+
+    def remaining(self) -> Optional[float]:
+        """
+        Returns the number of seconds left until the nearest deadline of the token and
+        all embedded tokens, or None if the token cannot be cancelled by time.
+
+        The result is never less than zero. It can be passed as a timeout to any
+        blocking call, such as socket.settimeout() or select.select(). Only the
+        deadlines of TimeoutToken objects are taken into account.
+
+        >>> token = SimpleToken(TimeoutToken(5), TimeoutToken(3))
+        >>> round(token.remaining())
+        3
+        >>> SimpleToken().remaining() is None
+        True
+        """
+        result = None
+        for timeout in self._get_nearest_timeouts():
+            remaining = timeout._get_remaining_time()
+            if result is None or remaining < result:
+                result = remaining
+        return result
 
-    def wait(self, step: Union[int, float] = 0.0001, timeout: Optional[Union[int, float]] = None) -> Awaitable:  # type: ignore[type-arg]
+    def wait(self, step: Union[int, float] = 0.0001, timeout: Optional[Union[int, float]] = None, max_step: Optional[Union[int, float]] = None) -> Awaitable:  # type: ignore[type-arg]
         """
         Waits until the token is cancelled.
 
         When used with ``await``, runs non-blocking inside an asyncio event loop.
         When called without ``await``, blocks the current thread.
 
-        :param step: Interval between status checks, in seconds. Defaults to 0.0001.
+        Manual cancellation wakes the waiter up immediately, and timeouts are awaited
+        with a single sleep until the nearest deadline. Periodic polling is used only
+        for tokens whose condition can be found out only by calling it, such as
+        ConditionToken.
+
+        :param step: Interval between status checks of such tokens, in seconds. Defaults to 0.0001.
         :param timeout: Maximum time to wait, in seconds. If exceeded,
                         raises TimeoutCancellationError. Defaults to None (no limit).
+        :param max_step: Enables exponential backoff: the interval starts at step and
+                         doubles after every poll that has found nothing, up to max_step.
+                         It is also capped by the nearest deadline and goes back to step
+                         after a wake-up. Defaults to None (the interval is always step).
 
         >>> import asyncio
         >>>
@@ -218,6 +357,10 @@ class AbstractToken(ABC):
             raise ValueError('The total timeout of waiting cannot be less than zero.')
         if timeout is not None and step > timeout:
             raise ValueError('The total timeout of waiting cannot be less than the time of one iteration of the token polling.')
+        if max_step is not None and step <= 0:
+            raise ValueError('The token polling iteration time must be greater than zero to increase it.')
+        if max_step is not None and max_step < step:
+            raise ValueError('The maximum token polling iteration time cannot be less than the initial one.')
 
         if timeout is None:
             from cantok import SimpleToken  # noqa: PLC0415
@@ -226,7 +369,185 @@ class AbstractToken(ABC):
             from cantok import TimeoutToken  # noqa: PLC0415
             token = TimeoutToken(timeout)
 
-        return WaitCoroutineWrapper(step, self + token, token)
+        return WaitCoroutineWrapper(step, self + token, token, max_step)
+
+    def as_future(self, step: Union[int, float] = 0.0001) -> 'Future[None]':
+        """
+        Returns an asyncio future that is resolved (with None) when the token is cancelled.
+
+        Must be called inside a running event loop. The future is fed by the same
+        mechanism as wait(): manual cancellation resolves it immediately, from any
+        thread, and timeouts are awaited with a single sleep. Like wait(), it does not
+        spend the attempts of CounterToken by itself. Cancel the future if it is no
+        longer needed.
+
+        :param step: Interval between status checks of tokens that have to be polled,
+                     such as ConditionToken, in seconds. Defaults to 0.0001.
+
+        >>> async def main():
+        ...     token = SimpleToken()
+        ...     future = token.as_future()
+        ...     token.cancel()
+        ...     await future
+        >>> asyncio.run(main())
+        """
+        if step < 0:
+            raise ValueError('The token polling iteration time cannot be less than zero.')
+
+        from cantok import SimpleToken  # noqa: PLC0415
+
+        # As in wait(), the token is polled through a wrapper, so that the future does
+        # not spend the attempts of CounterToken by itself.
+        return get_running_loop().create_task(WaitCoroutineWrapper.async_wait(step, {}, SimpleToken(self), None))
+
+    def bind_task(self, task: 'Task[Any]', step: Union[int, float] = 0.0001) -> 'Future[None]':
+        """
+        Cancels an asyncio task as soon as the token is cancelled.
+
+        Must be called inside the event loop of the task. Returns the future from
+        as_future() that the binding is based on: cancel it to unbind the task. When
+        the task is done, the binding is removed automatically.
+
+        :param task: The task to cancel.
+        :param step: The same as for as_future().
+
+        >>> async def main():
+        ...     token = SimpleToken()
+        ...     task = asyncio.create_task(asyncio.sleep(10))
+        ...     token.bind_task(task)
+        ...     token.cancel()
+        ...     with suppress(asyncio.CancelledError):
+        ...         await task
+        ...     return task.cancelled()
+        >>> asyncio.run(main())
+        True
+        """
+        future = self.as_future(step)
+
+        def cancel_task(future: 'Future[None]') -> None:
+            if not future.cancelled():
+                task.cancel()
+
+        future.add_done_callback(cancel_task)
+        task.add_done_callback(lambda _: future.cancel())
+
+        return future
+
+    def bind_thread(self, thread: Thread, step: Union[int, float] = 0.0001) -> 'AbstractToken':
+        """
+        Raises the cancellation exception of the token in another thread when the
+        token is cancelled, even if that thread never checks the token.
+
+        The exception is the one check() would raise. It is delivered by the
+        interpreter (PyThreadState_SetAsyncExc() of CPython) and raised as soon as the
+        thread executes Python code: a call that is blocked in C code is not
+        interrupted, the exception is raised when it returns. The cancellation is
+        watched by a separate daemon thread in the same way as wait() does, except that
+        it never spends the attempts of CounterToken.
+
+        Returns a new token: cancel it to unbind the thread and stop the watcher. The
+        watcher also stops soon after the thread is finished, and then nothing happens
+        when the token is cancelled.
+
+        :param thread: The thread to bind. It must be started.
+        :param step: The same as for wait().
+
+        >>> token = TimeoutToken(5)
+        >>> thread = Thread(target=some_function_that_never_checks_tokens)
+        >>> thread.start()
+        >>> binding = token.bind_thread(thread)   # the function is stopped in 5 seconds
+        """
+        if thread.ident is None:
+            raise ValueError('The thread must be started before binding.')
+        if step < 0:
+            raise ValueError('The token polling iteration time cannot be less than zero.')
+
+        from cantok import SimpleToken  # noqa: PLC0415
+
+        binding = SimpleToken()
+        Thread(target=watch_thread, args=(self, binding, thread, step), daemon=True).start()
+        return binding
+
+    def fileno(self) -> int:
+        """
+        Returns a file descriptor that becomes readable when the token is cancelled.
+
+        It allows waiting for the cancellation together with sockets and other files,
+        with select(), selectors or epoll: tokens themselves can be passed there. The
+        descriptor is created on the first call (an eventfd on Linux, a socket
+        elsewhere), never has to be read, stays readable after the cancellation and is
+        closed when the token is destroyed.
+
+        Manual cancellation of the token or of any embedded token signals the
+        descriptor immediately. Timeouts and conditions are found out by the watcher
+        thread shared by all tokens: it sleeps until the nearest deadline and polls the
+        tokens that have to be polled (such as ConditionToken) with a backoff up to
+        10 milliseconds. The watcher never spends the attempts of CounterToken and
+        does not keep the token alive.
+
+        >>> token = TimeoutToken(5)
+        >>> selector.register(token, EVENT_READ)
+        >>> selector.select()   # returns in 5 seconds, if nothing else happens
+        """
+        return get_descriptor(self).fileno()
+
+    def on_cancel(self, callback: Callable[[], Any]) -> CancellationCallback:
+        """
+        Registers a function (without arguments) to be called once, as soon as the token
+        or any token embedded into it is cancelled. If the token is already cancelled,
+        the function is called right away.
+
+        Manual cancellation calls the function immediately, in the thread that
+        cancelled the token. Timeouts are found out by a shared watcher thread at their
+        deadlines, so the function is called in time even if nobody polls the token
+        (while the token exists: the watcher does not keep it alive). Other automatic
+        cancellation (a condition, a counter) calls it in the thread that first finds
+        it out: by polling the token, waiting for it or polling any token that
+        contains it.
+
+        If several functions raise exceptions, all of them are still called, and the
+        first exception is raised to the code that cancelled the token.
+
+        Returns a handle; call its unregister() method to unregister the function.
+
+        >>> token = SimpleToken()
+        >>> handle = token.on_cancel(lambda: print('cancelled!'))
+        >>> token.cancel()
+        cancelled!
+        """
+        handle = CancellationCallback(self, callback)
+
+        with self._lock:
+            self._add_listener(handle)
+
+        if self._peek_report() is not None:
+            handle()
+        else:
+            watcher.watch(self)
+
+        return handle
+
+    def snapshot(self) -> TokenSnapshot:
+        """
+        Returns a picklable description of the token and all tokens embedded into it,
+        to pass it to another process, where its restore() method creates an
+        equivalent token.
+
+        TimeoutToken deadlines are moved as absolute wall-clock time (time.time()),
+        CounterToken counters as the remaining number of attempts, and the cancelled
+        flags as they are. The conditions of ConditionTokens cannot be moved, so they
+        are replaced by their current state. A SharedToken channel links the original
+        token with the restored ones: it is cancelled when any of them is cancelled.
+
+        >>> snapshot = TimeoutToken(5).snapshot()
+        >>> restored_token = pickle.loads(pickle.dumps(snapshot)).restore()
+        """
+        from cantok import SharedToken  # noqa: PLC0415
+
+        tree = self._take_snapshot(time())
+        channel = SharedToken()
+        handle = self.on_cancel(channel.cancel)
+        return TokenSnapshot(tree, channel, handle)
 
     def cancel(self) -> 'AbstractToken':
         """
@@ -240,6 +561,7 @@ class AbstractToken(ABC):
         True
         """
         self._cancelled = True
+        self._announce_report(self._get_own_report(CancelCause.CANCELLED))
         return self
 
     def check(self) -> None:
@@ -256,14 +578,74 @@ class AbstractToken(ABC):
         >>> token.cancel()
         >>> token.check()   # raises CancellationError
         """
-        with self._lock:
-            report = self._get_report()
+        if self._stateless_superpower:
+            report = self._find_report(direct=True)
+        else:
+            with self._lock:
+                report = self._find_report(direct=True)
+
+        if report is None:
+            return
+
+        if report.cause == CancelCause.CANCELLED:
+            report.from_token._raise_cancelled_exception()
+
+        report.from_token._raise_superpower_exception()
+
+    def iterate(self, iterable: Iterable[IterableItem], check_every: int = 1) -> Iterator[IterableItem]:
+        """
+        Iterates over the iterable, checking the token every check_every items.
+
+        The check is done with check(), so the iteration is stopped by the usual
+        exception of the token. Checking the token only once per several items makes
+        the cost of cancellation negligible in loops with very short bodies. Each of
+        these checks is a single check for CounterToken: it counts the checks, not the
+        items.
+
+        :param iterable: The iterable to iterate over.
+        :param check_every: The number of items per check. Defaults to 1 (every item).
+
+        >>> token = TimeoutToken(1)
+        >>> for item in token.iterate(range(10 ** 9), check_every=1000):
+        ...     ...   # raises TimeoutCancellationError after about a second
+        """
+        if check_every < 1:
+            raise ValueError('The number of items per check must be greater than zero.')
+
+        return self._iterate(iter(iterable), check_every - 1)
+
+    def gate(self, max_latency: Union[int, float] = 0.005) -> PollGate:
+        """
+        Returns a gate that checks the token about every max_latency seconds.
 
-            if report.cause == CancelCause.CANCELLED:
-                report.from_token._raise_cancelled_exception()
+        The gate measures how long the iterations of the loop take and checks the
+        token only once per as many of them as fit into max_latency, so the cost of
+        checking stays negligible even when the iterations are very short, and the
+        cancellation is noticed in time even when they are long. Each real check is
+        a single check for CounterToken.
 
-            elif report.cause == CancelCause.SUPERPOWER:
-                report.from_token._raise_superpower_exception()
+        :param max_latency: The target time between real checks of the token, in
+                            seconds. Defaults to 0.005.
+
+        >>> token = TimeoutToken(1)
+        >>> gate = token.gate(max_latency=0.001)
+        >>> while gate:
+        ...     ...   # stops about a millisecond after the timeout expires
+        """
+        if max_latency <= 0:
+            raise ValueError('The maximum latency must be greater than zero.')
+
+        return PollGate(self, max_latency)
+
+    def _iterate(self, iterator: Iterator[IterableItem], unchecked_items: int) -> Iterator[IterableItem]:
+        check = self.check
+        # The outer loop takes the first item of each batch, and islice() takes the
+        # rest of it from the same iterator, without any per-item bookkeeping.
+        for item in iterator:
+            check()
+            yield item
+            if unchecked_items:
+                yield from islice(iterator, unchecked_items)
 
     def _filter_tokens(self, tokens: IterableWithTokens) -> List['AbstractToken']:
         from cantok import DefaultToken  # noqa: PLC0415
@@ -278,30 +660,289 @@ class AbstractToken(ABC):
 
         return result
 
+    @property
+    def _lock(self) -> RLock:
+        lock = self._lazy_lock
+        if lock is None:
+            with _lock_for_creating_locks:
+                lock = self._lazy_lock
+                if lock is None:
+                    lock = RLock()
+                    self._lazy_lock = lock
+        return lock
+
+    def _are_temporary(self, frame: FrameType, item: 'AbstractToken') -> Tuple[bool, bool]:
+        self_is_temp = True
+        item_is_temp = True
+
+        namespaces = [frame.f_locals]
+        if frame.f_globals is not namespaces[0]:
+            namespaces.append(frame.f_globals)
+
+        for namespace in namespaces:
+            for value in list(namespace.values()):
+                if value is self:
+                    self_is_temp = False
+                if value is item:
+                    item_is_temp = False
+                if not (self_is_temp or item_is_temp):
+                    return False, False
+
+        return self_is_temp, item_is_temp
+
+    def _embed_tokens(self, tokens: IterableWithTokens) -> None:
+        polling_state = self._get_polling_state()
+        embedded_tokens = list(self._tokens)
+        tokens_to_poll = list(self._tokens_to_poll)
+        timed_tokens = list(self._timed_tokens)
+        nearest_timeouts = list(self._nearest_timeouts)
+
+        for token in tokens:
+            embedded_tokens.append(token)
+            # The parent is registered before the state of the child is read, so a
+            # concurrent cancel() is either pushed to this token or seen right here.
+            token._register_parent(self)
+            self._sort_nested_token(token, tokens_to_poll, timed_tokens)
+            self._merge_timeouts(nearest_timeouts, token._get_nearest_timeouts())
+
+        if embedded_tokens:
+            self._tokens = embedded_tokens
+        self._tokens_to_poll = tokens_to_poll or ()
+        self._timed_tokens = timed_tokens or ()
+        self._nearest_timeouts = nearest_timeouts or ()
+
+        self._refresh_parents(polling_state)
+
+    def _refresh_nested_tokens(self) -> None:
+        polling_state = self._get_polling_state()
+        tokens_to_poll: List[AbstractToken] = []
+        timed_tokens: List[Tuple[Callable[[], Union[int, float]], Union[int, float], AbstractToken]] = []
+        nearest_timeouts: List[TimeoutToken] = []
+
+        for token in self._tokens:
+            self._sort_nested_token(token, tokens_to_poll, timed_tokens)
+            self._merge_timeouts(nearest_timeouts, token._get_nearest_timeouts())
+
+        self._tokens_to_poll = tokens_to_poll or ()
+        self._timed_tokens = timed_tokens or ()
+        self._nearest_timeouts = nearest_timeouts or ()
+
+        self._refresh_parents(polling_state)
+
+    @staticmethod
+    def _sort_nested_token(token: 'AbstractToken', tokens_to_poll: List['AbstractToken'], timed_tokens: List[Tuple[Callable[[], Union[int, float]], Union[int, float], 'AbstractToken']]) -> None:
+        # Tokens that can only be cancelled by time are not polled one by one: of all
+        # such tokens with the same clock, only the one with the nearest deadline is
+        # kept, and its deadline is compared with the clock before polling it.
+        if token._cancelled or token._cached_report is not None:
+            tokens_to_poll.append(token)
+            return
+
+        deadline = token._get_deadline()
+
+        if deadline is None:
+            if token._needs_polling():
+                tokens_to_poll.append(token)
+            return
+
+        timer, time = deadline
+        for index, (other_timer, other_time, _) in enumerate(timed_tokens):
+            if other_timer is timer:
+                if time < other_time:
+                    timed_tokens[index] = (timer, time, token)
+                return
+        timed_tokens.append((timer, time, token))
+
+    @staticmethod
+    def _merge_timeouts(timeouts: List['TimeoutToken'], new_timeouts: Sequence['TimeoutToken']) -> None:
+        for timeout in new_timeouts:
+            for index, other_timeout in enumerate(timeouts):
+                if other_timeout._timer is timeout._timer:
+                    if timeout._deadline < other_timeout._deadline:
+                        timeouts[index] = timeout
+                    break
+            else:
+                timeouts.append(timeout)
+
+    def _get_polling_state(self) -> Tuple[bool, Optional[Tuple[Callable[[], Union[int, float]], Union[int, float]]], Sequence['TimeoutToken']]:
+        return self._needs_polling(), self._get_deadline(), self._get_nearest_timeouts()
+
+    def _refresh_parents(self, old_polling_state: Tuple[bool, Optional[Tuple[Callable[[], Union[int, float]], Union[int, float]]], Sequence['TimeoutToken']]) -> None:
+        if self._get_polling_state() != old_polling_state:
+            for parent in self._get_parents():
+                parent._refresh_nested_tokens()
+
+    def _needs_polling(self) -> bool:
+        return self._has_superpower or bool(self._tokens_to_poll) or bool(self._timed_tokens)
+
+    def _needs_polling_by_step(self) -> bool:
+        return self._has_superpower or any(token._needs_polling_by_step() for token in self._tokens_to_poll)
+
+    def _get_deadline(self) -> Optional[Tuple[Callable[[], Union[int, float]], Union[int, float]]]:
+        # A token that can be cancelled only by the timeouts nested in it (with the same
+        # clock) is cancelled by time too, so its parents compare its nearest deadline
+        # with the clock instead of polling the whole subtree.
+        if self._has_superpower or self._tokens_to_poll or len(self._nearest_timeouts) != 1:
+            return None
+        timeout = self._nearest_timeouts[0]
+        return timeout._timer, timeout._deadline
+
+    def _get_nearest_timeouts(self) -> Sequence['TimeoutToken']:
+        return self._nearest_timeouts
+
+    def _register_parent(self, parent: 'AbstractToken') -> None:
+        if self._parents is None:
+            self._parents = []
+        parents = self._parents
+        parents.append(weakref.ref(parent, parents.remove))
+
+    def _get_parents(self) -> List['AbstractToken']:
+        if self._parents is None:
+            return []
+        result = []
+        for reference in list(self._parents):
+            parent = reference()
+            if parent is not None:
+                result.append(parent)
+        return result
+
+    def _announce_report(self, report: CancellationReport) -> None:
+        # All the listeners are called even if some of them fail, then the first error is raised.
+        errors: List[Exception] = []
+        self._notify_listeners(errors)
+        self._push_report_to_parents(report, errors)
+        if errors:
+            raise errors[0]
+
+    def _push_report_to_parents(self, report: CancellationReport, errors: List[Exception]) -> None:
+        # An explicit stack instead of recursion: chains of tokens can be deeper than the
+        # recursion limit. The ancestors are visited in the same order as by recursion.
+        stack = self._get_parents()
+        stack.reverse()
+        while stack:
+            parent = stack.pop()
+            if parent._cached_report is None:
+                parent._cached_report = report
+                parent._notify_listeners(errors)
+                grandparents = parent._get_parents()
+                grandparents.reverse()
+                stack.extend(grandparents)
+
+    def _add_listener(self, listener: Callable[[], Any]) -> None:
+        if self._listeners is None:
+            self._listeners = []
+        self._listeners.append(listener)
+
+    def _remove_listener(self, listener: Callable[[], Any]) -> None:
+        self._listeners.remove(listener)  # type: ignore[union-attr]
+
+    def _notify_listeners(self, errors: List[Exception]) -> None:
+        if self._listeners is not None:
+            for listener in list(self._listeners):
+                try:
+                    listener()
+                except Exception as error:  # noqa: BLE001
+                    errors.append(error)
+
+    def _get_polling_interval(self, step: Union[int, float]) -> Optional[Union[int, float]]:
+        result = self.remaining()
+
+        if self._needs_polling_by_step() and (result is None or step < result):
+            return step
+
+        return result
+
+    def _get_tokens_to_poll(self) -> List['AbstractToken']:
+        return [*self._tokens_to_poll, *(token for _, _, token in self._timed_tokens)]
+
+    def _take_snapshot(self, now: float) -> SnapshotNode:
+        fabric, arguments, keyword_arguments = self._get_snapshot_fabric(now)
+        return fabric, arguments, keyword_arguments, tuple(token._take_snapshot(now) for token in self._tokens)
+
+    def _get_snapshot_fabric(self, now: float) -> Tuple[Callable[..., 'AbstractToken'], Tuple[Any, ...], Dict[str, Any]]:  # noqa: ARG002
+        return type(self), (), {'cancelled': self._cancelled}
+
     def _get_report(self, direct: bool = True) -> CancellationReport:
+        report = self._find_report(direct=direct)
+        if report is None:
+            return self._get_own_report(CancelCause.NOT_CANCELLED)
+        return report
+
+    def _find_report(self, direct: bool) -> Optional[CancellationReport]:
+        # The hot path of all the polling methods: returns None if the token is not
+        # cancelled, and never creates new objects for it.
         if self._cancelled:
-            return CancellationReport(
-                cause=CancelCause.CANCELLED,
-                from_token=self,
-            )
-        if self._check_superpower(direct):
-            return CancellationReport(
-                cause=CancelCause.SUPERPOWER,
-                from_token=self,
-            )
+            return self._get_own_report(CancelCause.CANCELLED)
+        if self._has_superpower and self._check_superpower(direct):
+            return self._get_superpower_report()
         if self._cached_report is not None:
             return self._cached_report
 
-        for token in self._tokens:
-            report = token._get_report(direct=False)
-            if report.cause != CancelCause.NOT_CANCELLED:
-                self._cached_report = report
-                return report
+        for timer, deadline, token in self._timed_tokens:
+            if timer() >= deadline:
+                # The clock is monotonic, so the nested token is cancelled for sure.
+                return self._take_nested_report(token._get_report(direct=False))
+
+        for token in self._tokens_to_poll:
+            report = token._find_report(direct=False)
+            if report is not None:
+                return self._take_nested_report(report)
 
-        return CancellationReport(
-            cause=CancelCause.NOT_CANCELLED,
-            from_token=self,
-        )
+        return None
+
+    def _peek_report(self) -> Optional[CancellationReport]:
+        # The same as _find_report(direct=False), but the superpowers of the whole tree
+        # are only peeked at. It is used by the threads that watch tokens on their own
+        # (such as the watcher of deadlines): they must not spend the attempts of counters.
+        if self._cancelled:
+            return self._get_own_report(CancelCause.CANCELLED)
+        if self._has_superpower and self._peek_superpower():
+            return self._get_superpower_report()
+        if self._cached_report is not None:
+            return self._cached_report
+
+        for timer, deadline, token in self._timed_tokens:
+            if timer() >= deadline:
+                return self._take_nested_report(token._get_report(direct=False))
+
+        for token in self._tokens_to_poll:
+            report = token._peek_report()
+            if report is not None:
+                return self._take_nested_report(report)
+
+        return None
+
+    def _get_superpower_report(self) -> CancellationReport:
+        reports = self._own_reports
+        report = None if reports is None else reports.get(CancelCause.SUPERPOWER)
+        if report is None:
+            # The superpower has worked for the first time: unlike manual cancellation,
+            # it can be found out only here.
+            report = self._get_own_report(CancelCause.SUPERPOWER)
+            self._announce_report(report)
+        return report
+
+    def _take_nested_report(self, report: CancellationReport) -> CancellationReport:
+        # As a rule, the nested token has already pushed the report here. If not (it was
+        # cancelled before this token was created, for example), it is done now.
+        if self._cached_report is None:
+            self._cached_report = report
+            self._announce_report(report)
+        return report
+
+    def _get_own_report(self, cause: CancelCause) -> CancellationReport:
+        reports = self._own_reports
+        if reports is None:
+            reports = {}
+            self._own_reports = reports
+        report = reports.get(cause)
+        if report is None:
+            report = CancellationReport(
+                cause=cause,
+                from_token=self,
+            )
+            reports[cause] = report
+        return report
 
     @abstractmethod
     def _superpower(self) -> bool:  # pragma: no cover
@@ -312,9 +953,14 @@ class AbstractToken(ABC):
 
     def _check_superpower(self, direct: bool) -> bool:
         if self._rollback_if_nondirect_polling and not direct:
-            return self._check_superpower_with_rollback()
+            return self._peek_superpower()
         return self._superpower()
 
+    def _peek_superpower(self) -> bool:
+        # Finds out whether the superpower would work, without its side effects. Tokens
+        # that can answer it without changing their state should override this method.
+        return self._check_superpower_with_rollback()
+
     def _check_superpower_with_rollback(self) -> bool:
         with self._lock:
             superpower_data = self._get_superpower_data()
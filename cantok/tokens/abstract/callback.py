@@ -0,0 +1,51 @@
+from contextlib import suppress
+from threading import Lock
+from typing import Any, Callable, Optional
+
+
+class CancellationCallback:
+    """
+    A callback registered with AbstractToken.on_cancel().
+
+    It is called at most once, no matter how many threads notice the cancellation
+    at the same time. Call unregister() if the callback is no longer needed.
+    """
+
+    __slots__ = ('_callback', '_lock', '_token')
+
+    def __init__(self, token: 'AbstractToken', callback: Callable[[], Any]) -> None:  # type: ignore[name-defined]
+        self._token = token
+        self._callback: Optional[Callable[[], Any]] = callback
+        self._lock = Lock()
+
+    def __call__(self) -> None:
+        callback = self._take_callback()
+        if callback is not None:
+            self._remove_from_token()
+            callback()
+
+    @property
+    def active(self) -> bool:
+        """
+        Whether the callback is still waiting for the cancellation.
+        """
+        return self._callback is not None
+
+    def unregister(self) -> bool:
+        """
+        Unregisters the callback. Returns True if it will not be called because of
+        this, and False if it has already been called (or unregistered) before.
+        """
+        callback = self._take_callback()
+        self._remove_from_token()
+        return callback is not None
+
+    def _take_callback(self) -> Optional[Callable[[], Any]]:
+        with self._lock:
+            callback = self._callback
+            self._callback = None
+            return callback
+
+    def _remove_from_token(self) -> None:
+        with suppress(ValueError):
+            self._token._remove_listener(self)
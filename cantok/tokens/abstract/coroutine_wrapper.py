@@ -1,8 +1,11 @@
 import sys
 import weakref
+from asyncio import Future, get_running_loop
 from asyncio import sleep as async_sleep
+from asyncio import wait as async_wait_for_futures
 from collections.abc import Coroutine
-from time import sleep as sync_sleep
+from contextlib import suppress
+from threading import Event
 from types import TracebackType
 from typing import Any, Dict, Optional, Union
 
@@ -10,15 +13,16 @@ from displayhooks import not_display
 
 
 class WaitCoroutineWrapper(Coroutine):  # type: ignore[type-arg]
-    def __init__(self, step: Union[int, float], token_for_wait: 'AbstractToken', token_for_check: 'AbstractToken') -> None:  # type: ignore[name-defined]
+    def __init__(self, step: Union[int, float], token_for_wait: 'AbstractToken', token_for_check: 'AbstractToken', max_step: Optional[Union[int, float]] = None) -> None:  # type: ignore[name-defined]
         self.step = step
+        self.max_step = max_step
         self.token_for_wait = token_for_wait
         self.token_for_check = token_for_check
 
         self.flags: Dict[str, bool] = {}
-        self.coroutine = self.async_wait(step, self.flags, token_for_wait, token_for_check)
+        self.coroutine = self.async_wait(step, self.flags, token_for_wait, token_for_check, max_step)
 
-        weakref.finalize(self, self.sync_wait, step, self.flags, token_for_wait, token_for_check, self.coroutine)
+        weakref.finalize(self, self.sync_wait, step, self.flags, token_for_wait, token_for_check, self.coroutine, max_step)
 
     def __await__(self) -> Any:
         return self.coroutine.__await__()
@@ -33,7 +37,7 @@ class WaitCoroutineWrapper(Coroutine):  # type: ignore[type-arg]
         pass  # pragma: no cover
 
     @staticmethod
-    def sync_wait(step: Union[int, float], flags: Dict[str, bool], token_for_wait: 'AbstractToken', token_for_check: 'AbstractToken', wrapped_coroutine: Coroutine) -> None:  # type: ignore[type-arg, name-defined]
+    def sync_wait(step: Union[int, float], flags: Dict[str, bool], token_for_wait: 'AbstractToken', token_for_check: 'AbstractToken', wrapped_coroutine: Coroutine, max_step: Optional[Union[int, float]] = None) -> None:  # type: ignore[type-arg, name-defined]  # noqa: PLR0913, PLR0917
         if not flags.get('used', False):
             # In Python <=3.13, LOAD_FAST increments refcount, so getrefcount() returns
             # true_refs + 2; threshold < 5 means "fewer than 3 external refs" (i.e. only
@@ -47,21 +51,58 @@ class WaitCoroutineWrapper(Coroutine):  # type: ignore[type-arg]
             if sys.getrefcount(wrapped_coroutine) < _refcount_threshold:
                 wrapped_coroutine.close()
 
-                while token_for_wait:
-                    sync_sleep(step)
+                event = Event()
+                token_for_wait._add_listener(event.set)
+                try:
+                    current_step = step
+                    while token_for_wait:
+                        interval = token_for_wait._get_polling_interval(current_step)
+                        woken_up = event.wait(interval)
+                        current_step = WaitCoroutineWrapper.get_next_step(step, max_step, current_step, interval, woken_up)
+                finally:
+                    token_for_wait._remove_listener(event.set)
 
                 token_for_check.check()
 
     @staticmethod
-    async def async_wait(step: Union[int, float], flags: Dict[str, bool], token_for_wait: 'AbstractToken', token_for_check: 'AbstractToken') -> None:  # type: ignore[name-defined]
+    async def async_wait(step: Union[int, float], flags: Dict[str, bool], token_for_wait: 'AbstractToken', token_for_check: Optional['AbstractToken'], max_step: Optional[Union[int, float]] = None) -> None:  # type: ignore[name-defined]
         flags['used'] = True
 
-        while token_for_wait:  # noqa: ASYNC110
-            await async_sleep(step)
+        loop = get_running_loop()
+        future: Future = loop.create_future()  # type: ignore[type-arg]
+
+        def set_result() -> None:
+            if not future.done():
+                future.set_result(None)
+
+        def wake_up() -> None:
+            with suppress(RuntimeError):  # the event loop may already be closed
+                loop.call_soon_threadsafe(set_result)
+
+        token_for_wait._add_listener(wake_up)
+        try:
+            current_step = step
+            while token_for_wait:
+                interval = token_for_wait._get_polling_interval(current_step)
+                await async_wait_for_futures([future], timeout=interval)
+                current_step = WaitCoroutineWrapper.get_next_step(step, max_step, current_step, interval, future.done())
+        finally:
+            token_for_wait._remove_listener(wake_up)
 
         await async_sleep(0)
 
-        token_for_check.check()
+        if token_for_check is not None:
+            token_for_check.check()
+
+    @staticmethod
+    def get_next_step(step: Union[int, float], max_step: Optional[Union[int, float]], current_step: Union[int, float], interval: Optional[Union[int, float]], woken_up: bool) -> Union[int, float]:
+        # Without max_step, the step is fixed. Otherwise it doubles after every poll that
+        # has found nothing, up to max_step, and goes back to the initial value after
+        # any activity: a wake-up by a notification or a deadline that came before the
+        # end of the step.
+        if max_step is None or woken_up or interval != current_step:
+            return step
+        return min(current_step * 2, max_step)
 
 
 not_display(WaitCoroutineWrapper)
@@ -0,0 +1,81 @@
+import os
+import socket
+import weakref
+from threading import Lock
+from typing import Optional, Tuple
+
+from cantok.tokens.abstract.watcher import watcher
+
+# The descriptors of the tokens whose fileno() has been called.
+_descriptors: 'weakref.WeakKeyDictionary[AbstractToken, CancellationDescriptor]' = weakref.WeakKeyDictionary()  # type: ignore[name-defined]
+_lock = Lock()
+
+
+class CancellationDescriptor:
+    """
+    A file descriptor that becomes readable (and stays readable) when it is signalled.
+
+    It is an eventfd where it is available (Linux), and one end of a pair of connected
+    sockets otherwise: on Windows, select() accepts only sockets.
+    """
+
+    __slots__ = ('_closed', '_lock', '_read_fd', '_signalled', '_sockets')
+
+    _sockets: Optional[Tuple[socket.socket, socket.socket]]
+
+    def __init__(self) -> None:
+        # The lines using eventfd are excluded from the coverage, since they cannot run
+        # where there is no eventfd. The sockets are tested on all platforms.
+        self._sockets = None
+        if hasattr(os, 'eventfd'):
+            self._read_fd = os.eventfd(0, os.EFD_CLOEXEC)  # pragma: no cover
+        else:
+            self._sockets = socket.socketpair()
+            self._read_fd = self._sockets[0].fileno()
+        self._lock = Lock()
+        self._signalled = False
+        self._closed = False
+
+    def fileno(self) -> int:
+        return self._read_fd
+
+    def signal(self) -> None:
+        with self._lock:
+            if self._signalled or self._closed:
+                return
+            self._signalled = True
+            if self._sockets is None:
+                os.eventfd_write(self._read_fd, 1)  # pragma: no cover
+            else:
+                self._sockets[1].send(b'\0')
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self._sockets is None:
+                os.close(self._read_fd)  # pragma: no cover
+            else:
+                for item in self._sockets:
+                    item.close()
+
+
+def get_descriptor(token: 'AbstractToken') -> CancellationDescriptor:  # type: ignore[name-defined]
+    with _lock:
+        descriptor: Optional[CancellationDescriptor] = _descriptors.get(token)
+        if descriptor is not None:
+            return descriptor
+
+        descriptor = CancellationDescriptor()
+        _descriptors[token] = descriptor
+        weakref.finalize(token, descriptor.close)
+        token._add_listener(descriptor.signal)
+
+        if token._peek_report() is not None:
+            descriptor.signal()
+        else:
+            # Timeouts and conditions are not pushed: someone has to check the token.
+            watcher.watch(token, poll=True)
+
+        return descriptor
@@ -0,0 +1,72 @@
+from time import perf_counter
+from typing import Union
+
+
+class PollGate:
+    """
+    A cheap replacement for checking a token in a loop, created by AbstractToken.gate().
+
+    Use it instead of the token (``while gate:`` or ``gate.check()``). It really checks
+    the token only once per several iterations, and measures how long they take to
+    check it about every max_latency seconds, whatever the cost of an iteration is.
+    Between real checks, it only decrements a counter.
+
+    A gate is meant for a single loop in a single thread. Once a real check has found
+    the token cancelled, the gate checks the token on every iteration.
+    """
+
+    __slots__ = ('_batch', '_countdown', '_last_check_time', '_max_latency', '_token')
+
+    def __init__(self, token: 'AbstractToken', max_latency: Union[int, float]) -> None:  # type: ignore[name-defined]
+        self._token = token
+        self._max_latency = max_latency
+        self._batch = 1
+        self._countdown = 1
+        self._last_check_time = perf_counter()
+
+    def __bool__(self) -> bool:
+        countdown = self._countdown - 1
+        if countdown > 0:
+            self._countdown = countdown
+            return True
+
+        self._start_batch()
+        if self._token.keep_on():
+            return True
+        self._countdown = 0
+        return False
+
+    def check(self) -> None:
+        """
+        The same as check() of the token, but the token is really checked only
+        at the end of each batch of iterations.
+        """
+        countdown = self._countdown - 1
+        if countdown > 0:
+            self._countdown = countdown
+            return
+
+        self._start_batch()
+        try:
+            self._token.check()
+        except BaseException:
+            self._countdown = 0
+            raise
+
+    def _start_batch(self) -> None:
+        # The size of the next batch is chosen so that it takes about max_latency
+        # seconds at the speed of the previous one. It grows at most twice at a time,
+        # so that a few fast iterations do not make it too large.
+        now = perf_counter()
+        elapsed = now - self._last_check_time
+        batch = self._batch
+
+        if elapsed > 0:
+            new_batch = min(int(batch * self._max_latency / elapsed), batch * 2)
+        else:
+            new_batch = batch * 2
+
+        batch = max(new_batch, 1)
+        self._batch = batch
+        self._countdown = batch
+        self._last_check_time = now
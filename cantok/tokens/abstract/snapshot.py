@@ -0,0 +1,57 @@
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# A description of a token: a function that creates an equivalent token, its
+# positional and keyword arguments, and the descriptions of the nested tokens.
+SnapshotNode = Tuple[Callable[..., 'AbstractToken'], Tuple[Any, ...], Dict[str, Any], Tuple[Any, ...]]  # type: ignore[name-defined]
+
+
+class TokenSnapshot:
+    """
+    A picklable description of a token tree, created by AbstractToken.snapshot().
+
+    Pass it to another process and call restore() there to get an equivalent token.
+    Deadlines are stored as absolute wall-clock time, and counters as the number of
+    the remaining attempts.
+
+    The snapshot also contains a channel: a SharedToken that is cancelled when the
+    original token or any restored token is cancelled. Call close() when the snapshot
+    is no longer needed, so that the original token forgets about the channel.
+    """
+
+    __slots__ = ('_channel', '_handle', '_tree')
+
+    def __init__(self, tree: SnapshotNode, channel: 'SharedToken', handle: Optional['CancellationCallback'] = None) -> None:  # type: ignore[name-defined]
+        self._tree = tree
+        self._channel = channel
+        self._handle = handle
+
+    def __reduce__(self) -> Tuple[Callable[..., 'TokenSnapshot'], Tuple[Any, ...]]:
+        return TokenSnapshot, (self._tree, self._channel)
+
+    @property
+    def channel(self) -> 'SharedToken':  # type: ignore[name-defined]
+        """
+        The SharedToken linking the original token with all the restored ones.
+        """
+        return self._channel
+
+    def restore(self) -> 'AbstractToken':  # type: ignore[name-defined]
+        """
+        Creates a new token equivalent to the original one.
+        """
+        token = self._restore_node(self._tree)
+        token._embed_tokens([self._channel])
+        token.on_cancel(self._channel.cancel)
+        return token
+
+    def close(self) -> None:
+        """
+        Unlinks the original token from the channel. Does nothing in other processes.
+        """
+        if self._handle is not None:
+            self._handle.unregister()
+
+    def _restore_node(self, node: SnapshotNode) -> 'AbstractToken':  # type: ignore[name-defined]
+        fabric, arguments, keyword_arguments, nested_nodes = node
+        nested_tokens = [self._restore_node(nested_node) for nested_node in nested_nodes]
+        return fabric(*arguments, *nested_tokens, **keyword_arguments)
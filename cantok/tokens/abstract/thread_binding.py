@@ -0,0 +1,54 @@
+import ctypes
+from threading import Event, Thread
+from typing import Type, Union
+
+from cantok.errors import CancellationError
+from cantok.tokens.abstract.cancel_cause import CancelCause
+from cantok.tokens.abstract.report import CancellationReport
+
+# The end of the bound thread cannot be pushed to the watcher, so it is checked at
+# least this often, in seconds.
+THREAD_CHECK_INTERVAL = 0.01
+
+
+def watch_thread(token: 'AbstractToken', binding: 'AbstractToken', thread: Thread, step: Union[int, float]) -> None:  # type: ignore[name-defined]
+    # Runs in a separate daemon thread: waits until the token is cancelled, the binding
+    # is cancelled (unbound) or the thread is finished, the same way as wait() does.
+    # The token is only peeked at, so the watcher never spends the attempts of counters.
+    event = Event()
+    token._add_listener(event.set)
+    binding._add_listener(event.set)
+    try:
+        while binding.keep_on() and thread.is_alive() and token._peek_report() is None:
+            interval = token._get_polling_interval(step)
+            event.wait(THREAD_CHECK_INTERVAL if interval is None else min(interval, THREAD_CHECK_INTERVAL))
+    finally:
+        token._remove_listener(event.set)
+        binding._remove_listener(event.set)
+
+    report = token._peek_report()
+    if report is not None and binding.keep_on() and thread.is_alive():
+        raise_in_thread(thread, get_exception_type(report))
+
+
+def get_exception_type(report: CancellationReport) -> Type[CancellationError]:
+    # An exception is raised in another thread by its class, without arguments, so
+    # the class is wrapped into a subclass that fills them in.
+    token = report.from_token
+    if report.cause == CancelCause.CANCELLED:
+        base, message = CancellationError, 'The token has been cancelled.'
+    else:
+        base, message = token.exception, token._get_superpower_exception_message()
+
+    def __init__(self: CancellationError) -> None:  # noqa: N807
+        base.__init__(self, message, token)
+
+    return type(base.__name__, (base,), {'__init__': __init__, '__module__': base.__module__})
+
+
+def raise_in_thread(thread: Thread, exception_type: Type[BaseException]) -> None:
+    thread_id = ctypes.c_ulong(thread.ident)  # type: ignore[arg-type]
+    modified = ctypes.pythonapi.PyThreadState_SetAsyncExc(thread_id, ctypes.py_object(exception_type))
+    if modified > 1:  # pragma: no cover
+        # It must never happen, but if it does, the exception is revoked.
+        ctypes.pythonapi.PyThreadState_SetAsyncExc(thread_id, None)
@@ -0,0 +1,155 @@
+import os
+import sys
+import weakref
+from heapq import heappop, heappush
+from itertools import count
+from threading import Condition, Thread
+from time import perf_counter
+from typing import List, Optional, Tuple
+
+# Polling intervals of the tokens that have to be polled: the watcher starts with the
+# first one after a token is added, and doubles it after every poll up to the second one.
+WATCHER_STEP = 0.0001
+WATCHER_MAX_STEP = 0.01
+
+
+class Watcher:
+    """
+    A daemon thread that finds out the automatic cancellation of tokens nobody polls.
+
+    The tokens are kept in a heap by their nearest deadlines and are checked only when
+    the deadlines come, so a single thread serves any number of tokens. The tokens
+    whose conditions can be found out only by calling them can also be polled, all
+    together, with a backoff. The watcher stores only weak references: it never keeps
+    a token alive. The thread is started when the first token is added and ends when
+    there are no tokens left.
+    """
+
+    __slots__ = ('_condition', '_counter', '_deadlines', '_next_poll_time', '_scheduled', '_step', '_thread', '_tokens_to_poll')
+
+    _deadlines: List[Tuple[float, int, 'weakref.ref[AbstractToken]']]  # type: ignore[name-defined]
+    _scheduled: 'weakref.WeakKeyDictionary[AbstractToken, float]'  # type: ignore[name-defined]
+    _tokens_to_poll: 'weakref.WeakKeyDictionary[AbstractToken, None]'  # type: ignore[name-defined]
+    _thread: Optional[Thread]
+
+    def __init__(self) -> None:
+        self._reset()
+
+    def watch(self, token: 'AbstractToken', poll: bool = False) -> None:  # type: ignore[name-defined]
+        """
+        Checks the token at its nearest deadline, and again at the next one if it is
+        not cancelled then. If poll is True, the token is also polled until it is
+        cancelled, if it contains anything that has to be polled (such as
+        ConditionToken). Does nothing if the token can be cancelled neither way.
+        """
+        deadline = token.deadline
+        poll = poll and token._needs_polling_by_step()
+        if deadline is None and not poll:
+            return
+
+        with self._condition:
+            if poll and token not in self._tokens_to_poll:
+                self._tokens_to_poll[token] = None
+                self._step = WATCHER_STEP
+                self._next_poll_time = perf_counter() + WATCHER_STEP
+
+            scheduled = self._scheduled.get(token)
+            if deadline is not None and (scheduled is None or deadline < scheduled):
+                self._scheduled[token] = deadline
+                heappush(self._deadlines, (deadline, next(self._counter), weakref.ref(token)))
+
+            if self._thread is None:
+                self._thread = Thread(target=self._run, daemon=True)
+                self._thread.start()
+            else:
+                self._condition.notify()
+
+    def _reset(self) -> None:
+        # Also called in a child process after fork(), where the thread no longer exists.
+        self._condition = Condition()
+        self._deadlines = []
+        self._scheduled = weakref.WeakKeyDictionary()
+        self._tokens_to_poll = weakref.WeakKeyDictionary()
+        self._step = WATCHER_STEP
+        self._next_poll_time = 0.0
+        self._counter = count()
+        self._thread = None
+
+    def _run(self) -> None:
+        # Each step is a separate call, so that no references to the tokens are left
+        # in the loop while the thread sleeps.
+        while self._step_once():
+            pass
+
+    def _step_once(self) -> bool:
+        with self._condition:
+            if not self._deadlines and not self._tokens_to_poll:
+                self._thread = None
+                return False
+            now = perf_counter()
+            due_tokens = self._pop_due_tokens(now)
+            tokens_to_poll = self._take_tokens_to_poll(now)
+            if not due_tokens and not tokens_to_poll:
+                self._condition.wait(self._get_timeout(now))
+                return True
+
+        # The tokens are checked without the lock: their callbacks may add new tokens.
+        for token in due_tokens:
+            if not self._check(token):
+                # The deadline is measured by another clock, or the token has got new
+                # timeouts since it was scheduled.
+                self.watch(token)
+
+        for token in tokens_to_poll:
+            if self._check(token):
+                with self._condition:
+                    self._tokens_to_poll.pop(token, None)
+
+        return True
+
+    def _pop_due_tokens(self, now: float) -> List['AbstractToken']:  # type: ignore[name-defined]
+        result = []
+        deadlines = self._deadlines
+
+        while deadlines and deadlines[0][0] <= now:
+            deadline, _, reference = heappop(deadlines)
+            token = reference()
+            # The token may have been scheduled again for an earlier deadline.
+            if token is not None and self._scheduled.get(token) == deadline:
+                del self._scheduled[token]
+                result.append(token)
+
+        return result
+
+    def _take_tokens_to_poll(self, now: float) -> List['AbstractToken']:  # type: ignore[name-defined]
+        if not self._tokens_to_poll or now < self._next_poll_time:
+            return []
+
+        self._step = min(self._step * 2, WATCHER_MAX_STEP)
+        self._next_poll_time = now + self._step
+        return list(self._tokens_to_poll)
+
+    def _get_timeout(self, now: float) -> float:
+        timeouts = []
+        if self._deadlines:
+            timeouts.append(self._deadlines[0][0] - now)
+        if self._tokens_to_poll:
+            timeouts.append(self._next_poll_time - now)
+        # The last tokens may have just been garbage-collected: the loop ends then.
+        return min(timeouts, default=0.0)
+
+    def _check(self, token: 'AbstractToken') -> bool:  # type: ignore[name-defined]
+        # Returns True if the token is cancelled.
+        try:
+            return token._peek_report() is not None
+        except Exception:  # noqa: BLE001
+            # A callback of the token has failed: nobody else can get the error. The
+            # callbacks are called when the token is cancelled.
+            sys.excepthook(*sys.exc_info())
+            return True
+
+
+watcher = Watcher()
+
+if hasattr(os, 'register_at_fork'):  # pragma: no branch
+    os.register_at_fork(after_in_child=watcher._reset)
@@ -0,0 +1,88 @@
+from typing import Any, Callable, Dict, Tuple, Union
+
+from cantok import AbstractToken
+from cantok.errors import BudgetCancellationError
+from cantok.tokens.abstract.cancel_cause import CancelCause
+
+
+class BudgetToken(AbstractToken):
+    """
+    A token that cancels automatically when a numeric budget is spent.
+
+    Unlike CounterToken, checking the token does not spend anything: the budget is
+    spent only by consume(), for example by the number of bytes read or rows
+    processed. The token is cancelled as soon as consume() spends the last of the
+    budget, and the cancellation is pushed to the parent tokens and waiters at once.
+
+    :param budget: The amount that can be consumed. Must be >= 0.
+
+    >>> token = BudgetToken(1024)
+    >>> token.consume(1000)
+    >>> token.cancelled
+    False
+    >>> token.consume(100)
+    >>> token.cancelled
+    True
+    """
+
+    __slots__ = (
+        '_budget',
+        '_initial_budget',
+    )
+
+    exception = BudgetCancellationError
+    _has_superpower = False
+    _stateless_superpower = True
+
+    def __init__(self, budget: Union[int, float], *tokens: AbstractToken, cancelled: bool = False) -> None:
+        if budget < 0:
+            raise ValueError('The budget must be greater than or equal to zero.')
+
+        self._initial_budget = budget
+        self._budget = budget
+
+        super().__init__(*tokens, cancelled=cancelled)
+
+        if not budget:
+            self._cached_report = self._get_own_report(CancelCause.SUPERPOWER)
+
+    @property
+    def budget(self) -> Union[int, float]:
+        """
+        The amount that can still be consumed. Can be negative if more than the
+        budget has been consumed.
+        """
+        return self._budget
+
+    def consume(self, amount: Union[int, float] = 1) -> None:
+        """
+        Spends the amount from the budget. Cancels the token if the budget is spent.
+
+        Thread-safe: the budget is changed under the lock of the token.
+
+        :param amount: The amount to spend. Must be >= 0. Defaults to 1.
+        """
+        if amount < 0:
+            raise ValueError('The amount to consume must be greater than or equal to zero.')
+
+        with self._lock:
+            budget = self._budget - amount
+            self._budget = budget
+            if budget > 0 or self._cached_report is not None:
+                return
+            report = self._get_own_report(CancelCause.SUPERPOWER)
+            self._cached_report = report
+
+        self._announce_report(report)
+
+    def _superpower(self) -> bool:
+        return False  # pragma: no cover
+
+    def _text_representation_of_superpower(self) -> str:
+        return str(self._budget)
+
+    def _get_snapshot_fabric(self, now: float) -> Tuple[Callable[..., AbstractToken], Tuple[Any, ...], Dict[str, Any]]:  # noqa: ARG002
+        return BudgetToken, (max(self._budget, 0),), {'cancelled': self._cancelled}
+
+    def _get_superpower_exception_message(self) -> str:
+        return f'The budget of {self._initial_budget} has been spent.'
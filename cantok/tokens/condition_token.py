@@ -1,10 +1,15 @@
-from contextlib import suppress
-from typing import Any, Callable, Dict
+from threading import Event
+from time import monotonic
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 from cantok import AbstractToken
 from cantok.errors import ConditionCancellationError
 
 
+def _do_nothing() -> None:
+    pass
+
+
 class ConditionToken(AbstractToken):
     """
     A token that cancels automatically when a condition function returns True.
@@ -21,6 +26,16 @@ class ConditionToken(AbstractToken):
     :param after: Callable invoked after the condition function on each check.
     :param caching: If True (default), the token stays cancelled once the
                     condition has returned True, without re-evaluating it.
+    :param trigger: An event that enables the triggered mode. In this mode, the
+                    condition is evaluated on the first check, and then only after
+                    the event is set (the event is cleared then) or recheck() is
+                    called. The result of the last evaluation is used in between.
+                    Defaults to None (the condition is evaluated on every check).
+    :param min_interval: The minimum time between evaluations of the condition, in
+                         seconds. A negative result is reused until this time has
+                         passed. Combined with trigger, the condition is evaluated
+                         when the event is set or when this time has passed.
+                         Defaults to None (no limit).
 
     >>> items = []
     >>> token = ConditionToken(lambda: len(items) >= 3)
@@ -31,9 +46,23 @@ class ConditionToken(AbstractToken):
     True
     """
 
+    __slots__ = (
+        '_after',
+        '_before',
+        '_cache',
+        '_caching',
+        '_default',
+        '_function',
+        '_suppress_exceptions',
+        '_was_cancelled_by_condition',
+    )
+
     exception = ConditionCancellationError
 
-    def __init__(self, function: Callable[[], bool], *tokens: AbstractToken, cancelled: bool = False, suppress_exceptions: bool = True, default: bool = False, before: Callable[[], Any] = lambda: None, after: Callable[[], Any] = lambda: None, caching: bool = True):  # noqa: PLR0913
+    def __init__(self, function: Callable[[], bool], *tokens: AbstractToken, cancelled: bool = False, suppress_exceptions: bool = True, default: bool = False, before: Callable[[], Any] = _do_nothing, after: Callable[[], Any] = _do_nothing, caching: bool = True, trigger: Optional[Event] = None, min_interval: Optional[Union[int, float]] = None):  # noqa: PLR0913
+        if min_interval is not None and min_interval < 0:
+            raise ValueError('You cannot specify a minimum interval less than zero.')
+
         super().__init__(*tokens, cancelled=cancelled)
 
         self._function = function
@@ -42,12 +71,42 @@ class ConditionToken(AbstractToken):
         self._suppress_exceptions = suppress_exceptions
         self._default = default
         self._caching = caching
+        self._cache = None if trigger is None and min_interval is None else _ResultCache(trigger, min_interval)
         self._was_cancelled_by_condition = False
 
+    def recheck(self) -> bool:
+        """
+        Evaluates the condition right now, even in the triggered mode or before
+        min_interval has passed, and returns whether the token is cancelled.
+
+        If the condition is satisfied, the cancellation is announced at once: waiters
+        wake up and callbacks are called without waiting for the next poll.
+
+        >>> items = []
+        >>> token = ConditionToken(lambda: len(items) >= 3, trigger=Event())
+        >>> items += [1, 2, 3]
+        >>> token.recheck()
+        True
+        """
+        if self._cache is not None:
+            self._cache.result = None
+        return self._find_report(direct=False) is not None
+
     def _superpower(self) -> bool:
         if self._was_cancelled_by_condition and self._caching:
             return True
 
+        cache = self._cache
+        if cache is not None:
+            result = cache.get()
+            if result is None:
+                result = self._evaluate_condition()
+                cache.put(result)
+            return result
+
+        return self._evaluate_condition()
+
+    def _evaluate_condition(self) -> bool:
         if not self._suppress_exceptions:
             self._before()
             result = self._run_function()
@@ -56,12 +115,20 @@ class ConditionToken(AbstractToken):
 
         result = self._default
 
-        with suppress(Exception):
+        # try/except instead of contextlib.suppress(), because this is the hot path
+        # of polling and suppress() creates a new object on each call.
+        try:
             self._before()
-        with suppress(Exception):
+        except Exception:  # noqa: BLE001
+            pass
+        try:
             result = self._run_function()
-        with suppress(Exception):
+        except Exception:  # noqa: BLE001
+            pass
+        try:
             self._after()
+        except Exception:  # noqa: BLE001
+            pass
 
         return result
 
@@ -78,6 +145,12 @@ class ConditionToken(AbstractToken):
 
         return result
 
+    def _get_snapshot_fabric(self, now: float) -> Tuple[Callable[..., AbstractToken], Tuple[Any, ...], Dict[str, Any]]:  # noqa: ARG002
+        from cantok import SimpleToken  # noqa: PLC0415
+
+        # The function cannot be moved to another process, only its current result.
+        return SimpleToken, (), {'cancelled': self.is_cancelled(direct=False)}
+
     def _text_representation_of_superpower(self) -> str:
         if hasattr(self._function, '__name__'):
             result = self._function.__name__
@@ -102,3 +175,30 @@ class ConditionToken(AbstractToken):
 
     def _get_superpower_exception_message(self) -> str:
         return 'The cancellation condition was satisfied.'
+
+
+class _ResultCache:
+    __slots__ = ('expires_at', 'min_interval', 'result', 'trigger')
+
+    def __init__(self, trigger: Optional[Event], min_interval: Optional[Union[int, float]]) -> None:
+        self.trigger = trigger
+        self.min_interval = min_interval
+        self.result: Optional[bool] = None
+        self.expires_at = 0.0
+
+    def get(self) -> Optional[bool]:
+        trigger = self.trigger
+        if trigger is not None and trigger.is_set():
+            # The trigger is cleared before the evaluation, so that a trigger fired during
+            # it leads to one more evaluation.
+            trigger.clear()
+            return None
+        if self.min_interval is not None and monotonic() >= self.expires_at:
+            return None
+        return self.result
+
+    def put(self, result: bool) -> None:
+        self.result = result
+        if self.min_interval is not None:
+            # Only negative results are reused: a positive one usually cancels the token.
+            self.expires_at = 0.0 if result else monotonic() + self.min_interval
@@ -1,7 +1,9 @@
-from typing import Any, Dict
+from threading import local
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from cantok import AbstractToken, ConditionToken
 from cantok.errors import CounterCancellationError
+from cantok.tokens.condition_token import _do_nothing
 
 
 class CounterToken(ConditionToken):
@@ -17,55 +19,107 @@ class CounterToken(ConditionToken):
                    indirectly through a parent token. If True (default),
                    indirect polls are rolled back, so only direct checks
                    consume the counter.
+    :param chunk_size: If greater than 1 (the default is 1), each thread takes
+                       iterations from the counter in chunks of this size and
+                       spends them without locking. The total number of iterations
+                       never exceeds the counter, but the token can be cancelled
+                       while other threads still have unspent iterations, which
+                       are lost then.
 
     >>> token = CounterToken(3)
     >>> while token:
     ...     ...  # loop body executes exactly 3 times
     """
 
+    __slots__ = (
+        '_chunk_size',
+        '_chunks',
+        '_counter',
+        '_direct',
+        '_initial_counter',
+    )
+
     exception = CounterCancellationError
 
-    def __init__(self, counter: int, *tokens: AbstractToken, cancelled: bool = False, direct: bool = True):
+    def __init__(self, counter: int, *tokens: AbstractToken, cancelled: bool = False, direct: bool = True, chunk_size: int = 1):
         if counter < 0:
             raise ValueError('The counter must be greater than or equal to zero.')
+        if chunk_size < 1:
+            raise ValueError('The chunk size must be greater than zero.')
 
         self._initial_counter = counter
+        self._counter = counter
         self._direct = direct
-        self._rollback_if_nondirect_polling = self._direct
-
-        counter_bag = {'counter': counter}
-        self._counter_bag = counter_bag
-
-        def function() -> bool:
-            with counter_bag['lock']:  # type: ignore[attr-defined]
-                if not counter_bag['counter']:
-                    return True
-                counter_bag['counter'] -= 1
-                return False
-
-        super().__init__(function, *tokens, cancelled=cancelled)
+        self._chunk_size = chunk_size
+        # The iterations taken by each thread and not spent yet.
+        self._chunks: Optional[local] = local() if chunk_size > 1 else None
 
-        self._counter_bag['lock'] = self._lock  # type: ignore[assignment]
+        # The condition is implemented by the _superpower() method itself.
+        super().__init__(_do_nothing, *tokens, cancelled=cancelled)  # type: ignore[arg-type]
 
     @property
     def counter(self) -> int:
-        return self._counter_bag['counter']
+        """
+        The number of the remaining iterations. With chunk_size, the iterations taken
+        by threads and not spent yet are not counted.
+        """
+        return self._counter
+
+    @property
+    def _rollback_if_nondirect_polling(self) -> bool:  # type: ignore[override]
+        return self._direct
 
-    def _superpower_rollback(self, superpower_data: Dict[str, Any]) -> None:
-        self._counter_bag['counter'] = superpower_data['counter']
+    @property
+    def _stateless_superpower(self) -> bool:  # type: ignore[override]
+        # With chunks, _superpower() takes the lock by itself and only to take a new
+        # chunk, so check() must not serialize the threads on it.
+        return self._chunks is not None
+
+    def _superpower(self) -> bool:
+        chunks = self._chunks
+        if chunks is not None:
+            chunk = getattr(chunks, 'remaining', 0)
+            if not chunk:
+                chunk = self._take_chunk()
+                if not chunk:
+                    return True
+            chunks.remaining = chunk - 1
+            return False
+
+        with self._lock:
+            if not self._counter:
+                return True
+            self._counter -= 1
+            return False
+
+    def _take_chunk(self) -> int:
+        with self._lock:
+            chunk = min(self._chunk_size, self._counter)
+            self._counter -= chunk
+            return chunk
+
+    def _peek_superpower(self) -> bool:
+        # A pure read: indirect polling must not spend the iterations.
+        if self._counter:
+            return False
+        return self._chunks is None or not getattr(self._chunks, 'remaining', 0)
 
     def _text_representation_of_superpower(self) -> str:
-        return str(self._counter_bag['counter'])
+        return str(self._counter)
 
     def _get_extra_kwargs(self) -> Dict[str, Any]:
+        result: Dict[str, Any] = {}
+
         if not self._direct:
-            return {
-                'direct': self._direct,
-            }
-        return {}
+            result['direct'] = self._direct
+
+        if self._chunk_size != 1:
+            result['chunk_size'] = self._chunk_size
+
+        return result
 
-    def _get_superpower_data(self) -> Dict[str, Any]:
-        return {'counter': self.counter}
+    def _get_snapshot_fabric(self, now: float) -> Tuple[Callable[..., AbstractToken], Tuple[Any, ...], Dict[str, Any]]:  # noqa: ARG002
+        return CounterToken, (self._counter,), {'cancelled': self._cancelled, 'direct': self._direct, 'chunk_size': self._chunk_size}
 
     def _get_superpower_exception_message(self) -> str:
         return f'After {self._initial_counter} attempts, the counter was reset to zero.'
@@ -1,5 +1,8 @@
+from typing import Any, Callable, Dict, Tuple
+
 from cantok import AbstractToken
 from cantok.errors import ImpossibleCancelError
+from cantok.tokens.abstract.callback import CancellationCallback
 
 
 class DefaultToken(AbstractToken):
@@ -18,7 +21,11 @@ class DefaultToken(AbstractToken):
     True
     """
 
+    __slots__ = ()
+
     exception = ImpossibleCancelError
+    _has_superpower = False
+    _stateless_superpower = True
 
     def __init__(self) -> None:
         super().__init__()
@@ -41,8 +48,27 @@ class DefaultToken(AbstractToken):
     def cancel(self) -> 'AbstractToken':  # type: ignore[return]
         self._raise_superpower_exception()
 
+    def on_cancel(self, callback: Callable[[], Any]) -> CancellationCallback:
+        # The token is never cancelled, so the function is not even registered: one
+        # default token is usually shared by all the calls of a function.
+        handle = CancellationCallback(self, callback)
+        handle.unregister()
+        return handle
+
+    def _add_listener(self, listener: Callable[[], Any]) -> None:
+        pass
+
+    def _remove_listener(self, listener: Callable[[], Any]) -> None:
+        pass
+
+    def _get_snapshot_fabric(self, now: float) -> Tuple[Callable[..., AbstractToken], Tuple[Any, ...], Dict[str, Any]]:  # noqa: ARG002
+        from cantok import SimpleToken  # noqa: PLC0415
+
+        # A token that can never be cancelled could not be linked with the channel.
+        return SimpleToken, (), {}
+
     def _superpower(self) -> bool:
-        return False
+        return False  # pragma: no cover
 
     def _text_representation_of_superpower(self) -> str:
         return ''
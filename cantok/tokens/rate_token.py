@@ -0,0 +1,93 @@
+from array import array
+from time import perf_counter
+from typing import Any, Callable, Dict, Tuple, Union
+
+from cantok import AbstractToken
+from cantok.errors import RateCancellationError
+from cantok.tokens.abstract.cancel_cause import CancelCause
+
+
+class RateToken(AbstractToken):
+    """
+    A token that cancels automatically when events happen too often.
+
+    Events are recorded by calling hit(). The token is cancelled as soon as more
+    than limit events have been recorded within any window of the given length,
+    and stays cancelled after that. The times of the last limit events are kept in
+    a ring buffer, so both hit() and checks take constant time and allocate nothing.
+
+    :param limit: The maximum number of events within the window. Must be >= 0.
+    :param window: The length of the window, in seconds. Must be > 0.
+
+    >>> token = RateToken(2, 1)
+    >>> token.hit()
+    >>> token.hit()
+    >>> token.cancelled
+    False
+    >>> token.hit()
+    >>> token.cancelled
+    True
+    """
+
+    __slots__ = (
+        '_hits',
+        '_index',
+        '_limit',
+        '_window',
+    )
+
+    exception = RateCancellationError
+    _has_superpower = False
+    _stateless_superpower = True
+
+    def __init__(self, limit: int, window: Union[int, float], *tokens: AbstractToken, cancelled: bool = False) -> None:
+        if limit < 0:
+            raise ValueError('The limit must be greater than or equal to zero.')
+        if window <= 0:
+            raise ValueError('The window must be greater than zero.')
+
+        self._limit = limit
+        self._window = window
+        # The times of the last limit events; the oldest one is at the index.
+        self._hits = array('d', [float('-inf')]) * limit
+        self._index = 0
+
+        super().__init__(*tokens, cancelled=cancelled)
+
+    def hit(self) -> None:
+        """
+        Records an event. Cancels the token if the limit is exceeded.
+
+        Thread-safe: the events are recorded under the lock of the token.
+        """
+        now = perf_counter()
+
+        with self._lock:
+            if self._limit:
+                index = self._index
+                exceeded = now - self._hits[index] < self._window
+                self._hits[index] = now
+                self._index = (index + 1) % self._limit
+            else:
+                exceeded = True
+
+            if not exceeded or self._cached_report is not None:
+                return
+            report = self._get_own_report(CancelCause.SUPERPOWER)
+            self._cached_report = report
+
+        self._announce_report(report)
+
+    def _superpower(self) -> bool:
+        return False  # pragma: no cover
+
+    def _text_representation_of_superpower(self) -> str:
+        return f'{self._limit}, {self._window}'
+
+    def _get_snapshot_fabric(self, now: float) -> Tuple[Callable[..., AbstractToken], Tuple[Any, ...], Dict[str, Any]]:  # noqa: ARG002
+        # The times of the events are not moved, only the fact that the limit has been exceeded.
+        exceeded = self._own_reports is not None and CancelCause.SUPERPOWER in self._own_reports
+        return RateToken, (self._limit, self._window), {'cancelled': self._cancelled or exceeded}
+
+    def _get_superpower_exception_message(self) -> str:
+        return f'The limit of {self._limit} events per {self._window} seconds has been exceeded.'
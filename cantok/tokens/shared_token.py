@@ -0,0 +1,129 @@
+import sys
+import weakref
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from cantok import AbstractToken
+from cantok.errors import CancellationError
+from cantok.tokens.abstract.cancel_cause import CancelCause
+from cantok.tokens.abstract.report import CancellationReport
+
+
+class SharedToken(AbstractToken):
+    """
+    A token that can be passed to other processes.
+
+    Its cancellation flag lives in a segment of shared memory, so cancelling the token
+    in any process is seen by all of them, and checking it is a single memory read,
+    without any interprocess communication. The token is passed to other processes
+    by pickling, like any other argument of a process pool task. Only the flag itself
+    is shared, so a SharedToken with embedded tokens cannot be pickled.
+
+    The segment belongs to the process where the token was created, and is freed
+    when the token is destroyed there: it must live until the other processes have
+    received it.
+
+    >>> token = SharedToken()
+    >>> with ProcessPoolExecutor() as executor:
+    ...     future = executor.submit(some_function, token)
+    ...     token.cancel()  # some_function() sees it
+    """
+
+    __slots__ = (
+        '_buffer',
+        '_memory',
+        '_noticed',
+    )
+
+    exception = CancellationError
+    _has_superpower = False
+    _stateless_superpower = True
+
+    def __init__(self, *tokens: AbstractToken, cancelled: bool = False) -> None:
+        memory = SharedMemory(create=True, size=1)
+        self._set_memory(memory)
+        weakref.finalize(self, _free_memory, memory)
+        super().__init__(*tokens, cancelled=cancelled)
+
+    def __reduce__(self) -> Tuple[Callable[..., 'SharedToken'], Tuple[Any, ...]]:
+        if self._tokens:
+            raise TypeError('Only the flag of a SharedToken is shared, so a SharedToken with embedded tokens cannot be passed to another process. Pass a snapshot of the token instead.')
+        return _attach_shared_token, (self._memory.name,)
+
+    @property
+    def _cancelled(self) -> bool:
+        return bool(self._buffer[0])
+
+    @_cancelled.setter
+    def _cancelled(self, new_value: bool) -> None:
+        # The flag is shared with other processes and can never be reset.
+        if new_value:
+            self._noticed = True
+            self._buffer[0] = 1
+
+    def _set_memory(self, memory: SharedMemory) -> None:
+        self._memory = memory
+        self._buffer: memoryview = memory.buf  # type: ignore[assignment]
+        self._noticed = False
+
+    def _find_report(self, direct: bool) -> Optional[CancellationReport]:
+        self._notice_cancellation()
+        return super()._find_report(direct)
+
+    def _peek_report(self) -> Optional[CancellationReport]:
+        self._notice_cancellation()
+        return super()._peek_report()
+
+    def _notice_cancellation(self) -> None:
+        if not self._noticed and self._buffer[0]:
+            # The token has been cancelled in another process: nobody here knows it yet.
+            self._noticed = True
+            self._announce_report(self._get_own_report(CancelCause.CANCELLED))
+
+    def _get_snapshot_fabric(self, now: float) -> Tuple[Callable[..., AbstractToken], Tuple[Any, ...], Dict[str, Any]]:  # noqa: ARG002
+        from cantok import SimpleToken  # noqa: PLC0415
+
+        # The token itself is moved to another process, and the tokens embedded into it
+        # are embedded into a new SimpleToken together with it.
+        return SimpleToken, (self,), {}
+
+    def _get_deadline(self) -> Optional[Tuple[Callable[[], Union[int, float]], Union[int, float]]]:
+        # The token can be cancelled in another process at any moment, not only by the
+        # timeouts nested in it.
+        return None
+
+    def _needs_polling(self) -> bool:
+        return True
+
+    def _needs_polling_by_step(self) -> bool:
+        return True
+
+    def _superpower(self) -> bool:
+        return False  # pragma: no cover
+
+    def _text_representation_of_superpower(self) -> str:
+        return ''
+
+    def _get_superpower_exception_message(self) -> str:
+        return 'The token has been cancelled.'  # pragma: no cover
+
+
+def _free_memory(memory: SharedMemory) -> None:
+    memory.close()
+    memory.unlink()
+
+
+def _attach_shared_token(name: str) -> SharedToken:
+    if sys.version_info >= (3, 13):  # pragma: no cover
+        memory = SharedMemory(name=name, track=False)  # type: ignore[call-arg, unused-ignore]
+    else:  # pragma: no cover
+        # Before Python 3.13, the segment is registered in the resource tracker again.
+        # It is harmless: processes started by multiprocessing share the tracker with
+        # the owner, and it is unregistered when the owner frees the segment.
+        memory = SharedMemory(name=name)
+
+    token = SharedToken.__new__(SharedToken)
+    token._set_memory(memory)
+    weakref.finalize(token, memory.close)
+    AbstractToken.__init__(token)
+    return token
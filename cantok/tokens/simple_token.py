@@ -15,10 +15,14 @@ class SimpleToken(AbstractToken):
     True
     """
 
+    __slots__ = ()
+
     exception = CancellationError
+    _has_superpower = False
+    _stateless_superpower = True
 
     def _superpower(self) -> bool:
-        return False
+        return False  # pragma: no cover
 
     def _text_representation_of_superpower(self) -> str:
         return ''
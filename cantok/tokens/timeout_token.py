@@ -1,8 +1,9 @@
-from time import monotonic_ns, perf_counter
-from typing import Any, Callable, Dict, Union
+from time import monotonic_ns, perf_counter, time
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
 
 from cantok import AbstractToken, ConditionToken
 from cantok.errors import TimeoutCancellationError
+from cantok.tokens.condition_token import _do_nothing
 
 
 class TimeoutToken(ConditionToken):
@@ -28,7 +29,15 @@ class TimeoutToken(ConditionToken):
     True
     """
 
+    __slots__ = (
+        '_deadline',
+        '_monotonic',
+        '_timeout',
+        '_timer',
+    )
+
     exception = TimeoutCancellationError
+    _stateless_superpower = True
 
     def __init__(self, timeout: Union[int, float], *tokens: AbstractToken, cancelled: bool = False, monotonic: bool = False):
         if timeout < 0:
@@ -44,14 +53,46 @@ class TimeoutToken(ConditionToken):
         else:
             timer = perf_counter
 
-        start_time: Union[int, float] = timer()
-        deadline = start_time + timeout
-        def function() -> bool:
-            return timer() >= deadline
+        self._timer = timer
+        self._deadline = timer() + timeout
+
+        # The condition is implemented by the _superpower() method itself.
+        super().__init__(_do_nothing, *tokens, cancelled=cancelled)  # type: ignore[arg-type]
+
+    def _superpower(self) -> bool:
+        return self._timer() >= self._deadline
 
-        self._deadline = deadline
+    def _needs_polling_by_step(self) -> bool:
+        return any(token._needs_polling_by_step() for token in self._tokens_to_poll)
 
-        super().__init__(function, *tokens, cancelled=cancelled)
+    def _get_deadline(self) -> Optional[Tuple[Callable[[], Union[int, float]], Union[int, float]]]:
+        if self._tokens_to_poll:
+            return None
+        deadline = self._deadline
+        for timeout in self._nearest_timeouts:
+            if timeout._timer is not self._timer:
+                return None
+            deadline = min(deadline, timeout._deadline)
+        return self._timer, deadline
+
+    def _get_nearest_timeouts(self) -> Sequence['TimeoutToken']:
+        timeouts = [self]
+        self._merge_timeouts(timeouts, self._nearest_timeouts)
+        return timeouts
+
+    def _get_remaining_time(self) -> float:
+        remaining = self._deadline - self._timer()
+        if self._monotonic:
+            remaining /= 1_000_000_000
+        return max(remaining, 0.0)
+
+    def _get_deadline_in_perf_counter_time(self) -> float:
+        if self._monotonic:
+            return perf_counter() + (self._deadline - monotonic_ns()) / 1_000_000_000
+        return self._deadline
+
+    def _get_snapshot_fabric(self, now: float) -> Tuple[Callable[..., AbstractToken], Tuple[Any, ...], Dict[str, Any]]:
+        return _restore_timeout_token, (now + self._get_remaining_time(),), {'cancelled': self._cancelled, 'monotonic': self._monotonic}
 
     def _text_representation_of_superpower(self) -> str:
         return str(self._timeout)
@@ -65,3 +106,7 @@ class TimeoutToken(ConditionToken):
 
     def _get_superpower_exception_message(self) -> str:
         return f'The timeout of {self._timeout} seconds has expired.'
+
+
+def _restore_timeout_token(deadline: float, *tokens: AbstractToken, cancelled: bool, monotonic: bool) -> TimeoutToken:
+    return TimeoutToken(max(deadline - time(), 0), *tokens, cancelled=cancelled, monotonic=monotonic)
@@ -1,4 +1,6 @@
 from cantok import (
+    BudgetCancellationError,
+    BudgetToken,
     CancellationError,
     ConditionCancellationError,
     ConditionToken,
@@ -6,6 +8,8 @@ from cantok import (
     CounterToken,
     DefaultToken,
     ImpossibleCancelError,
+    RateCancellationError,
+    RateToken,
     SimpleToken,
     TimeoutCancellationError,
     TimeoutToken,
@@ -17,6 +21,8 @@ def test_exception_inheritance_hierarchy():
     assert issubclass(TimeoutCancellationError, CancellationError)
     assert issubclass(CounterCancellationError, CancellationError)
     assert issubclass(ImpossibleCancelError, CancellationError)
+    assert issubclass(BudgetCancellationError, CancellationError)
+    assert issubclass(RateCancellationError, CancellationError)
 
 
 def test_exception_inheritance_hierarchy_from_view_of_tokens_classes():
@@ -24,9 +30,13 @@ def test_exception_inheritance_hierarchy_from_view_of_tokens_classes():
     assert issubclass(TimeoutToken.exception, SimpleToken.exception)
     assert issubclass(CounterToken.exception, SimpleToken.exception)
     assert issubclass(DefaultToken.exception, SimpleToken.exception)
+    assert issubclass(BudgetToken.exception, SimpleToken.exception)
+    assert issubclass(RateToken.exception, SimpleToken.exception)
 
     assert SimpleToken.exception is CancellationError
     assert ConditionToken.exception is ConditionCancellationError
     assert TimeoutToken.exception is TimeoutCancellationError
     assert CounterToken.exception is CounterCancellationError
     assert DefaultToken.exception is ImpossibleCancelError
+    assert BudgetToken.exception is BudgetCancellationError
+    assert RateToken.exception is RateCancellationError
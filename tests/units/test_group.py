@@ -0,0 +1,214 @@
+import gc
+import weakref
+from functools import partial
+from threading import Event, Thread
+from time import sleep
+
+import pytest
+
+from cantok import (
+    ConditionToken,
+    CounterToken,
+    DefaultToken,
+    SharedToken,
+    SimpleToken,
+    TimeoutToken,
+    TokenGroup,
+)
+from cantok.group import DEADLINES_RESERVE
+
+ALL_TOKENS_FABRICS = [
+    SimpleToken,
+    partial(ConditionToken, lambda: False),
+    partial(TimeoutToken, 15),
+    partial(TimeoutToken, 15, monotonic=True),
+    partial(CounterToken, 15),
+    SharedToken,
+    lambda: SimpleToken(TimeoutToken(15)),
+]
+
+
+def test_empty_group():
+    group = TokenGroup()
+
+    assert len(group) == 0
+    assert list(group) == []
+    assert group.pop_cancelled() == []
+
+
+def test_add_and_discard_tokens():
+    first_token = SimpleToken()
+    second_token = TimeoutToken(15)
+    group = TokenGroup(first_token, second_token, first_token)
+
+    assert len(group) == 2
+    assert list(group) == [first_token, second_token]
+    assert first_token in group
+    assert SimpleToken() not in group
+
+    group.discard(first_token)
+    group.discard(first_token)
+
+    assert list(group) == [second_token]
+    assert not first_token._listeners
+
+
+@pytest.mark.parametrize(
+    'token_fabric',
+    ALL_TOKENS_FABRICS,
+)
+def test_pop_manually_cancelled_tokens(token_fabric):
+    tokens = [token_fabric() for _ in range(5)]
+    group = TokenGroup(*tokens)
+
+    assert group.pop_cancelled() == []
+
+    tokens[3].cancel()
+    tokens[1].cancel()
+
+    assert group.pop_cancelled() == [tokens[3], tokens[1]]
+    assert group.pop_cancelled() == []
+    assert list(group) == [tokens[0], tokens[2], tokens[4]]
+    assert not tokens[1]._listeners
+
+
+@pytest.mark.parametrize(
+    'token_fabric',
+    [
+        partial(SimpleToken, cancelled=True),
+        partial(TimeoutToken, 0),
+        partial(CounterToken, 0),
+        partial(ConditionToken, lambda: True),
+        lambda: SimpleToken(TimeoutToken(0)),
+        lambda: SimpleToken(SimpleToken(cancelled=True)),
+    ],
+)
+def test_pop_tokens_cancelled_before_adding(token_fabric):
+    token = token_fabric()
+    group = TokenGroup(SimpleToken(), token)
+
+    assert group.pop_cancelled() == [token]
+    assert len(group) == 1
+
+
+def test_pop_expired_timeouts():
+    tokens = [TimeoutToken(0.01), TimeoutToken(15), TimeoutToken(0.02, monotonic=True), SimpleToken(TimeoutToken(0.01))]
+    group = TokenGroup(*tokens)
+
+    assert group.pop_cancelled() == []
+
+    sleep(0.03)
+
+    assert group.pop_cancelled() == [tokens[0], tokens[3], tokens[2]]
+    assert list(group) == [tokens[1]]
+
+
+def test_expired_timeout_already_found_out_is_popped():
+    token = TimeoutToken(0.01)
+    group = TokenGroup(token)
+    sleep(0.02)
+    assert not token
+
+    assert group.pop_cancelled() == [token]
+
+
+def test_discarded_timeout_is_not_popped():
+    token = TimeoutToken(0.01)
+    group = TokenGroup(token)
+    group.discard(token)
+    sleep(0.02)
+
+    assert group.pop_cancelled() == []
+
+
+def test_discarded_timeout_is_not_kept_alive():
+    group = TokenGroup()
+    tokens = [TimeoutToken(0) for _ in range(10)] + [TimeoutToken(3600, monotonic=True) for _ in range(10)]
+    references = [weakref.ref(token) for token in tokens]
+
+    for token in tokens:
+        group.add(token)
+    for token in tokens:
+        group.discard(token)
+    del token, tokens
+    gc.collect()
+
+    assert all(reference() is None for reference in references)
+    assert group.pop_cancelled() == []
+
+
+def test_deadlines_of_discarded_tokens_are_dropped():
+    group = TokenGroup()
+    token = TimeoutToken(3600)
+    group.add(token)
+
+    for _ in range(1000):
+        another_token = TimeoutToken(3600)
+        group.add(another_token)
+        group.discard(another_token)
+
+    assert group._deadlines_size <= 2 * len(group) + DEADLINES_RESERVE
+    assert sum(len(deadlines) for deadlines in group._deadlines.values()) == group._deadlines_size
+    assert token in group
+
+    token.cancel()
+
+    assert group.pop_cancelled() == [token]
+
+
+def test_discarded_cancelled_token_is_not_popped():
+    token = SimpleToken()
+    group = TokenGroup(token)
+    token.cancel()
+    group.discard(token)
+
+    assert group.pop_cancelled() == []
+
+
+def test_pop_tokens_with_conditions():
+    flag = []
+    tokens = [ConditionToken(lambda: bool(flag)), ConditionToken(lambda: False), CounterToken(1)]
+    group = TokenGroup(*tokens)
+
+    assert group.pop_cancelled() == []
+
+    flag.append(True)
+
+    assert group.pop_cancelled() == [tokens[0]]
+    assert list(group) == [tokens[1], tokens[2]]
+
+
+def test_tokens_without_superpowers_are_not_polled():
+    group = TokenGroup(SimpleToken(), DefaultToken(), SimpleToken(SimpleToken()), TimeoutToken(15))
+
+    assert group._tokens_to_poll == {}
+
+
+def test_group_listener_does_not_take_the_lock():
+    token = SimpleToken()
+    group = TokenGroup(token)
+    cancelled = Event()
+
+    def cancel():
+        token.cancel()
+        cancelled.set()
+
+    with group._lock:
+        Thread(target=cancel).start()
+        assert cancelled.wait(5)
+
+    assert group.pop_cancelled() == [token]
+
+
+def test_callback_can_change_group():
+    group = TokenGroup()
+    other_token = SimpleToken()
+    flag = []
+    token = ConditionToken(lambda: bool(flag))
+    token.on_cancel(lambda: group.add(other_token))
+    group.add(token)
+
+    flag.append(True)
+
+    assert group.pop_cancelled() == [token]
+    assert list(group) == [other_token]
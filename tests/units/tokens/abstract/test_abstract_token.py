@@ -1,6 +1,9 @@
 import asyncio
+import gc
+import weakref
 from functools import partial
-from threading import Thread
+from sys import getrecursionlimit, getsizeof
+from threading import Event, RLock, Thread, Timer
 from time import perf_counter, sleep
 
 import pytest
@@ -9,16 +12,20 @@ from full_match import match
 from cantok import (
     CancellationError,
     ConditionToken,
+    CounterCancellationError,
     CounterToken,
     DefaultToken,
     SimpleToken,
+    TimeoutCancellationError,
     TimeoutToken,
 )
+from cantok.tokens.abstract import abstract_token as abstract_token_module
 from cantok.tokens.abstract.abstract_token import (
     AbstractToken,
     CancelCause,
     CancellationReport,
 )
+from cantok.tokens.abstract.watcher import Watcher
 
 ALL_TOKEN_CLASSES = [SimpleToken, ConditionToken, TimeoutToken, CounterToken]
 ALL_SUPERPOWER_TOKEN_CLASSES = [ConditionToken, TimeoutToken, CounterToken]
@@ -801,3 +808,1331 @@ def test_any_token_plus_cancelled_simple_token_gives_cancelled_simple_token(toke
     assert isinstance(token, SimpleToken)
     assert len(token._tokens) == 0
     assert not token
+
+
+@pytest.mark.parametrize(
+    'token_fabric',
+    ALL_TOKENS_FABRICS,
+)
+def test_cancel_of_nested_token_is_pushed_to_all_parents(token_fabric):
+    leaf = token_fabric()
+    middle = SimpleToken(leaf)
+    root = SimpleToken(middle)
+
+    assert root._cached_report is None
+    assert middle._cached_report is None
+
+    leaf.cancel()
+
+    for token in root, middle:
+        assert token._cached_report is not None
+        assert token._cached_report.cause == CancelCause.CANCELLED
+        assert token._cached_report.from_token is leaf
+        assert token.cancelled
+
+
+def test_tokens_without_superpowers_are_not_polled():
+    leaf = SimpleToken()
+    root = SimpleToken(SimpleToken(SimpleToken(leaf)))
+
+    assert not root._tokens_to_poll
+    assert root
+
+    leaf.cancelled = True
+
+    assert not root
+    with pytest.raises(CancellationError) as exc_info:
+        root.check()
+    assert exc_info.value.token is leaf
+
+
+@pytest.mark.parametrize(
+    'token_fabric',
+    ALL_TOKENS_FABRICS_WITH_NOT_CANCELLING_SUPERPOWER,
+)
+def test_tokens_with_superpowers_are_polled(token_fabric):
+    superpower_token = token_fabric()
+    middle = SimpleToken(superpower_token)
+    root = SimpleToken(SimpleToken(), middle)
+
+    assert root._get_tokens_to_poll() == [middle]
+    assert middle._get_tokens_to_poll() == [superpower_token]
+
+
+def test_cancelled_nested_token_is_polled():
+    nested_token = SimpleToken(cancelled=True)
+    token = SimpleToken(nested_token)
+
+    assert token._tokens_to_poll == [nested_token]
+    assert token._cached_report is None
+    assert not token
+    assert token._cached_report.from_token is nested_token
+
+
+def test_parents_start_polling_when_nested_token_gets_superpower_token():
+    middle = SimpleToken()
+    root = SimpleToken(middle)
+
+    assert not root._tokens_to_poll
+
+    middle._embed_tokens([ConditionToken(lambda: True)])
+
+    assert root._tokens_to_poll == [middle]
+    assert not root
+
+
+def test_dead_parents_are_forgotten():
+    token = SimpleToken()
+    SimpleToken(token)
+    SimpleToken(token)
+
+    assert token._parents == []
+    assert token._get_parents() == []
+
+    parent = SimpleToken(token)
+
+    assert token._get_parents() == [parent]
+
+    token.cancel()
+
+    assert not parent
+
+
+def test_dead_parent_reference_is_skipped():
+    token = SimpleToken()
+    token._register_parent(SimpleToken())
+    token._parents.append(weakref.ref(SimpleToken()))
+
+    assert token._get_parents() == []
+
+    token.cancel()
+
+
+def test_parent_polls_nested_token_only_once():
+    middle = SimpleToken(cancelled=True)
+    root = SimpleToken(middle)
+
+    middle._embed_tokens([ConditionToken(lambda: False)])
+
+    assert root._tokens_to_poll == [middle]
+
+
+def test_cancel_is_pushed_through_chain_deeper_than_recursion_limit():
+    leaf = SimpleToken()
+    root = leaf
+    for _ in range(getrecursionlimit() * 2):
+        root = SimpleToken(root)
+
+    leaf.cancel()
+
+    assert root._cached_report.from_token is leaf
+    assert root.cancelled
+
+
+def test_listeners_of_parents_are_notified_depth_first():
+    calls = []
+    leaf = SimpleToken()
+    first_middle = SimpleToken(leaf)
+    second_middle = SimpleToken(leaf)
+    first_root = SimpleToken(first_middle)
+    second_root = SimpleToken(first_middle, second_middle)
+    for name, token in (('first_middle', first_middle), ('second_middle', second_middle), ('first_root', first_root), ('second_root', second_root)):
+        token._add_listener(partial(calls.append, name))
+
+    leaf.cancel()
+
+    assert calls == ['first_middle', 'first_root', 'second_root', 'second_middle']
+
+
+def test_first_pushed_report_stays_in_cache():
+    first_token = SimpleToken()
+    second_token = SimpleToken()
+    token = SimpleToken(first_token, second_token)
+
+    first_token.cancel()
+    second_token.cancel()
+
+    assert token._cached_report.from_token is first_token
+
+
+@pytest.mark.parametrize(
+    'token_fabric',
+    [SimpleToken, DefaultToken],
+)
+def test_polling_interval_of_token_without_superpowers(token_fabric):
+    assert token_fabric()._get_polling_interval(0.1) is None
+    assert SimpleToken(token_fabric(), SimpleToken())._get_polling_interval(0.1) is None
+
+
+@pytest.mark.parametrize(
+    'token_fabric',
+    [partial(ConditionToken, lambda: False), partial(CounterToken, 5)],
+)
+def test_polling_interval_of_token_with_unpredictable_superpower(token_fabric):
+    assert token_fabric()._get_polling_interval(0.1) == 0.1
+    assert SimpleToken(token_fabric())._get_polling_interval(0.1) == 0.1
+    assert TimeoutToken(5, token_fabric())._get_polling_interval(0.1) == 0.1
+
+
+@pytest.mark.parametrize(
+    'monotonic',
+    [True, False],
+)
+def test_polling_interval_of_timeout_tokens_is_the_nearest_deadline(monotonic):
+    token = SimpleToken(TimeoutToken(5, monotonic=monotonic), SimpleToken(TimeoutToken(3, monotonic=monotonic)))
+
+    assert 2.5 < token._get_polling_interval(0.1) <= 3
+    assert TimeoutToken(0)._get_polling_interval(0.1) == 0
+
+
+def test_polling_interval_of_cancelled_nested_token():
+    assert SimpleToken(SimpleToken(cancelled=True))._get_polling_interval(0.1) is None
+
+
+def test_listeners_are_notified_about_cancellation_of_nested_tokens():
+    calls = []
+    nested_token = SimpleToken()
+    token = SimpleToken(nested_token)
+
+    token._add_listener(lambda: calls.append('token'))
+    token._add_listener(lambda: calls.append('token_2'))
+    nested_token._add_listener(lambda: calls.append('nested_token'))
+
+    nested_token.cancel()
+
+    assert calls == ['nested_token', 'token', 'token_2']
+
+
+def test_removed_listener_is_not_notified():
+    calls = []
+    token = SimpleToken()
+
+    def listener():
+        calls.append(True)
+
+    token._add_listener(listener)
+    token._remove_listener(listener)
+    token.cancel()
+
+    assert calls == []
+
+
+@pytest.mark.parametrize(
+    'token_fabric',
+    [SimpleToken, partial(TimeoutToken, 3)],
+)
+def test_sync_wait_is_not_polling_in_a_loop(token_fabric, monkeypatch):
+    calls = []
+    original_get_polling_interval = AbstractToken._get_polling_interval
+
+    def get_polling_interval(self, step):
+        calls.append(step)
+        return original_get_polling_interval(self, step)
+
+    monkeypatch.setattr(AbstractToken, '_get_polling_interval', get_polling_interval)
+
+    token = token_fabric()
+    timer = Timer(0.05, token.cancel)
+    timer.start()
+    token.wait()
+    timer.join()
+
+    assert len(calls) <= 2
+
+
+def test_sync_wait_of_timeout_token_sleeps_once(monkeypatch):
+    calls = []
+    original_get_polling_interval = AbstractToken._get_polling_interval
+
+    def get_polling_interval(self, step):
+        calls.append(step)
+        return original_get_polling_interval(self, step)
+
+    monkeypatch.setattr(AbstractToken, '_get_polling_interval', get_polling_interval)
+
+    start_time = perf_counter()
+    TimeoutToken(0.05).wait()
+    finish_time = perf_counter()
+
+    assert finish_time - start_time >= 0.05
+    assert len(calls) <= 3
+
+
+@pytest.mark.parametrize(
+    'token_fabric',
+    [SimpleToken, partial(TimeoutToken, 3)],
+)
+def test_async_wait_is_not_polling_in_a_loop(token_fabric, monkeypatch):
+    calls = []
+    original_get_polling_interval = AbstractToken._get_polling_interval
+
+    def get_polling_interval(self, step):
+        calls.append(step)
+        return original_get_polling_interval(self, step)
+
+    monkeypatch.setattr(AbstractToken, '_get_polling_interval', get_polling_interval)
+
+    token = token_fabric()
+
+    async def runner():
+        asyncio.get_running_loop().call_later(0.05, token.cancel)
+        await token.wait()
+
+    asyncio.run(runner())
+
+    assert len(calls) <= 2
+
+
+def test_async_wait_is_woken_up_from_another_thread():
+    token = SimpleToken()
+
+    async def runner():
+        timer = Timer(0.05, token.cancel)
+        timer.start()
+        await token.wait()
+        timer.join()
+
+    start_time = perf_counter()
+    asyncio.run(runner())
+    finish_time = perf_counter()
+
+    assert 0.05 <= finish_time - start_time < 1
+
+
+def test_async_wait_survives_repeated_wake_ups():
+    token = SimpleToken()
+
+    async def waker():
+        await asyncio.sleep(0.01)
+        token_for_wait = token._get_parents()[0]
+        token_for_wait._notify_listeners([])
+        token_for_wait._notify_listeners([])
+        await asyncio.sleep(0.01)
+        token.cancel()
+
+    async def runner():
+        await asyncio.gather(waker(), token.wait())
+
+    asyncio.run(runner())
+
+    assert not token
+
+
+@pytest.mark.parametrize(
+    'token_fabric',
+    [
+        SimpleToken,
+        partial(ConditionToken, lambda: False),
+        partial(TimeoutToken, 15),
+        partial(CounterToken, 1000),
+        lambda: SimpleToken(SimpleToken(), TimeoutToken(15), ConditionToken(lambda: False)),
+    ],
+)
+@pytest.mark.parametrize(
+    'action',
+    [
+        lambda x: x.cancelled,
+        lambda x: x.keep_on(),
+        bool,
+        lambda x: x.is_cancelled(),
+        lambda x: x.is_cancelled(direct=False),
+        lambda x: x.check(),
+    ],
+)
+def test_polling_of_not_cancelled_token_creates_no_reports(token_fabric, action, monkeypatch):
+    created_reports = []
+
+    class CountingReport(CancellationReport):
+        __slots__ = ()
+
+        def __init__(self, *args, **kwargs):
+            created_reports.append(True)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(abstract_token_module, 'CancellationReport', CountingReport)
+
+    token = token_fabric()
+
+    for _ in range(100):
+        action(token)
+
+    assert not created_reports
+
+
+@pytest.mark.parametrize(
+    'token_fabric',
+    ALL_TOKENS_FABRICS,
+)
+def test_own_reports_are_created_once(token_fabric):
+    token = token_fabric()
+
+    not_cancelled_report = token._get_report()
+
+    assert token._get_report() is not_cancelled_report
+    assert token._get_report(direct=False) is not_cancelled_report
+
+    token.cancel()
+    cancelled_report = token._get_report()
+
+    assert cancelled_report.cause == CancelCause.CANCELLED
+    assert token._get_report() is cancelled_report
+    assert token._get_report(direct=False) is cancelled_report
+
+
+@pytest.mark.parametrize(
+    'token_fabric',
+    ALL_TOKENS_FABRICS_WITH_CANCELLING_SUPERPOWER,
+)
+def test_superpower_report_is_created_once(token_fabric):
+    token = token_fabric()
+
+    report = token._get_report()
+
+    assert report.cause == CancelCause.SUPERPOWER
+    assert token._get_report() is report
+
+
+def test_combine_nothing():
+    token = AbstractToken.combine()
+
+    assert isinstance(token, SimpleToken)
+    assert not token._tokens
+    assert token
+
+
+@pytest.mark.parametrize(
+    'first_token_fabric',
+    ALL_TOKENS_FABRICS,
+)
+@pytest.mark.parametrize(
+    'second_token_fabric',
+    ALL_TOKENS_FABRICS,
+)
+def test_combine_does_not_depend_on_temporariness(first_token_fabric, second_token_fabric):
+    first_token = first_token_fabric()
+    second_token = second_token_fabric()
+
+    for token in AbstractToken.combine(first_token, second_token), SimpleToken.combine(first_token, second_token):
+        assert type(token) is SimpleToken
+        assert token._tokens == [first_token, second_token]
+        assert not first_token._tokens
+        assert not second_token._tokens
+
+    token = AbstractToken.combine(first_token_fabric(), second_token_fabric())
+
+    assert type(token) is SimpleToken
+    assert len(token._tokens) == 2
+
+
+def test_combine_drops_default_tokens_and_repeated_tokens():
+    nested_token = SimpleToken()
+
+    token = AbstractToken.combine(DefaultToken(), nested_token, DefaultToken(), nested_token)
+
+    assert token._tokens == [nested_token]
+
+
+@pytest.mark.parametrize(
+    'token_fabric',
+    ALL_TOKENS_FABRICS,
+)
+def test_combine_with_cancelled_token(token_fabric):
+    token = AbstractToken.combine(SimpleToken(), token_fabric(cancelled=True))
+
+    assert type(token) is SimpleToken
+    assert not token._tokens
+    assert not token
+    assert repr(token) == 'SimpleToken(cancelled=True)'
+
+
+@pytest.mark.parametrize(
+    'another_object',
+    [1, 'kek', None],
+)
+def test_combine_token_and_not_token(another_object):
+    with pytest.raises(TypeError, match=match('Cancellation Token can only be combined with another Cancellation Token.')):
+        AbstractToken.combine(SimpleToken(), another_object)
+
+
+@pytest.mark.parametrize(
+    'combine',
+    [SimpleToken, AbstractToken.combine],
+)
+def test_only_the_nearest_timeout_is_polled(combine):
+    far_timeout = TimeoutToken(15)
+    near_timeout = TimeoutToken(5)
+    monotonic_timeout = TimeoutToken(10, monotonic=True)
+    timeout_with_condition = TimeoutToken(20, ConditionToken(lambda: False))
+    condition_token = ConditionToken(lambda: False)
+
+    token = combine(far_timeout, near_timeout, monotonic_timeout, timeout_with_condition, condition_token)
+
+    assert token._tokens == [far_timeout, near_timeout, monotonic_timeout, timeout_with_condition, condition_token]
+    assert token._tokens_to_poll == [timeout_with_condition, condition_token]
+    assert [nested_token for _, _, nested_token in token._timed_tokens] == [near_timeout, monotonic_timeout]
+    assert token
+
+    far_timeout.cancel()
+
+    assert not token
+    with pytest.raises(CancellationError) as exc_info:
+        token.check()
+    assert exc_info.value.token is far_timeout
+
+
+def test_expired_timed_token_is_found_by_clock():
+    near_timeout = TimeoutToken(0.01)
+    token = SimpleToken(TimeoutToken(15), near_timeout, TimeoutToken(0.02, monotonic=True))
+
+    assert token
+    sleep(0.02)
+    assert not token
+
+    with pytest.raises(TimeoutToken.exception) as exc_info:
+        token.check()
+    assert exc_info.value.token is near_timeout
+
+
+def test_parents_refresh_timed_tokens_when_nested_timeout_gets_condition():
+    timeout_token = TimeoutToken(15)
+    token = SimpleToken(timeout_token)
+
+    assert token._timed_tokens
+    assert not token._tokens_to_poll
+
+    timeout_token._embed_tokens([ConditionToken(lambda: True)])
+
+    assert not token._timed_tokens
+    assert token._tokens_to_poll == [timeout_token]
+    assert not token
+
+
+def test_combine_expired_timeouts():
+    token = AbstractToken.combine(TimeoutToken(15), TimeoutToken(0))
+
+    assert not token
+    with pytest.raises(TimeoutToken.exception):
+        token.check()
+
+
+def test_add_tokens_in_module_namespace():
+    namespace = {'SimpleToken': SimpleToken, 'TimeoutToken': TimeoutToken}
+
+    exec('stored_token = TimeoutToken(5)\nfirst_sum = stored_token + TimeoutToken(15)\nsecond_sum = SimpleToken() + TimeoutToken(15)', namespace)
+
+    assert namespace['first_sum'] is namespace['stored_token']
+    assert isinstance(namespace['second_sum'], TimeoutToken)
+
+
+@pytest.mark.parametrize(
+    'token_fabric',
+    [*ALL_TOKENS_FABRICS, DefaultToken],
+)
+def test_tokens_have_no_dict(token_fabric):
+    token = token_fabric()
+
+    assert not hasattr(token, '__dict__')
+
+    with pytest.raises(AttributeError):
+        token.some_attribute = 'kek'
+
+
+@pytest.mark.parametrize(
+    ('token_fabric', 'max_size'),
+    [
+        (SimpleToken, 136),
+        (DefaultToken, 136),
+        (partial(ConditionToken, lambda: False), 192),
+        (partial(TimeoutToken, 15), 224),
+        (partial(CounterToken, 15), 224),
+    ],
+)
+def test_size_of_token_is_not_so_big(token_fabric, max_size):
+    assert getsizeof(token_fabric()) <= max_size
+
+
+@pytest.mark.parametrize(
+    'token_fabric',
+    [*ALL_TOKENS_FABRICS, DefaultToken],
+)
+def test_lock_is_created_lazily(token_fabric):
+    token = token_fabric()
+
+    assert token._lazy_lock is None
+
+    lock = token._lock
+
+    assert lock is token._lazy_lock
+    assert lock is token._lock
+
+
+def test_lock_is_created_once_for_concurrent_threads():
+    token = SimpleToken()
+    locks = []
+
+    with abstract_token_module._lock_for_creating_locks:
+        thread = Thread(target=lambda: locks.append(token._lock))
+        thread.start()
+        sleep(0.01)
+        existing_lock = RLock()
+        token._lazy_lock = existing_lock
+
+    thread.join()
+
+    assert locks == [existing_lock]
+
+
+@pytest.mark.parametrize(
+    'token_fabric',
+    [SimpleToken, DefaultToken, partial(TimeoutToken, 15), lambda: SimpleToken(TimeoutToken(15), SimpleToken())],
+)
+@pytest.mark.parametrize(
+    'action',
+    [
+        lambda x: x.check(),
+        lambda x: x.is_cancelled(),
+        lambda x: x.keep_on(),
+        lambda x: x.cancelled,
+    ],
+)
+def test_polling_of_token_with_stateless_superpower_takes_no_lock(token_fabric, action):
+    token = token_fabric()
+
+    action(token)
+
+    assert token._lazy_lock is None
+
+
+@pytest.mark.parametrize(
+    'token_fabric',
+    [partial(ConditionToken, lambda: False), partial(CounterToken, 15)],
+)
+def test_check_of_token_with_stateful_superpower_takes_the_lock(token_fabric):
+    token = token_fabric()
+
+    token.check()
+
+    assert token._lazy_lock is not None
+
+
+@pytest.mark.parametrize(
+    'token_fabric',
+    [SimpleToken, partial(TimeoutToken, 15)],
+)
+def test_many_threads_check_shared_token_without_lock(token_fabric):
+    token = token_fabric()
+    start_event = Event()
+    errors = []
+
+    def checker():
+        start_event.wait()
+        try:
+            while True:
+                token.check()
+        except CancellationError as error:
+            errors.append(error)
+
+    threads = [Thread(target=checker) for _ in range(64)]
+    for thread in threads:
+        thread.start()
+    start_event.set()
+    token.cancel()
+    for thread in threads:
+        thread.join()
+
+    assert len(errors) == 64
+    assert all(type(error) is CancellationError and error.token is token for error in errors)
+    assert token._lazy_lock is None
+
+
+@pytest.mark.parametrize(
+    'token_fabric',
+    [SimpleToken, DefaultToken, partial(ConditionToken, lambda: False), partial(CounterToken, 5)],
+)
+def test_token_without_timeouts_has_no_deadline(token_fabric):
+    token = token_fabric()
+
+    assert token.deadline is None
+    assert token.remaining() is None
+    assert SimpleToken(token).deadline is None
+    assert SimpleToken(token).remaining() is None
+
+
+@pytest.mark.parametrize(
+    'monotonic',
+    [True, False],
+)
+@pytest.mark.parametrize(
+    'combine',
+    [SimpleToken, AbstractToken.combine, partial(ConditionToken, lambda: False), partial(CounterToken, 5)],
+)
+def test_deadline_is_the_nearest_deadline_in_the_whole_tree(combine, monotonic):
+    token = combine(TimeoutToken(5), SimpleToken(ConditionToken(lambda: False, TimeoutToken(3, monotonic=monotonic))), TimeoutToken(4, monotonic=True))
+
+    assert 2.5 < token.remaining() <= 3
+    assert 2.5 < token.deadline - perf_counter() <= 3
+
+
+def test_remaining_time_is_not_less_than_zero():
+    token = SimpleToken(TimeoutToken(0.001), TimeoutToken(0.001, monotonic=True))
+    sleep(0.002)
+
+    assert token.remaining() == 0
+    assert token.deadline <= perf_counter()
+
+
+def test_deadline_of_nested_timeouts_is_known_after_adding_them():
+    middle = SimpleToken()
+    token = SimpleToken(middle)
+
+    assert token.remaining() is None
+
+    middle._embed_tokens([TimeoutToken(3)])
+
+    assert 2.5 < token.remaining() <= 3
+    assert 2.5 < token._get_polling_interval(0.1) <= 3
+
+
+def test_token_with_only_nested_timeouts_is_compared_with_the_clock():
+    near_timeout = TimeoutToken(3)
+    middle = SimpleToken(TimeoutToken(5), SimpleToken(near_timeout))
+    token = SimpleToken(middle)
+
+    assert token._timed_tokens == [(perf_counter, near_timeout._deadline, middle)]
+    assert not token._tokens_to_poll
+    assert token
+
+    near_timeout.cancel()
+
+    assert not token
+
+
+def test_token_with_nested_timeouts_of_different_clocks_is_polled():
+    middle = SimpleToken(TimeoutToken(5), TimeoutToken(3, monotonic=True))
+    token = SimpleToken(middle)
+
+    assert not token._timed_tokens
+    assert token._tokens_to_poll == [middle]
+
+
+def test_expired_nested_timeout_is_found_through_passive_tokens():
+    near_timeout = TimeoutToken(0.01)
+    token = SimpleToken(SimpleToken(TimeoutToken(15), SimpleToken(near_timeout)))
+
+    assert token
+    sleep(0.02)
+    assert not token
+
+    with pytest.raises(TimeoutToken.exception) as exc_info:
+        token.check()
+    assert exc_info.value.token is near_timeout
+
+
+@pytest.mark.parametrize(
+    'token_fabric',
+    ALL_TOKENS_FABRICS,
+)
+def test_future_is_resolved_when_token_is_cancelled_from_another_thread(token_fabric):
+    token = token_fabric()
+
+    async def main():
+        future = token.as_future()
+        Timer(0.01, token.cancel).start()
+        assert await asyncio.wait_for(future, timeout=5) is None
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize(
+    'token_fabric',
+    [
+        lambda: TimeoutToken(0.01),
+        lambda: SimpleToken(TimeoutToken(0.01, monotonic=True)),
+        lambda: ConditionToken(partial(lambda deadline: perf_counter() >= deadline, perf_counter() + 0.01)),
+        lambda: SimpleToken(cancelled=True),
+        lambda: CounterToken(0),
+    ],
+)
+def test_future_is_resolved_by_superpowers(token_fabric):
+    token = token_fabric()
+
+    async def main():
+        await asyncio.wait_for(token.as_future(), timeout=5)
+
+    asyncio.run(main())
+
+    assert not token
+
+
+def test_cancelled_future_does_not_listen_to_token():
+    token = SimpleToken()
+
+    async def main():
+        future = token.as_future()
+        await asyncio.sleep(0)
+        assert token._get_parents()
+
+        future.cancel()
+        await asyncio.sleep(0)
+        del future
+        gc.collect()
+        assert not token._get_parents()
+
+    asyncio.run(main())
+
+
+def test_future_does_not_spend_counter():
+    token = CounterToken(5)
+
+    async def main():
+        future = token.as_future()
+        await asyncio.sleep(0.05)
+
+        assert not future.done()
+        assert token.counter == 5
+
+        future.cancel()
+
+    asyncio.run(main())
+
+
+def test_bound_task_is_not_cancelled_by_spending_counter():
+    token = CounterToken(5)
+
+    async def main():
+        task = asyncio.ensure_future(asyncio.sleep(0.05))
+        token.bind_task(task)
+        await task
+
+    asyncio.run(main())
+
+    assert token.counter == 5
+
+
+def test_as_future_with_negative_step():
+    async def main():
+        with pytest.raises(ValueError, match=match('The token polling iteration time cannot be less than zero.')):
+            SimpleToken().as_future(-1)
+
+    asyncio.run(main())
+
+
+def test_as_future_without_event_loop():
+    with pytest.raises(RuntimeError):
+        SimpleToken().as_future()
+
+
+@pytest.mark.parametrize(
+    'token_fabric',
+    ALL_TOKENS_FABRICS,
+)
+def test_bound_task_is_cancelled_with_token(token_fabric):
+    token = token_fabric()
+
+    async def main():
+        task = asyncio.ensure_future(asyncio.sleep(10))
+        token.bind_task(task)
+        Timer(0.01, token.cancel).start()
+
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(task, timeout=5)
+        assert task.cancelled()
+
+    asyncio.run(main())
+
+
+def test_finished_task_is_unbound():
+    token = SimpleToken()
+
+    async def main():
+        task = asyncio.ensure_future(asyncio.sleep(0))
+        future = token.bind_task(task)
+
+        await task
+        await asyncio.sleep(0)
+
+        assert future.cancelled()
+
+        token.cancel()
+        await asyncio.sleep(0)
+
+    asyncio.run(main())
+    gc.collect()
+
+    assert not token._get_parents()
+    assert not token
+
+
+def test_unbound_task_is_not_cancelled():
+    token = SimpleToken()
+
+    async def main():
+        task = asyncio.ensure_future(asyncio.sleep(0.01))
+        future = token.bind_task(task)
+        future.cancel()
+        await asyncio.sleep(0)
+
+        token.cancel()
+        await task
+
+        assert not task.cancelled()
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize(
+    'token_fabric',
+    ALL_TOKENS_FABRICS,
+)
+def test_callback_is_called_once_on_manual_cancellation(token_fabric):
+    calls = []
+    token = token_fabric()
+    token.on_cancel(lambda: calls.append(1))
+
+    assert calls == []
+
+    token.cancel()
+    token.cancel()
+
+    assert calls == [1]
+
+
+@pytest.mark.parametrize(
+    'token_fabric',
+    ALL_TOKENS_FABRICS,
+)
+def test_callback_of_parent_is_called_on_cancellation_of_nested_token(token_fabric):
+    calls = []
+    nested_token = token_fabric()
+    token = SimpleToken(SimpleToken(nested_token))
+    token.on_cancel(lambda: calls.append(1))
+
+    nested_token.cancel()
+
+    assert calls == [1]
+
+    token.cancel()
+
+    assert calls == [1]
+
+
+@pytest.mark.parametrize(
+    'token_fabric',
+    [
+        partial(SimpleToken, cancelled=True),
+        *ALL_TOKENS_FABRICS_WITH_CANCELLING_SUPERPOWER,
+    ],
+)
+def test_callback_of_cancelled_token_is_called_right_away(token_fabric):
+    calls = []
+    token = token_fabric()
+    handle = token.on_cancel(lambda: calls.append(1))
+
+    assert calls == [1]
+    assert not handle.active
+
+    assert not SimpleToken(token).on_cancel(lambda: calls.append(2)).active
+    assert calls == [1, 2]
+
+
+def test_callback_of_counter_token_is_called_when_polling_finds_it_out():
+    calls = []
+    token = CounterToken(2)
+    token.on_cancel(lambda: calls.append(1))
+
+    assert token
+    assert token
+    assert calls == []
+    assert not token
+    assert not token
+    assert calls == [1]
+
+
+@pytest.mark.parametrize(
+    'poll',
+    [
+        lambda token: token.cancelled,
+        lambda token: token.keep_on(),
+        lambda token: token.is_cancelled(direct=False),
+        lambda token: SimpleToken(token).cancelled,
+    ],
+)
+def test_callbacks_are_called_when_polling_finds_out_superpower(poll):
+    calls = []
+    flag = []
+    condition_token = ConditionToken(lambda: bool(flag))
+    token = SimpleToken(SimpleToken(condition_token))
+    condition_token.on_cancel(lambda: calls.append('condition'))
+    token.on_cancel(lambda: calls.append('token'))
+
+    poll(condition_token)
+    assert calls == []
+
+    flag.append(True)
+    poll(condition_token)
+    poll(condition_token)
+
+    assert calls == ['condition', 'token']
+
+
+def test_callbacks_are_called_when_parent_finds_out_expired_timeout(monkeypatch):
+    monkeypatch.setattr(Watcher, 'watch', lambda *_: None)
+    calls = []
+    timeout_token = TimeoutToken(0.01)
+    middle = SimpleToken(timeout_token, TimeoutToken(15))
+    token = SimpleToken(middle)
+    timeout_token.on_cancel(lambda: calls.append('timeout'))
+    middle.on_cancel(lambda: calls.append('middle'))
+    token.on_cancel(lambda: calls.append('token'))
+
+    sleep(0.02)
+
+    assert calls == []
+    assert not token
+    assert calls == ['timeout', 'middle', 'token']
+    assert not token
+    assert calls == ['timeout', 'middle', 'token']
+
+
+@pytest.mark.parametrize(
+    'token_fabric',
+    [
+        lambda: TimeoutToken(0.05),
+        lambda: TimeoutToken(0.05, monotonic=True),
+        lambda: SimpleToken(TimeoutToken(0.05), TimeoutToken(15)),
+        lambda: ConditionToken(lambda: False, TimeoutToken(0.05)),
+    ],
+)
+def test_callback_is_called_at_deadline_without_polling(token_fabric):
+    called = Event()
+    token = token_fabric()
+    start_time = perf_counter()
+    token.on_cancel(called.set)
+
+    assert called.wait(5)
+    assert perf_counter() - start_time >= 0.04
+
+
+def test_callbacks_are_called_at_deadline_in_order():
+    calls = []
+    timeout_token = TimeoutToken(0.05)
+    middle = SimpleToken(timeout_token, TimeoutToken(15))
+    token = SimpleToken(middle)
+    called = Event()
+    timeout_token.on_cancel(lambda: calls.append('timeout'))
+    middle.on_cancel(lambda: calls.append('middle'))
+    token.on_cancel(lambda: calls.append('token'))
+    token.on_cancel(called.set)
+
+    assert called.wait(5)
+    assert calls == ['timeout', 'middle', 'token']
+    assert not token
+    assert calls == ['timeout', 'middle', 'token']
+
+
+def test_counter_is_not_spent_when_deadline_is_checked():
+    counter_token = CounterToken(5, direct=False)
+    token = SimpleToken(counter_token, TimeoutToken(0.05))
+    called = Event()
+    token.on_cancel(called.set)
+
+    assert called.wait(5)
+    assert counter_token.counter == 5
+
+
+def test_callback_does_not_keep_token_with_deadline_alive():
+    token = TimeoutToken(15)
+    token.on_cancel(lambda: None)
+    reference = weakref.ref(token)
+
+    del token
+    gc.collect()
+
+    assert reference() is None
+
+
+def test_callback_is_called_when_nested_token_is_cancelled_before_embedding():
+    calls = []
+    token = SimpleToken(ConditionToken(lambda: True, caching=False))
+    token.on_cancel(lambda: calls.append(1))
+
+    assert calls == [1]
+
+
+def test_callback_is_called_when_token_with_listener_embeds_cancelled_token():
+    calls = []
+    nested_token = ConditionToken(lambda: True)
+    assert not nested_token
+    token = SimpleToken()
+    token.on_cancel(lambda: calls.append(1))
+
+    token._embed_tokens([nested_token])
+    assert calls == []
+
+    assert not token
+    assert calls == [1]
+
+
+def test_all_callbacks_are_called_and_first_exception_is_raised():
+    calls = []
+    nested_token = SimpleToken()
+    token = SimpleToken(nested_token)
+
+    def fail(name):
+        calls.append(name)
+        raise ValueError(name)
+
+    nested_token.on_cancel(lambda: fail('first'))
+    nested_token.on_cancel(lambda: calls.append('second'))
+    token.on_cancel(lambda: fail('third'))
+
+    with pytest.raises(ValueError, match=match('first')):
+        nested_token.cancel()
+
+    assert calls == ['first', 'second', 'third']
+    assert not token
+
+
+def test_callbacks_are_called_once_when_many_threads_cancel_and_poll():
+    calls = []
+    condition_flag = Event()
+    nested_token = ConditionToken(condition_flag.is_set)
+    token = SimpleToken(nested_token)
+    token.on_cancel(lambda: calls.append('token'))
+    nested_token.on_cancel(lambda: calls.append('nested'))
+    start = Event()
+
+    def work(index):
+        start.wait()
+        if index % 3 == 0:
+            nested_token.cancel()
+        elif index % 3 == 1:
+            condition_flag.set()
+            bool(token)
+        else:
+            bool(nested_token)
+
+    threads = [Thread(target=work, args=(index,)) for index in range(30)]
+    for thread in threads:
+        thread.start()
+    start.set()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(calls) == ['nested', 'token']
+
+
+@pytest.mark.parametrize(
+    ('step', 'max_step', 'message'),
+    [
+        (0, 0.1, 'The token polling iteration time must be greater than zero to increase it.'),
+        (0.1, 0.01, 'The maximum token polling iteration time cannot be less than the initial one.'),
+    ],
+)
+def test_wrong_max_step(step, max_step, message):
+    with pytest.raises(ValueError, match=match(message)):
+        SimpleToken().wait(step=step, max_step=max_step)
+
+
+def collect_polling_steps(monkeypatch):
+    steps = []
+    original_get_polling_interval = AbstractToken._get_polling_interval
+
+    def get_polling_interval(self, step):
+        steps.append(step)
+        return original_get_polling_interval(self, step)
+
+    monkeypatch.setattr(AbstractToken, '_get_polling_interval', get_polling_interval)
+    return steps
+
+
+def test_sync_wait_with_backoff(monkeypatch):
+    steps = collect_polling_steps(monkeypatch)
+
+    ConditionToken(lambda: len(steps) > 8).wait(step=0.001, max_step=0.01)
+
+    assert steps[:6] == [0.001, 0.002, 0.004, 0.008, 0.01, 0.01]
+
+
+def test_async_wait_with_backoff(monkeypatch):
+    steps = collect_polling_steps(monkeypatch)
+
+    asyncio.run(ConditionToken(lambda: len(steps) > 8).wait(step=0.001, max_step=0.01))
+
+    assert steps[:6] == [0.001, 0.002, 0.004, 0.008, 0.01, 0.01]
+
+
+def test_sync_wait_without_backoff_uses_fixed_step(monkeypatch):
+    steps = collect_polling_steps(monkeypatch)
+
+    ConditionToken(lambda: len(steps) > 5).wait(step=0.001)
+
+    assert set(steps) == {0.001}
+
+
+def test_backoff_is_capped_by_deadline():
+    start_time = perf_counter()
+    ConditionToken(lambda: False, TimeoutToken(0.05)).wait(step=0.001, max_step=10)
+    finish_time = perf_counter()
+
+    assert 0.05 <= finish_time - start_time < 1
+
+
+def test_backoff_is_capped_by_timeout_of_waiting():
+    start_time = perf_counter()
+    with pytest.raises(TimeoutCancellationError):
+        asyncio.run(ConditionToken(lambda: False).wait(step=0.001, max_step=10, timeout=0.05))
+    finish_time = perf_counter()
+
+    assert 0.05 <= finish_time - start_time < 1
+
+
+def test_backoff_does_not_delay_manual_cancellation():
+    token = ConditionToken(lambda: False)
+    timer = Timer(0.1, token.cancel)
+    timer.start()
+
+    start_time = perf_counter()
+    token.wait(step=0.001, max_step=10)
+    finish_time = perf_counter()
+    timer.join()
+
+    assert finish_time - start_time < 1
+
+
+def test_indirect_polling_with_rollback_by_default():
+    class LimitedToken(AbstractToken):
+        _rollback_if_nondirect_polling = True
+
+        def __init__(self, budget):
+            super().__init__()
+            self.budget = budget
+
+        def _superpower(self):
+            if not self.budget:
+                return True
+            self.budget -= 1
+            return False
+
+        def _get_superpower_data(self):
+            return {'budget': self.budget}
+
+        def _superpower_rollback(self, superpower_data):
+            self.budget = superpower_data['budget']
+
+        def _text_representation_of_superpower(self):
+            return str(self.budget)
+
+        def _get_superpower_exception_message(self):
+            return 'The budget is over.'  # pragma: no cover
+
+    token = LimitedToken(1)
+    parent = SimpleToken(token)
+
+    assert parent.keep_on()
+    assert parent.keep_on()
+    assert token.budget == 1
+
+    assert token.keep_on()
+    assert not parent.keep_on()
+    assert token.budget == 0
+
+
+@pytest.mark.parametrize(
+    'check_every',
+    [1, 2, 3, 7, 10, 100],
+)
+@pytest.mark.parametrize(
+    ('iterable_fabric', 'expected_items'),
+    [
+        (list, []),
+        (lambda: [1], [1]),
+        (lambda: list(range(10)), list(range(10))),
+        (lambda: range(10), list(range(10))),
+        (lambda: 'abcdefghij', list('abcdefghij')),
+        (lambda: (x for x in range(10)), list(range(10))),
+    ],
+)
+def test_iterate_yields_all_items(iterable_fabric, expected_items, check_every):
+    assert list(SimpleToken().iterate(iterable_fabric(), check_every=check_every)) == expected_items
+
+
+@pytest.mark.parametrize(
+    'check_every',
+    [0, -1],
+)
+def test_iterate_with_wrong_check_every(check_every):
+    with pytest.raises(ValueError, match=match('The number of items per check must be greater than zero.')):
+        SimpleToken().iterate([1, 2, 3], check_every=check_every)
+
+
+def collect_items_until_cancellation(token, iterable, check_every, cancel_after=None):
+    items = []
+    exception = None
+
+    try:
+        for item in token.iterate(iterable, check_every=check_every):
+            items.append(item)
+            if len(items) == cancel_after:
+                token.cancel()
+    except CancellationError as error:
+        exception = error
+
+    return items, exception
+
+
+@pytest.mark.parametrize(
+    ('check_every', 'cancel_after', 'expected_items'),
+    [
+        (1, 3, [0, 1, 2]),
+        (3, 1, [0, 1, 2]),
+        (3, 3, [0, 1, 2]),
+        (3, 4, [0, 1, 2, 3, 4, 5]),
+        (5, 7, [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]),
+    ],
+)
+def test_iterate_checks_every_n_items(check_every, cancel_after, expected_items):
+    items, exception = collect_items_until_cancellation(SimpleToken(), range(100), check_every, cancel_after)
+
+    assert items == expected_items
+    assert type(exception) is CancellationError
+
+
+@pytest.mark.parametrize(
+    'check_every',
+    [1, 10],
+)
+def test_iterate_of_cancelled_token_yields_nothing(check_every):
+    items, exception = collect_items_until_cancellation(SimpleToken(cancelled=True), range(100), check_every)
+
+    assert items == []
+    assert type(exception) is CancellationError
+
+
+def test_iterate_raises_exception_of_token_type():
+    items, exception = collect_items_until_cancellation(SimpleToken(TimeoutToken(0)), range(100), 10)
+
+    assert items == []
+    assert type(exception) is TimeoutCancellationError
+
+
+def test_iterate_counter_token_counts_checks():
+    items, exception = collect_items_until_cancellation(CounterToken(3), range(100), 10)
+
+    assert items == list(range(30))
+    assert type(exception) is CounterCancellationError
+
+
+def test_iterate_checks_token_once_per_batch(monkeypatch):
+    calls = []
+    token = SimpleToken()
+    original_check = SimpleToken.check
+
+    def check(self):
+        calls.append(self)
+        original_check(self)
+
+    monkeypatch.setattr(SimpleToken, 'check', check)
+
+    assert list(token.iterate(range(25), check_every=10)) == list(range(25))
+    assert len(calls) == 3
@@ -0,0 +1,72 @@
+from threading import Event, Thread
+
+from cantok import SimpleToken
+from cantok.tokens.abstract.callback import CancellationCallback
+
+
+def test_callback_is_called_once():
+    calls = []
+    token = SimpleToken()
+    handle = CancellationCallback(token, lambda: calls.append(1))
+    token._add_listener(handle)
+
+    assert handle.active
+
+    handle()
+    handle()
+
+    assert calls == [1]
+    assert not handle.active
+    assert not token._listeners
+
+
+def test_unregister_callback():
+    calls = []
+    token = SimpleToken()
+    handle = token.on_cancel(lambda: calls.append(1))
+
+    assert handle.unregister()
+    assert not handle.active
+    assert not token._listeners
+    assert not handle.unregister()
+
+    token.cancel()
+
+    assert calls == []
+
+
+def test_unregister_called_callback():
+    token = SimpleToken()
+    handle = token.on_cancel(lambda: None)
+    token.cancel()
+
+    assert not handle.unregister()
+
+
+def test_called_callback_is_removed_from_token():
+    token = SimpleToken()
+    token.on_cancel(lambda: None)
+    token.cancel()
+
+    assert not token._listeners
+
+
+def test_callback_is_called_once_from_many_threads():
+    calls = []
+    token = SimpleToken()
+    handle = CancellationCallback(token, lambda: calls.append(1))
+    token._add_listener(handle)
+    start = Event()
+
+    def call():
+        start.wait()
+        handle()
+
+    threads = [Thread(target=call) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    start.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [1]
@@ -5,6 +5,7 @@ from contextlib import redirect_stdout
 import pytest
 
 from cantok import ConditionToken, CounterToken, SimpleToken, TimeoutToken
+from cantok.tokens.abstract.coroutine_wrapper import WaitCoroutineWrapper
 
 
 @pytest.mark.parametrize(
@@ -26,3 +27,19 @@ def test_displayhook_printing_coroutine_wrappers_and_other_objects(create_value,
     output = buffer.getvalue()
 
     assert output == expected_string
+
+
+@pytest.mark.parametrize(
+    ('arguments', 'expected_step'),
+    [
+        ((0.001, None, 0.001, 0.001, False), 0.001),
+        ((0.001, 0.01, 0.001, 0.001, False), 0.002),
+        ((0.001, 0.01, 0.008, 0.008, False), 0.01),
+        ((0.001, 0.01, 0.01, 0.01, False), 0.01),
+        ((0.001, 0.01, 0.008, 0.008, True), 0.001),
+        ((0.001, 0.01, 0.008, 0.005, False), 0.001),
+        ((0.001, 0.01, 0.008, None, False), 0.001),
+    ],
+)
+def test_get_next_step(arguments, expected_step):
+    assert WaitCoroutineWrapper.get_next_step(*arguments) == expected_step
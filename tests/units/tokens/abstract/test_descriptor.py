@@ -0,0 +1,221 @@
+import gc
+import os
+import select
+import selectors
+import weakref
+from threading import Timer, active_count
+from time import perf_counter
+
+import pytest
+
+from cantok import ConditionToken, CounterToken, SimpleToken, TimeoutToken
+from cantok.tokens.abstract.descriptor import CancellationDescriptor, _descriptors
+from cantok.tokens.abstract.watcher import watcher
+
+
+def is_readable(file, timeout=0):
+    return bool(select.select([file], [], [], timeout)[0])
+
+
+def is_closed(descriptor):
+    if descriptor._sockets is not None:
+        return all(item.fileno() == -1 for item in descriptor._sockets)
+    try:
+        os.fstat(descriptor.fileno())
+    except OSError:
+        return True
+    return False
+
+
+@pytest.fixture(params=['eventfd', 'sockets'])
+def kind_of_descriptor(request, monkeypatch):
+    if request.param == 'sockets':
+        monkeypatch.delattr(os, 'eventfd', raising=False)
+    elif not hasattr(os, 'eventfd'):
+        pytest.skip('eventfd is not available here.')  # pragma: no cover
+    return request.param
+
+
+def test_descriptor_is_signalled_once(kind_of_descriptor):
+    descriptor = CancellationDescriptor()
+
+    assert (descriptor._sockets is None) == (kind_of_descriptor == 'eventfd')
+    assert not is_readable(descriptor)
+
+    descriptor.signal()
+    descriptor.signal()
+
+    assert is_readable(descriptor)
+    assert is_readable(descriptor)
+
+    descriptor.close()
+    descriptor.close()
+    descriptor.signal()
+
+    assert is_closed(descriptor)
+
+
+def test_fileno_is_the_same_for_one_token():
+    token = SimpleToken()
+
+    assert token.fileno() == token.fileno()
+    assert token.fileno() != SimpleToken().fileno()
+
+
+@pytest.mark.usefixtures('kind_of_descriptor')
+def test_manual_cancellation():
+    token = SimpleToken()
+
+    assert not is_readable(token)
+
+    token.cancel()
+
+    assert is_readable(token)
+
+
+def test_cancellation_of_nested_token():
+    nested_token = SimpleToken()
+    token = SimpleToken(SimpleToken(nested_token))
+
+    assert not is_readable(token)
+
+    nested_token.cancel()
+
+    assert is_readable(token)
+
+
+def test_already_cancelled_token():
+    assert is_readable(SimpleToken(cancelled=True))
+    assert is_readable(SimpleToken(SimpleToken(cancelled=True)))
+    assert is_readable(TimeoutToken(0))
+
+
+def test_cancellation_from_another_thread_wakes_up_select():
+    token = SimpleToken()
+    timer = Timer(0.05, token.cancel)
+    timer.start()
+
+    start_time = perf_counter()
+    assert is_readable(token, 5)
+    finish_time = perf_counter()
+    timer.join()
+
+    assert finish_time - start_time < 1
+
+
+@pytest.mark.parametrize(
+    'token_fabric',
+    [
+        lambda: TimeoutToken(0.05),
+        lambda: TimeoutToken(0.05, monotonic=True),
+        lambda: SimpleToken(TimeoutToken(0.05), TimeoutToken(10)),
+    ],
+)
+def test_timeout(token_fabric):
+    token = token_fabric()
+
+    start_time = perf_counter()
+    assert is_readable(token, 5)
+    finish_time = perf_counter()
+
+    assert 0.05 <= finish_time - start_time < 1
+
+
+def test_condition():
+    flag = []
+    token = ConditionToken(lambda: bool(flag))
+    timer = Timer(0.05, flag.append, args=(1,))
+    timer.start()
+
+    assert not is_readable(token)
+
+    start_time = perf_counter()
+    assert is_readable(token, 5)
+    finish_time = perf_counter()
+    timer.join()
+
+    assert finish_time - start_time < 1
+
+
+@pytest.mark.parametrize(
+    'direct',
+    [True, False],
+)
+@pytest.mark.parametrize(
+    'wrapper',
+    [
+        lambda token: token,
+        lambda token: SimpleToken(token, ConditionToken(lambda: False)),
+    ],
+)
+def test_watcher_does_not_consume_counter(direct, wrapper):
+    counter_token = CounterToken(3, direct=direct)
+    token = wrapper(counter_token)
+    token.fileno()
+
+    assert not is_readable(token, 0.1)
+    assert counter_token.counter == 3
+
+
+def test_spent_counter_is_found_out_by_watcher():
+    token = SimpleToken(CounterToken(1, direct=False), ConditionToken(lambda: False))
+    token.fileno()
+
+    assert token
+
+    assert is_readable(token, 5)
+
+
+def test_one_watcher_thread_for_many_tokens():
+    number_of_threads = active_count()
+    tokens = [ConditionToken(lambda: False, TimeoutToken(15)) for _ in range(10)]
+
+    for token in tokens:
+        token.fileno()
+
+    assert active_count() <= number_of_threads + 1
+    assert all(token in watcher._tokens_to_poll for token in tokens)
+
+
+def test_watcher_does_not_keep_tokens_alive():
+    tokens = [ConditionToken(lambda: False) for _ in range(10)]
+    for token in tokens:
+        token.fileno()
+    descriptors = [_descriptors[token] for token in tokens]
+    references = [weakref.ref(token) for token in tokens]
+
+    del token, tokens
+    start_time = perf_counter()
+    while any(reference() is not None for reference in references) and perf_counter() - start_time < 5:
+        # The watcher may be polling the tokens right now.
+        gc.collect()
+
+    assert all(reference() is None for reference in references)
+    assert all(is_closed(descriptor) for descriptor in descriptors)
+
+
+@pytest.mark.usefixtures('kind_of_descriptor')
+def test_token_in_selector():
+    token = SimpleToken()
+    with selectors.DefaultSelector() as selector:
+        selector.register(token, selectors.EVENT_READ)
+
+        assert selector.select(0) == []
+
+        token.cancel()
+
+        assert [key.fileobj for key, _ in selector.select(0)] == [token]
+
+
+@pytest.mark.usefixtures('kind_of_descriptor')
+def test_descriptor_is_closed_with_token():
+    token = SimpleToken()
+    token.fileno()
+    descriptor = _descriptors[token]
+
+    assert not is_closed(descriptor)
+
+    del token
+    gc.collect()
+
+    assert is_closed(descriptor)
@@ -0,0 +1,186 @@
+from time import perf_counter, sleep
+
+import pytest
+from full_match import match
+
+from cantok import (
+    CancellationError,
+    CounterToken,
+    PollGate,
+    SimpleToken,
+    TimeoutCancellationError,
+    TimeoutToken,
+)
+from cantok.tokens.abstract import poll_gate as poll_gate_module
+
+
+@pytest.mark.parametrize(
+    'max_latency',
+    [0, -1],
+)
+def test_wrong_max_latency(max_latency):
+    with pytest.raises(ValueError, match=match('The maximum latency must be greater than zero.')):
+        SimpleToken().gate(max_latency=max_latency)
+
+
+def test_gate_is_created_by_token():
+    token = SimpleToken()
+    gate = token.gate()
+
+    assert isinstance(gate, PollGate)
+    assert gate._token is token
+    assert gate._max_latency == 0.005
+
+
+def test_first_check_is_real():
+    assert not SimpleToken(cancelled=True).gate()
+
+    with pytest.raises(CancellationError):
+        SimpleToken(cancelled=True).gate().check()
+
+
+def test_gate_of_not_cancelled_token():
+    gate = SimpleToken().gate()
+
+    for _ in range(1000):
+        assert gate
+        gate.check()
+
+
+class FakeClock:
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self):
+        return self.time
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(poll_gate_module, 'perf_counter', clock)
+    return clock
+
+
+def run_iterations(gate, clock, number_of_iterations, iteration_time):
+    for _ in range(number_of_iterations):
+        assert gate
+        clock.time += iteration_time
+
+
+def test_batch_adapts_to_speed_of_iterations(clock):
+    gate = SimpleToken().gate(max_latency=1)
+
+    run_iterations(gate, clock, 10000, 0.001)
+
+    assert 900 <= gate._batch <= 1000
+
+    run_iterations(gate, clock, 1000, 0.1)
+
+    assert 9 <= gate._batch <= 10
+
+    run_iterations(gate, clock, 1000, 0.01)
+
+    assert 90 <= gate._batch <= 100
+
+
+def test_batch_grows_if_clock_does_not_move(clock):
+    gate = SimpleToken().gate(max_latency=1)
+
+    run_iterations(gate, clock, 7, 0)
+
+    assert gate._batch == 8
+
+
+def test_batch_grows_at_most_twice_at_a_time():
+    gate = SimpleToken().gate(max_latency=100)
+    batches = []
+
+    for _ in range(100):
+        assert gate
+        batches.append(gate._batch)
+
+    assert batches[:6] == [2, 2, 4, 4, 4, 4]
+
+
+def test_batch_is_never_empty():
+    gate = SimpleToken().gate(max_latency=0.0001)
+
+    for _ in range(3):
+        sleep(0.001)
+        assert gate
+
+    assert gate._batch == 1
+
+
+@pytest.mark.parametrize(
+    'use_check',
+    [False, True],
+)
+def test_cancellation_is_noticed_within_max_latency(use_check):
+    token = SimpleToken(TimeoutToken(0.1))
+    gate = token.gate(max_latency=0.01)
+    iterations = 0
+
+    start_time = perf_counter()
+    try:
+        while gate:
+            gate.check() if use_check else None
+            iterations += 1
+    except TimeoutCancellationError:
+        pass
+    finish_time = perf_counter()
+
+    assert iterations > 0
+    assert 0.1 <= finish_time - start_time < 0.5
+
+
+def test_cancellation_is_noticed_with_slow_iterations():
+    token = SimpleToken(TimeoutToken(0.05))
+    gate = token.gate(max_latency=0.01)
+
+    start_time = perf_counter()
+    while gate:
+        sleep(0.002)
+    finish_time = perf_counter()
+
+    assert 0.05 <= finish_time - start_time < 0.5
+
+
+def test_gate_checks_every_time_after_cancellation():
+    token = SimpleToken()
+    gate = token.gate(max_latency=100)
+
+    for _ in range(100):
+        assert gate
+
+    token.cancel()
+
+    while gate:
+        pass
+
+    assert not gate
+    assert not gate
+
+    with pytest.raises(CancellationError):
+        gate.check()
+    with pytest.raises(CancellationError):
+        gate.check()
+
+
+def test_check_raises_exception_of_token_type():
+    gate = SimpleToken(TimeoutToken(0)).gate()
+
+    with pytest.raises(TimeoutCancellationError):
+        gate.check()
+
+
+def test_counter_token_counts_real_checks():
+    token = CounterToken(5)
+    gate = token.gate(max_latency=100)
+    iterations = 0
+
+    while gate:
+        iterations += 1
+
+    assert iterations == 2 + 4 + 8 + 16 + 32
@@ -0,0 +1,163 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from multiprocessing import get_context
+from time import sleep
+
+import pytest
+
+from cantok import (
+    ConditionToken,
+    CounterToken,
+    DefaultToken,
+    SharedToken,
+    SimpleToken,
+    TimeoutToken,
+    TokenSnapshot,
+)
+
+
+def restore_and_wait(snapshot):
+    token = snapshot.restore()
+    token.wait(timeout=10)
+    return repr(token)
+
+
+def restore_and_cancel(snapshot):
+    snapshot.restore().cancel()
+
+
+def copy(snapshot):
+    return pickle.loads(pickle.dumps(snapshot))
+
+
+@pytest.mark.parametrize(
+    ('token_fabric', 'expected_repr'),
+    [
+        (SimpleToken, 'SimpleToken({channel})'),
+        (partial(CounterToken, 5), 'CounterToken(5, {channel})'),
+        (partial(ConditionToken, lambda: False), 'SimpleToken({channel})'),
+        (DefaultToken, 'SimpleToken({channel})'),
+        (partial(SimpleToken, SimpleToken(), CounterToken(3)), 'SimpleToken(SimpleToken(), CounterToken(3), {channel})'),
+    ],
+)
+def test_restore_token(token_fabric, expected_repr):
+    snapshot = copy(token_fabric().snapshot())
+    token = snapshot.restore()
+
+    assert repr(token) == expected_repr.format(channel='SharedToken()')
+    assert token
+
+
+@pytest.mark.parametrize(
+    'token_fabric',
+    [
+        partial(SimpleToken, cancelled=True),
+        partial(CounterToken, 0),
+        partial(ConditionToken, lambda: True),
+        partial(TimeoutToken, 0),
+        partial(SimpleToken, SimpleToken(cancelled=True)),
+    ],
+)
+def test_restore_cancelled_token(token_fabric):
+    snapshot = copy(token_fabric().snapshot())
+
+    assert not snapshot.restore()
+    assert snapshot.channel.cancelled
+
+
+@pytest.mark.parametrize(
+    'monotonic',
+    [True, False],
+)
+def test_restored_timeout_token_has_the_same_deadline(monotonic):
+    token = SimpleToken(TimeoutToken(5, monotonic=monotonic), TimeoutToken(3, monotonic=monotonic))
+    sleep(0.1)
+    restored_token = copy(token.snapshot()).restore()
+
+    assert 2.5 < restored_token.remaining() <= 2.9
+    assert abs(restored_token.remaining() - token.remaining()) < 0.05
+    assert [nested_token._monotonic for nested_token in restored_token._tokens[:2]] == [monotonic, monotonic]
+
+
+def test_restored_shared_token_is_shared():
+    shared_token = SharedToken()
+    token = SimpleToken(shared_token, SimpleToken())
+    restored_token = copy(token.snapshot()).restore()
+
+    assert restored_token
+
+    shared_token.cancel()
+
+    assert not restored_token
+
+
+def test_channel_is_cancelled_with_original_token():
+    nested_token = SimpleToken()
+    snapshot = SimpleToken(nested_token).snapshot()
+    restored_token = copy(snapshot).restore()
+
+    assert restored_token
+    assert not snapshot.channel.cancelled
+
+    nested_token.cancel()
+
+    assert snapshot.channel.cancelled
+    assert not restored_token
+
+
+def test_channel_is_cancelled_with_restored_token():
+    token = SimpleToken()
+    snapshot = token.snapshot()
+    restored_token = copy(snapshot).restore()
+    another_restored_token = copy(snapshot).restore()
+
+    restored_token.cancel()
+
+    assert snapshot.channel.cancelled
+    assert not another_restored_token
+    assert token
+
+
+def test_closed_snapshot_is_not_linked_with_original_token():
+    token = SimpleToken()
+    snapshot = token.snapshot()
+
+    assert token._listeners
+
+    snapshot.close()
+    copy(snapshot).close()
+
+    assert not token._listeners
+
+    token.cancel()
+
+    assert not snapshot.channel.cancelled
+
+
+def test_snapshot_type():
+    snapshot = SimpleToken().snapshot()
+
+    assert isinstance(snapshot, TokenSnapshot)
+    assert isinstance(snapshot.channel, SharedToken)
+
+
+def test_restore_in_other_process():
+    token = SimpleToken(TimeoutToken(15), CounterToken(1000))
+    snapshot = token.snapshot()
+
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as executor:
+        future = executor.submit(restore_and_wait, snapshot)
+        sleep(0.1)
+        token.cancel()
+
+        assert future.result(timeout=30).startswith('SimpleToken(TimeoutToken(')
+
+
+def test_restored_token_is_cancelled_in_other_process():
+    snapshot = SimpleToken().snapshot()
+
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as executor:
+        executor.submit(restore_and_cancel, snapshot).result(timeout=30)
+
+    assert snapshot.channel.cancelled
@@ -0,0 +1,230 @@
+from threading import Event, Thread
+from time import perf_counter, sleep
+
+import pytest
+from full_match import match
+
+from cantok import (
+    CancellationError,
+    ConditionCancellationError,
+    ConditionToken,
+    CounterCancellationError,
+    CounterToken,
+    SimpleToken,
+    TimeoutCancellationError,
+    TimeoutToken,
+)
+from cantok.tokens.abstract.thread_binding import get_exception_type
+
+
+class StubbornThread(Thread):
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.exception = None
+        self.stop = Event()
+
+    def run(self):
+        try:
+            while not self.stop.is_set():
+                sleep(0.001)
+        except CancellationError as error:
+            self.exception = error
+
+
+def test_bind_not_started_thread():
+    with pytest.raises(ValueError, match=match('The thread must be started before binding.')):
+        SimpleToken().bind_thread(Thread(target=lambda: None))
+
+
+def test_bind_thread_with_negative_step():
+    thread = StubbornThread()
+    thread.start()
+
+    with pytest.raises(ValueError, match=match('The token polling iteration time cannot be less than zero.')):
+        SimpleToken().bind_thread(thread, step=-1)
+
+    thread.stop.set()
+    thread.join()
+
+
+def test_manual_cancellation_stops_thread():
+    token = SimpleToken()
+    thread = StubbornThread()
+    thread.start()
+    token.bind_thread(thread)
+
+    token.cancel()
+    thread.join(5)
+
+    assert not thread.is_alive()
+    assert type(thread.exception).__mro__[1] is CancellationError
+    assert str(thread.exception) == 'The token has been cancelled.'
+    assert thread.exception.token is token
+
+
+def test_cancellation_of_nested_token_stops_thread():
+    nested_token = SimpleToken()
+    thread = StubbornThread()
+    thread.start()
+    SimpleToken(nested_token).bind_thread(thread)
+
+    nested_token.cancel()
+    thread.join(5)
+
+    assert not thread.is_alive()
+    assert thread.exception.token is nested_token
+
+
+def test_timeout_stops_thread():
+    token = TimeoutToken(0.05)
+    thread = StubbornThread()
+    thread.start()
+
+    start_time = perf_counter()
+    token.bind_thread(thread)
+    thread.join(5)
+    finish_time = perf_counter()
+
+    assert not thread.is_alive()
+    assert 0.05 <= finish_time - start_time < 1
+    assert isinstance(thread.exception, TimeoutCancellationError)
+    assert str(thread.exception) == 'The timeout of 0.05 seconds has expired.'
+    assert thread.exception.token is token
+
+
+def test_condition_stops_thread():
+    flag = Event()
+    token = ConditionToken(flag.is_set)
+    thread = StubbornThread()
+    thread.start()
+    token.bind_thread(thread)
+
+    sleep(0.01)
+    assert thread.is_alive()
+
+    flag.set()
+    thread.join(5)
+
+    assert not thread.is_alive()
+    assert isinstance(thread.exception, ConditionCancellationError)
+
+
+@pytest.mark.parametrize(
+    'direct',
+    [True, False],
+)
+def test_watcher_does_not_consume_counter(direct):
+    token = CounterToken(5, direct=direct)
+    thread = StubbornThread()
+    thread.start()
+    binding = token.bind_thread(thread)
+
+    sleep(0.1)
+
+    assert token.counter == 5
+    assert thread.is_alive()
+
+    binding.cancel()
+    thread.stop.set()
+    thread.join()
+
+    assert thread.exception is None
+
+
+def test_watcher_finds_out_spent_counter():
+    token = CounterToken(1, direct=False)
+    thread = StubbornThread()
+    thread.start()
+    token.bind_thread(thread)
+
+    assert token
+
+    thread.join(5)
+
+    assert not thread.is_alive()
+    assert isinstance(thread.exception, CounterCancellationError)
+
+
+def test_unbinding():
+    token = SimpleToken()
+    thread = StubbornThread()
+    thread.start()
+    binding = token.bind_thread(thread)
+
+    binding.cancel()
+    sleep(0.01)
+    token.cancel()
+    sleep(0.01)
+
+    assert thread.is_alive()
+
+    thread.stop.set()
+    thread.join()
+
+    assert thread.exception is None
+    assert token._listeners == []
+
+
+def test_finished_thread_is_not_touched():
+    token = TimeoutToken(0.05)
+    thread = StubbornThread()
+    thread.start()
+    token.bind_thread(thread)
+
+    thread.stop.set()
+    thread.join()
+    sleep(0.1)
+
+    assert thread.exception is None
+
+
+@pytest.mark.parametrize(
+    'token',
+    [
+        SimpleToken(),
+        SimpleToken(TimeoutToken(15)),
+        ConditionToken(lambda: False),
+    ],
+)
+def test_watchers_end_with_finished_threads(token):
+    threads = [Thread(target=sleep, args=(0.01,)) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+        token.bind_thread(thread)
+    for thread in threads:
+        thread.join()
+
+    start_time = perf_counter()
+    while token._listeners and perf_counter() - start_time < 5:
+        sleep(0.01)
+
+    assert token._listeners == []
+
+
+def test_already_cancelled_token_stops_thread_at_once():
+    thread = StubbornThread()
+    thread.start()
+    SimpleToken(cancelled=True).bind_thread(thread)
+
+    thread.join(5)
+
+    assert not thread.is_alive()
+    assert isinstance(thread.exception, CancellationError)
+
+
+@pytest.mark.parametrize(
+    ('token', 'expected_base', 'expected_message'),
+    [
+        (SimpleToken(cancelled=True), CancellationError, 'The token has been cancelled.'),
+        (TimeoutToken(0), TimeoutCancellationError, 'The timeout of 0 seconds has expired.'),
+        (CounterToken(0), CounterCancellationError, 'After 0 attempts, the counter was reset to zero.'),
+    ],
+)
+def test_get_exception_type(token, expected_base, expected_message):
+    exception_type = get_exception_type(token._get_report(direct=True))
+    exception = exception_type()
+
+    assert exception_type.__mro__[1] is expected_base
+    assert exception_type.__name__ == expected_base.__name__
+    assert str(exception) == expected_message
+    assert exception.token is token
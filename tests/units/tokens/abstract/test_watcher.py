@@ -0,0 +1,212 @@
+import gc
+import os
+import sys
+from multiprocessing import get_context
+from threading import Event
+from time import perf_counter, sleep
+
+import pytest
+
+from cantok import ConditionToken, SimpleToken, TimeoutToken
+from cantok.tokens.abstract.watcher import (
+    WATCHER_MAX_STEP,
+    WATCHER_STEP,
+    Watcher,
+    watcher,
+)
+
+
+def wait_for_thread_end(watcher_for_wait):
+    thread = watcher_for_wait._thread
+    if thread is not None:
+        thread.join(5)
+    assert watcher_for_wait._thread is None
+
+
+def test_token_without_deadline_is_not_watched():
+    new_watcher = Watcher()
+    new_watcher.watch(SimpleToken())
+
+    assert new_watcher._thread is None
+    assert new_watcher._deadlines == []
+
+
+def test_one_thread_for_many_tokens():
+    new_watcher = Watcher()
+    tokens = [TimeoutToken(0.01 * index) for index in range(1, 21)]
+    called = [Event() for _ in tokens]
+
+    for token, event in zip(tokens, called):
+        token._add_listener(event.set)
+        new_watcher.watch(token)
+    thread = new_watcher._thread
+
+    for token in tokens:
+        new_watcher.watch(token)
+        assert new_watcher._thread is thread
+
+    for event in called:
+        assert event.wait(5)
+    wait_for_thread_end(new_watcher)
+    assert new_watcher._deadlines == []
+
+
+def test_token_is_watched_once():
+    new_watcher = Watcher()
+    token = TimeoutToken(15)
+
+    new_watcher.watch(token)
+    new_watcher.watch(token)
+    new_watcher.watch(SimpleToken(token))
+
+    assert len(new_watcher._deadlines) == 2
+
+
+def test_earlier_deadline_reschedules_token():
+    new_watcher = Watcher()
+    called = Event()
+    token = SimpleToken(TimeoutToken(15))
+    token._add_listener(called.set)
+    new_watcher.watch(token)
+
+    token._embed_tokens([TimeoutToken(0.05)])
+    new_watcher.watch(token)
+
+    assert called.wait(5)
+    assert len(new_watcher._deadlines) == 1
+    assert not new_watcher._scheduled
+
+
+def test_token_is_checked_again_if_it_is_not_cancelled_at_deadline():
+    class LateToken(SimpleToken):
+        checks = 0
+
+        def _peek_report(self):
+            LateToken.checks += 1
+            if LateToken.checks == 1:
+                return None
+            return super()._peek_report()
+
+    new_watcher = Watcher()
+    called = Event()
+    token = LateToken(TimeoutToken(0.01))
+    token._add_listener(called.set)
+    new_watcher.watch(token)
+
+    assert called.wait(5)
+    assert LateToken.checks == 2
+    wait_for_thread_end(new_watcher)
+
+
+def test_watcher_does_not_keep_token_alive():
+    new_watcher = Watcher()
+    new_watcher.watch(TimeoutToken(0.2))
+    gc.collect()
+
+    assert not new_watcher._scheduled
+    wait_for_thread_end(new_watcher)
+
+
+def test_failed_callback_does_not_stop_watcher(monkeypatch):
+    errors = []
+    monkeypatch.setattr(sys, 'excepthook', lambda *arguments: errors.append(arguments[1]))
+    new_watcher = Watcher()
+    called = Event()
+    first_token = TimeoutToken(0.01)
+    second_token = TimeoutToken(0.05)
+
+    def fail():
+        raise ValueError('kek')
+
+    first_token._add_listener(fail)
+    second_token._add_listener(called.set)
+    new_watcher.watch(first_token)
+    new_watcher.watch(second_token)
+
+    assert called.wait(5)
+    assert len(errors) == 1
+    assert isinstance(errors[0], ValueError)
+
+
+def test_reset_forgets_tokens():
+    new_watcher = Watcher()
+    new_watcher.watch(TimeoutToken(15))
+
+    new_watcher._reset()
+
+    assert new_watcher._thread is None
+    assert new_watcher._deadlines == []
+
+
+def wait_for_deadline_in_child_process():
+    called = Event()
+    token = TimeoutToken(0.01)
+    token.on_cancel(called.set)
+    return called.wait(5)
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='There is no fork() on this platform.')
+def test_watcher_works_in_forked_process():
+    token = TimeoutToken(15)
+    token.on_cancel(lambda: None)
+    assert watcher._thread is not None
+
+    context = get_context('fork')
+    with context.Pool(1) as pool:
+        start_time = perf_counter()
+        assert pool.apply(wait_for_deadline_in_child_process)
+        assert perf_counter() - start_time < 5
+
+
+def test_only_tokens_with_something_to_poll_are_polled():
+    new_watcher = Watcher()
+    new_watcher.watch(SimpleToken(), poll=True)
+    new_watcher.watch(TimeoutToken(15), poll=True)
+
+    assert not new_watcher._tokens_to_poll
+    assert len(new_watcher._deadlines) == 1
+
+
+def test_polled_token_is_forgotten_when_cancelled():
+    new_watcher = Watcher()
+    flag = Event()
+    called = Event()
+    token = SimpleToken(ConditionToken(flag.is_set))
+    token._add_listener(called.set)
+    new_watcher.watch(token, poll=True)
+    new_watcher.watch(token, poll=True)
+
+    assert list(new_watcher._tokens_to_poll) == [token]
+
+    flag.set()
+
+    assert called.wait(5)
+    wait_for_thread_end(new_watcher)
+    assert not new_watcher._tokens_to_poll
+
+
+def test_polled_token_is_cancelled_at_deadline():
+    new_watcher = Watcher()
+    called = Event()
+    token = ConditionToken(lambda: False, TimeoutToken(0.05))
+    token._add_listener(called.set)
+    new_watcher.watch(token, poll=True)
+
+    assert called.wait(5)
+    wait_for_thread_end(new_watcher)
+
+
+def test_polling_interval_grows_and_is_reset_by_new_token():
+    new_watcher = Watcher()
+    token = ConditionToken(lambda: False)
+    new_watcher.watch(token, poll=True)
+
+    sleep(0.2)
+
+    with new_watcher._condition:
+        assert new_watcher._step == WATCHER_MAX_STEP
+
+        other_token = ConditionToken(lambda: False)
+        new_watcher.watch(other_token, poll=True)
+
+        assert new_watcher._step == WATCHER_STEP
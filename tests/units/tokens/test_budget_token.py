@@ -0,0 +1,282 @@
+import asyncio
+from threading import Barrier, Thread, Timer
+from time import perf_counter, sleep
+
+import pytest
+from full_match import match
+
+from cantok import (
+    BudgetCancellationError,
+    BudgetToken,
+    CancellationError,
+    SimpleToken,
+    TimeoutCancellationError,
+    TimeoutToken,
+    TokenGroup,
+)
+from cantok.tokens.abstract.abstract_token import CancelCause
+
+
+def test_budget_less_than_zero():
+    with pytest.raises(ValueError, match=match('The budget must be greater than or equal to zero.')):
+        BudgetToken(-1)
+
+
+def test_consume_less_than_zero():
+    with pytest.raises(ValueError, match=match('The amount to consume must be greater than or equal to zero.')):
+        BudgetToken(10).consume(-1)
+
+
+def test_zero_budget():
+    token = BudgetToken(0)
+
+    assert token.cancelled
+    assert not token.keep_on()
+    assert token._get_report(True).cause == CancelCause.SUPERPOWER
+
+    with pytest.raises(BudgetCancellationError, match=match('The budget of 0 has been spent.')):
+        token.check()
+
+
+@pytest.mark.parametrize(
+    ('budget', 'amounts', 'expected_cancelled'),
+    [
+        (10, [], False),
+        (10, [9], False),
+        (10, [10], True),
+        (10, [11], True),
+        (10, [5, 4], False),
+        (10, [5, 5], True),
+        (10, [1] * 10, True),
+        (1.5, [0.5, 0.5], False),
+        (1.5, [0.5, 0.5, 0.5], True),
+    ],
+)
+def test_consume(budget, amounts, expected_cancelled):
+    token = BudgetToken(budget)
+
+    for amount in amounts:
+        token.consume(amount)
+
+    assert token.cancelled == expected_cancelled
+    assert token.budget == budget - sum(amounts)
+
+
+def test_consume_one_by_default():
+    token = BudgetToken(3)
+
+    while token:
+        token.consume()
+
+    assert token.budget == 0
+
+
+def test_checking_does_not_spend_budget():
+    token = BudgetToken(5)
+
+    for _ in range(10):
+        assert token.keep_on()
+        token.check()
+        assert not token.cancelled
+
+    assert token.budget == 5
+
+
+def test_check_spent_budget():
+    token = BudgetToken(100)
+    token.consume(150)
+
+    with pytest.raises(BudgetCancellationError, match=match('The budget of 100 has been spent.')) as exception_info:
+        token.check()
+
+    assert exception_info.value.token is token
+    assert token.budget == -50
+
+
+def test_check_spent_budget_from_parent():
+    token = BudgetToken(100)
+    parent = SimpleToken(token)
+    token.consume(100)
+
+    assert parent.cancelled
+
+    with pytest.raises(BudgetCancellationError) as exception_info:
+        parent.check()
+
+    assert exception_info.value.token is token
+
+
+def test_spending_notifies_parents_and_callbacks():
+    calls = []
+    token = BudgetToken(10)
+    parent = SimpleToken(token)
+    token.on_cancel(lambda: calls.append('token'))
+    parent.on_cancel(lambda: calls.append('parent'))
+
+    token.consume(5)
+
+    assert calls == []
+
+    token.consume(5)
+    token.consume(5)
+
+    assert sorted(calls) == ['parent', 'token']
+
+
+def test_budget_token_is_not_polled_by_parents():
+    token = BudgetToken(10)
+    parent = SimpleToken(token)
+
+    assert not parent._needs_polling()
+    assert parent._tokens_to_poll == ()
+
+
+def test_budget_token_in_group():
+    group = TokenGroup()
+    token = BudgetToken(10)
+    other_token = BudgetToken(10)
+    group.add(token)
+    group.add(other_token)
+
+    assert group.pop_cancelled() == []
+
+    token.consume(10)
+
+    assert group.pop_cancelled() == [token]
+
+
+def test_budget_token_with_timeout():
+    token = BudgetToken(10, TimeoutToken(0.01))
+
+    sleep(0.02)
+
+    assert token.cancelled
+    assert token.budget == 10
+
+    with pytest.raises(TimeoutCancellationError):
+        token.check()
+
+
+def test_cancelled_budget_token():
+    token = BudgetToken(10, cancelled=True)
+
+    assert token.cancelled
+
+    with pytest.raises(CancellationError, match=match('The token has been cancelled.')):
+        token.check()
+
+
+def test_cancelled_budget_token_keeps_the_first_cause():
+    token = BudgetToken(10)
+    token.cancel()
+    token.consume(10)
+
+    with pytest.raises(CancellationError, match=match('The token has been cancelled.')):
+        token.check()
+
+
+def test_consume_in_many_threads():
+    number_of_threads = 8
+    consumed_per_thread = 1000
+    token = BudgetToken(number_of_threads * consumed_per_thread)
+    barrier = Barrier(number_of_threads)
+    calls = []
+    token.on_cancel(lambda: calls.append(1))
+
+    def work():
+        barrier.wait()
+        for _ in range(consumed_per_thread):
+            token.consume(1)
+
+    threads = [Thread(target=work) for _ in range(number_of_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert token.budget == 0
+    assert token.cancelled
+    assert calls == [1]
+
+
+def test_wait_is_woken_up_by_consume():
+    token = BudgetToken(10)
+    timer = Timer(0.05, token.consume, args=(10,))
+    timer.start()
+
+    start_time = perf_counter()
+    token.wait(step=10)
+    finish_time = perf_counter()
+    timer.join()
+
+    assert finish_time - start_time < 5
+
+
+def test_async_wait_is_woken_up_by_consume():
+    token = BudgetToken(10)
+
+    async def consume():
+        await asyncio.sleep(0.01)
+        token.consume(10)
+
+    async def runner():
+        await asyncio.gather(consume(), token.wait(step=10))
+
+    start_time = perf_counter()
+    asyncio.run(runner())
+    finish_time = perf_counter()
+
+    assert finish_time - start_time < 5
+
+
+@pytest.mark.parametrize(
+    ('token', 'expected_repr'),
+    [
+        (BudgetToken(10), 'BudgetToken(10)'),
+        (BudgetToken(1.5), 'BudgetToken(1.5)'),
+        (BudgetToken(10, cancelled=True), 'BudgetToken(10, cancelled=True)'),
+        (BudgetToken(10, SimpleToken()), 'BudgetToken(10, SimpleToken())'),
+    ],
+)
+def test_repr(token, expected_repr):
+    assert repr(token) == expected_repr
+
+
+def test_repr_after_consume():
+    token = BudgetToken(10)
+    token.consume(3)
+
+    assert repr(token) == 'BudgetToken(7)'
+
+
+def test_str():
+    token = BudgetToken(10)
+
+    assert str(token) == '<BudgetToken (not cancelled)>'
+
+    token.consume(10)
+
+    assert str(token) == '<BudgetToken (cancelled)>'
+
+
+@pytest.mark.parametrize(
+    ('amount', 'expected_budget', 'expected_cancelled'),
+    [
+        (0, 10, False),
+        (3, 7, False),
+        (10, 0, True),
+        (15, 0, True),
+    ],
+)
+def test_snapshot(amount, expected_budget, expected_cancelled):
+    token = BudgetToken(10)
+    token.consume(amount)
+    snapshot = token.snapshot()
+
+    restored_token = snapshot.restore()
+
+    assert isinstance(restored_token, BudgetToken)
+    assert restored_token.budget == expected_budget
+    assert restored_token.cancelled == expected_cancelled
+
+    snapshot.close()
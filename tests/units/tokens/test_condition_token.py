@@ -1,8 +1,10 @@
 import asyncio
 from functools import partial
-from time import perf_counter
+from threading import Event, Timer
+from time import perf_counter, sleep
 
 import pytest
+from full_match import match
 
 from cantok import ConditionCancellationError, ConditionToken, SimpleToken
 from cantok.tokens.abstract.abstract_token import CancelCause, CancellationReport
@@ -473,3 +475,215 @@ def test_repr_for_class_based_function():
             return 'repr_string'
 
     assert repr(ConditionToken(SomeChecker())) == 'ConditionToken(repr_string)'
+
+
+def test_triggered_condition_is_evaluated_on_first_check_only():
+    calls = []
+    token = ConditionToken(lambda: calls.append(1) or False, trigger=Event())
+
+    for _ in range(10):
+        assert token.keep_on()
+
+    assert len(calls) == 1
+
+
+def test_triggered_condition_is_evaluated_after_trigger():
+    flag = []
+    trigger = Event()
+    token = ConditionToken(lambda: bool(flag), trigger=trigger)
+
+    assert not token.cancelled
+
+    flag.append(1)
+
+    assert not token.cancelled
+
+    trigger.set()
+
+    assert token.cancelled
+    assert not trigger.is_set()
+
+
+def test_triggered_condition_uses_last_result_with_disabled_caching():
+    results = [True, False]
+    trigger = Event()
+    token = ConditionToken(lambda: results.pop(0), trigger=trigger, caching=False)
+
+    assert token.cancelled
+    assert token.cancelled
+
+    trigger.set()
+
+    assert not token.cancelled
+    assert not token.cancelled
+
+
+def test_triggered_condition_with_before_and_after():
+    calls = []
+    trigger = Event()
+    token = ConditionToken(lambda: calls.append('function') or False, trigger=trigger, before=lambda: calls.append('before'), after=lambda: calls.append('after'))
+
+    token.check()
+    token.check()
+    trigger.set()
+    token.check()
+
+    assert calls == ['before', 'function', 'after'] * 2
+
+
+def test_recheck():
+    flag = []
+    token = ConditionToken(lambda: bool(flag), trigger=Event())
+
+    assert not token.recheck()
+    assert not token.cancelled
+
+    flag.append(1)
+
+    assert not token.cancelled
+    assert token.recheck()
+    assert token.cancelled
+
+
+def test_recheck_without_trigger():
+    flag = []
+    token = ConditionToken(lambda: bool(flag))
+
+    assert not token.recheck()
+
+    flag.append(1)
+
+    assert token.recheck()
+
+
+def test_recheck_calls_callbacks_and_notifies_parents():
+    flag = []
+    calls = []
+    token = ConditionToken(lambda: bool(flag), trigger=Event())
+    parent = SimpleToken(token)
+    parent.on_cancel(lambda: calls.append('parent'))
+    token.on_cancel(lambda: calls.append('token'))
+
+    flag.append(1)
+
+    assert calls == []
+
+    token.recheck()
+
+    assert sorted(calls) == ['parent', 'token']
+    assert parent.cancelled
+
+
+def test_recheck_wakes_up_waiter():
+    flag = []
+    token = ConditionToken(lambda: bool(flag), trigger=Event())
+
+    def recheck():
+        flag.append(1)
+        token.recheck()
+
+    timer = Timer(0.05, recheck)
+    timer.start()
+    start_time = perf_counter()
+    token.wait(step=10)
+    finish_time = perf_counter()
+    timer.join()
+
+    assert finish_time - start_time < 5
+
+
+def test_recheck_of_cancelled_token():
+    token = ConditionToken(lambda: False, trigger=Event(), cancelled=True)
+
+    assert token.recheck()
+
+
+def test_negative_min_interval():
+    with pytest.raises(ValueError, match=match('You cannot specify a minimum interval less than zero.')):
+        ConditionToken(lambda: False, min_interval=-1)
+
+
+def test_min_interval_limits_evaluations():
+    calls = []
+    token = ConditionToken(lambda: calls.append(1) or False, min_interval=0.1)
+
+    for _ in range(1000):
+        assert token.keep_on()
+
+    assert len(calls) == 1
+
+    sleep(0.1)
+
+    for _ in range(1000):
+        assert token.keep_on()
+
+    assert len(calls) == 2
+
+
+def test_zero_min_interval():
+    calls = []
+    token = ConditionToken(lambda: calls.append(1) or False, min_interval=0)
+
+    for _ in range(10):
+        token.check()
+
+    assert len(calls) == 10
+
+
+def test_min_interval_does_not_reuse_positive_results():
+    results = [True, False, True]
+    token = ConditionToken(lambda: results.pop(0), min_interval=100, caching=False)
+
+    assert token.cancelled
+    assert not token.cancelled
+    assert not token.cancelled
+    assert results == [True]
+
+
+def test_min_interval_with_trigger():
+    calls = []
+    trigger = Event()
+    token = ConditionToken(lambda: calls.append(1) or False, trigger=trigger, min_interval=0.1)
+
+    token.check()
+    token.check()
+
+    assert len(calls) == 1
+
+    trigger.set()
+    token.check()
+    token.check()
+
+    assert len(calls) == 2
+
+    sleep(0.1)
+    token.check()
+
+    assert len(calls) == 3
+
+
+def test_recheck_ignores_min_interval():
+    flag = []
+    token = ConditionToken(lambda: bool(flag), min_interval=100)
+
+    assert not token.cancelled
+
+    flag.append(1)
+
+    assert not token.cancelled
+    assert token.recheck()
+    assert token.cancelled
+
+
+def test_wait_with_min_interval():
+    flag = []
+    token = ConditionToken(lambda: bool(flag), min_interval=0.01)
+    timer = Timer(0.05, flag.append, args=(1,))
+    timer.start()
+
+    start_time = perf_counter()
+    token.wait()
+    finish_time = perf_counter()
+    timer.join()
+
+    assert 0.05 <= finish_time - start_time < 1
@@ -1,6 +1,8 @@
-from threading import Thread
+from contextlib import suppress
+from threading import Barrier, RLock, Thread
 
 import pytest
+from full_match import match
 
 from cantok import CounterCancellationError, CounterToken, SimpleToken
 from cantok.tokens.abstract.abstract_token import CancelCause, CancellationReport
@@ -327,3 +329,211 @@ def test_repr_for_counter_token():
 
     assert repr(CounterToken(10000, direct=False, cancelled=True)) == 'CounterToken(10000, cancelled=True, direct=False)'
     assert repr(CounterToken(10000, CounterToken(10000), direct=False, cancelled=True)) == 'CounterToken(10000, CounterToken(10000), cancelled=True, direct=False)'
+
+
+def test_chunk_size_less_than_one():
+    with pytest.raises(ValueError, match=match('The chunk size must be greater than zero.')):
+        CounterToken(5, chunk_size=0)
+
+
+@pytest.mark.parametrize(
+    ('counter', 'chunk_size'),
+    [
+        (0, 2),
+        (1, 2),
+        (10, 3),
+        (10, 10),
+        (10, 100),
+        (1000, 64),
+    ],
+)
+def test_chunked_counter_in_one_thread(counter, chunk_size):
+    token = CounterToken(counter, chunk_size=chunk_size)
+    iterations = 0
+
+    while token:
+        iterations += 1
+
+    assert iterations == counter
+    assert token.counter == 0
+    assert token.cancelled
+    assert isinstance(token._get_report(True), CancellationReport)
+    assert token._get_report(True).cause == CancelCause.SUPERPOWER
+
+
+def test_chunked_counter_takes_iterations_in_chunks():
+    token = CounterToken(10, chunk_size=4)
+
+    assert token.keep_on()
+    assert token.counter == 6
+
+    for _ in range(3):
+        assert token.keep_on()
+
+    assert token.counter == 6
+
+    assert token.keep_on()
+    assert token.counter == 2
+
+
+class CountingLock:
+    def __init__(self):
+        self.lock = RLock()
+        self.acquisitions = 0
+
+    def __enter__(self):
+        self.acquisitions += 1
+        return self.lock.__enter__()
+
+    def __exit__(self, *arguments):
+        return self.lock.__exit__(*arguments)
+
+
+@pytest.mark.parametrize(
+    ('chunk_size', 'expected_acquisitions'),
+    [
+        (1, 20),
+        (5, 2),
+    ],
+)
+def test_check_of_chunked_counter_takes_lock_only_for_chunks(chunk_size, expected_acquisitions):
+    token = CounterToken(10, chunk_size=chunk_size)
+    lock = CountingLock()
+    token._lazy_lock = lock
+
+    for _ in range(10):
+        token.check()
+
+    assert lock.acquisitions == expected_acquisitions
+    assert token._stateless_superpower == (chunk_size > 1)
+
+    with pytest.raises(CounterCancellationError):
+        token.check()
+
+
+@pytest.mark.parametrize(
+    'chunk_size',
+    [1, 2, 16, 1000],
+)
+def test_chunked_counter_never_exceeds_counter_with_check_in_many_threads(chunk_size):
+    number_of_threads = 8
+    counter = 10000
+    token = CounterToken(counter, chunk_size=chunk_size)
+    iterations = [0] * number_of_threads
+    barrier = Barrier(number_of_threads)
+
+    def work(index):
+        barrier.wait()
+        with suppress(CounterCancellationError):
+            while True:
+                token.check()
+                iterations[index] += 1
+
+    threads = [Thread(target=work, args=(index,)) for index in range(number_of_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert counter - number_of_threads * (chunk_size - 1) <= sum(iterations) <= counter
+    assert token.cancelled
+
+
+@pytest.mark.parametrize(
+    'chunk_size',
+    [1, 2, 16, 1000],
+)
+def test_chunked_counter_never_exceeds_counter_in_many_threads(chunk_size):
+    number_of_threads = 8
+    counter = 10000
+    token = CounterToken(counter, chunk_size=chunk_size)
+    iterations = [0] * number_of_threads
+    barrier = Barrier(number_of_threads)
+
+    def work(index):
+        barrier.wait()
+        while token.keep_on():
+            iterations[index] += 1
+
+    threads = [Thread(target=work, args=(index,)) for index in range(number_of_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert counter - number_of_threads * (chunk_size - 1) <= sum(iterations) <= counter
+    assert token.cancelled
+
+
+def test_chunked_counter_is_not_consumed_by_indirect_polling():
+    token = CounterToken(5, chunk_size=2)
+    parent = SimpleToken(token)
+
+    for _ in range(10):
+        assert parent.keep_on()
+
+    assert token.counter == 5
+
+    token.keep_on()
+
+    for _ in range(10):
+        assert parent.keep_on()
+
+    assert token.counter == 3
+    assert token._chunks.remaining == 1
+
+
+def test_chunked_counter_is_consumed_by_indirect_polling_if_not_direct():
+    token = CounterToken(5, chunk_size=2, direct=False)
+    parent = SimpleToken(token)
+
+    for _ in range(5):
+        assert parent.keep_on()
+
+    assert not parent.keep_on()
+
+
+def test_repr_of_chunked_counter_token():
+    assert repr(CounterToken(5, chunk_size=1)) == 'CounterToken(5)'
+    assert repr(CounterToken(5, chunk_size=10)) == 'CounterToken(5, chunk_size=10)'
+    assert repr(CounterToken(5, chunk_size=10, direct=False)) == 'CounterToken(5, direct=False, chunk_size=10)'
+
+
+@pytest.mark.parametrize(
+    'chunk_size',
+    [1, 3],
+)
+def test_indirect_polling_does_not_change_counter(chunk_size, monkeypatch):
+    token = CounterToken(2, chunk_size=chunk_size)
+    parent = SimpleToken(token)
+
+    def superpower(_):
+        raise AssertionError
+
+    monkeypatch.setattr(CounterToken, '_superpower', superpower)
+
+    for _ in range(5):
+        assert parent.keep_on()
+
+    assert token.counter == 2
+
+
+@pytest.mark.parametrize(
+    ('counter', 'chunk_size', 'direct_checks', 'expected_result'),
+    [
+        (0, 1, 0, True),
+        (1, 1, 0, False),
+        (1, 1, 1, True),
+        (0, 3, 0, True),
+        (2, 3, 1, False),
+        (2, 3, 2, True),
+    ],
+)
+def test_peek_superpower(counter, chunk_size, direct_checks, expected_result):
+    token = CounterToken(counter, chunk_size=chunk_size)
+
+    for _ in range(direct_checks):
+        token.keep_on()
+
+    assert token._peek_superpower() == expected_result
+    assert SimpleToken(token).cancelled == expected_result
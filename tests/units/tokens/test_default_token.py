@@ -3,7 +3,13 @@ import sys
 import pytest
 from full_match import match
 
-from cantok import DefaultToken, ImpossibleCancelError, SimpleToken, TimeoutToken
+from cantok import (
+    DefaultToken,
+    ImpossibleCancelError,
+    SimpleToken,
+    TimeoutToken,
+    TokenGroup,
+)
 
 
 def test_dafault_token_is_not_cancelled_by_default():
@@ -109,3 +115,34 @@ def test_temp_timeout_token_plus_temp_default_token():
     assert isinstance(token, TimeoutToken)
     assert token._timeout == 1
     assert len(token._tokens) == 0
+
+
+def test_callbacks_of_default_token_are_not_registered():
+    token = DefaultToken()
+
+    for _ in range(1000):
+        handle = token.on_cancel(lambda: None)
+        assert not handle.active
+
+    assert token._listeners is None
+    assert not handle.unregister()
+
+
+def test_snapshot_of_default_token_does_not_register_listeners():
+    token = DefaultToken()
+
+    for _ in range(100):
+        token.snapshot().close()
+
+    assert token._listeners is None
+
+
+def test_default_token_in_group_does_not_register_listeners():
+    token = DefaultToken()
+    group = TokenGroup(token)
+
+    assert group.pop_cancelled() == []
+
+    group.discard(token)
+
+    assert token._listeners is None
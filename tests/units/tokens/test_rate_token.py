@@ -0,0 +1,249 @@
+import tracemalloc
+from threading import Barrier, Thread, Timer
+from time import perf_counter, sleep
+
+import pytest
+from full_match import match
+
+from cantok import (
+    CancellationError,
+    RateCancellationError,
+    RateToken,
+    SimpleToken,
+    TimeoutCancellationError,
+    TimeoutToken,
+    TokenGroup,
+)
+from cantok.tokens.abstract.abstract_token import CancelCause
+
+
+@pytest.mark.parametrize(
+    ('arguments', 'message'),
+    [
+        ((-1, 1), 'The limit must be greater than or equal to zero.'),
+        ((1, 0), 'The window must be greater than zero.'),
+        ((1, -1), 'The window must be greater than zero.'),
+    ],
+)
+def test_wrong_arguments(arguments, message):
+    with pytest.raises(ValueError, match=match(message)):
+        RateToken(*arguments)
+
+
+@pytest.mark.parametrize(
+    'limit',
+    [0, 1, 2, 10],
+)
+def test_limit_is_exceeded(limit):
+    token = RateToken(limit, 100)
+
+    for _ in range(limit):
+        token.hit()
+        assert token.keep_on()
+
+    token.hit()
+
+    assert token.cancelled
+    assert token._get_report(True).cause == CancelCause.SUPERPOWER
+
+
+def test_new_token_is_not_cancelled():
+    token = RateToken(0, 1)
+
+    assert not token.cancelled
+    token.check()
+
+
+def test_old_events_leave_the_window():
+    token = RateToken(2, 0.05)
+
+    token.hit()
+    token.hit()
+    sleep(0.06)
+    token.hit()
+    token.hit()
+
+    assert not token.cancelled
+
+    token.hit()
+
+    assert token.cancelled
+
+
+def test_cancellation_is_latched():
+    token = RateToken(1, 0.01)
+    token.hit()
+    token.hit()
+
+    sleep(0.02)
+    token.hit()
+
+    assert token.cancelled
+
+
+def test_checking_does_not_record_events():
+    token = RateToken(1, 100)
+
+    for _ in range(10):
+        assert token.keep_on()
+        token.check()
+
+    token.hit()
+
+    assert not token.cancelled
+
+
+def test_check_exceeded_limit():
+    token = RateToken(2, 1.5)
+    for _ in range(3):
+        token.hit()
+
+    with pytest.raises(RateCancellationError, match=match('The limit of 2 events per 1.5 seconds has been exceeded.')) as exception_info:
+        SimpleToken(token).check()
+
+    assert exception_info.value.token is token
+
+
+def test_exceeding_notifies_parents_and_callbacks():
+    calls = []
+    token = RateToken(1, 100)
+    parent = SimpleToken(token)
+    token.on_cancel(lambda: calls.append('token'))
+    parent.on_cancel(lambda: calls.append('parent'))
+
+    token.hit()
+
+    assert calls == []
+
+    token.hit()
+    token.hit()
+
+    assert sorted(calls) == ['parent', 'token']
+    assert parent.cancelled
+
+
+def test_rate_token_is_not_polled_by_parents():
+    parent = SimpleToken(RateToken(1, 1))
+
+    assert not parent._needs_polling()
+
+
+def test_rate_token_in_group():
+    group = TokenGroup()
+    token = RateToken(0, 1)
+    group.add(token)
+
+    assert group.pop_cancelled() == []
+
+    token.hit()
+
+    assert group.pop_cancelled() == [token]
+
+
+def test_rate_token_with_timeout():
+    token = RateToken(1, 1, TimeoutToken(0.01))
+
+    sleep(0.02)
+
+    with pytest.raises(TimeoutCancellationError):
+        token.check()
+
+
+def test_cancelled_rate_token_keeps_the_first_cause():
+    token = RateToken(0, 1, cancelled=True)
+    token.hit()
+
+    with pytest.raises(CancellationError, match=match('The token has been cancelled.')):
+        token.check()
+
+
+def test_hit_in_many_threads():
+    number_of_threads = 8
+    token = RateToken(number_of_threads * 100, 100)
+    barrier = Barrier(number_of_threads)
+    calls = []
+    token.on_cancel(lambda: calls.append(1))
+
+    def work():
+        barrier.wait()
+        for _ in range(100):
+            token.hit()
+
+    threads = [Thread(target=work) for _ in range(number_of_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not token.cancelled
+
+    token.hit()
+
+    assert token.cancelled
+    assert calls == [1]
+
+
+def test_hit_does_not_allocate_memory():
+    token = RateToken(100, 100)
+    for _ in range(1000):
+        token.hit()
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        for _ in range(1000):
+            token.hit()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    assert after - before < 1000
+
+
+def test_wait_is_woken_up_by_hit():
+    token = RateToken(0, 1)
+    timer = Timer(0.05, token.hit)
+    timer.start()
+
+    start_time = perf_counter()
+    token.wait(step=10)
+    finish_time = perf_counter()
+    timer.join()
+
+    assert finish_time - start_time < 5
+
+
+@pytest.mark.parametrize(
+    ('token', 'expected_repr'),
+    [
+        (RateToken(10, 1), 'RateToken(10, 1)'),
+        (RateToken(10, 0.5), 'RateToken(10, 0.5)'),
+        (RateToken(10, 1, cancelled=True), 'RateToken(10, 1, cancelled=True)'),
+        (RateToken(10, 1, SimpleToken()), 'RateToken(10, 1, SimpleToken())'),
+    ],
+)
+def test_repr(token, expected_repr):
+    assert repr(token) == expected_repr
+
+
+@pytest.mark.parametrize(
+    ('hits', 'cancelled', 'expected_cancelled'),
+    [
+        (0, False, False),
+        (1, False, False),
+        (2, False, True),
+        (0, True, True),
+    ],
+)
+def test_snapshot(hits, cancelled, expected_cancelled):
+    token = RateToken(1, 100, cancelled=cancelled)
+    for _ in range(hits):
+        token.hit()
+    snapshot = token.snapshot()
+
+    restored_token = snapshot.restore()
+
+    assert isinstance(restored_token, RateToken)
+    assert restored_token.cancelled == expected_cancelled
+
+    snapshot.close()
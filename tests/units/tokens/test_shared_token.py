@@ -0,0 +1,232 @@
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from threading import Timer
+from time import perf_counter, sleep
+
+import pytest
+from full_match import match
+
+from cantok import (
+    CancellationError,
+    ConditionToken,
+    SharedToken,
+    SimpleToken,
+    TimeoutToken,
+    TokenGroup,
+)
+
+START_METHODS = ['spawn'] if sys.platform == 'win32' else ['spawn', 'fork']
+
+
+def wait_for_cancellation(token):
+    token.wait(timeout=10)
+    return token.cancelled
+
+
+def cancel_token(token):
+    token.cancel()
+
+
+def test_token_is_not_cancelled_by_default():
+    token = SharedToken()
+
+    assert token
+    assert not token.cancelled
+    token.check()
+
+
+def test_cancel_token():
+    token = SharedToken()
+    token.cancel()
+
+    assert not token
+    with pytest.raises(CancellationError) as exc_info:
+        token.check()
+    assert exc_info.value.token is token
+
+
+def test_cancelled_token_cannot_be_restored():
+    token = SharedToken(cancelled=True)
+
+    assert token.cancelled
+
+    with pytest.raises(ValueError, match=match('You cannot restore a cancelled token.')):
+        token.cancelled = False
+
+    token._cancelled = False
+
+    assert token.cancelled
+
+
+def test_repr():
+    assert repr(SharedToken()) == 'SharedToken()'
+    assert repr(SharedToken(cancelled=True)) == 'SharedToken(cancelled=True)'
+    assert repr(SharedToken(SimpleToken())) == 'SharedToken(SimpleToken())'
+
+
+def test_unpickled_token_shares_the_flag():
+    token = SharedToken()
+    copy = pickle.loads(pickle.dumps(token))
+
+    assert copy is not token
+    assert copy
+
+    token.cancel()
+
+    assert not copy
+
+    another_token = SharedToken()
+    copy = pickle.loads(pickle.dumps(another_token))
+    copy.cancel()
+
+    assert not another_token
+
+
+def test_listeners_are_notified_when_cancellation_from_outside_is_found_out():
+    calls = []
+    token = SharedToken()
+    copy = pickle.loads(pickle.dumps(token))
+    parent = SimpleToken(copy)
+    copy.on_cancel(lambda: calls.append('copy'))
+    parent.on_cancel(lambda: calls.append('parent'))
+
+    token.cancel()
+
+    assert calls == []
+    assert not parent
+    assert calls == ['copy', 'parent']
+    assert not copy
+    assert calls == ['copy', 'parent']
+
+
+def test_shared_token_is_polled_by_parents():
+    token = SharedToken()
+    parent = TimeoutToken(15, token)
+
+    assert parent._tokens_to_poll == [token]
+    assert parent._get_polling_interval(0.1) == 0.1
+
+
+def cancel_from_other_process(token):
+    # The same thing another process does: the flag is written directly.
+    token._buffer[0] = 1
+
+
+def test_shared_token_with_timeout_is_polled_by_parents():
+    token = SharedToken(TimeoutToken(15))
+    parent = SimpleToken(token)
+
+    assert token._get_deadline() is None
+    assert parent._tokens_to_poll == [token]
+    assert parent._timed_tokens == ()
+    assert parent
+
+    cancel_from_other_process(token)
+
+    assert parent.is_cancelled()
+
+
+def test_shared_token_with_timeout_is_polled_by_group():
+    token = SharedToken(TimeoutToken(15))
+    group = TokenGroup(token)
+
+    assert group.pop_cancelled() == []
+
+    cancel_from_other_process(token)
+
+    assert group.pop_cancelled() == [token]
+
+
+def test_wait_for_shared_token_with_timeout():
+    token = SharedToken(TimeoutToken(15))
+    timer = Timer(0.05, cancel_from_other_process, args=(token,))
+    timer.start()
+
+    start_time = perf_counter()
+    SimpleToken(token).wait(timeout=5)
+    finish_time = perf_counter()
+    timer.join()
+
+    assert token.cancelled
+    assert finish_time - start_time < 1
+
+
+def test_sum_with_other_tokens():
+    token = SharedToken()
+    condition_flag = []
+    total = token + ConditionToken(lambda: bool(condition_flag))
+
+    assert total
+    condition_flag.append(True)
+    assert not total
+    assert token
+
+    total = SharedToken() + token
+
+    assert total
+    token.cancel()
+    assert not total
+
+
+def test_temporary_shared_token_is_not_a_container_of_sum():
+    for total in (SharedToken() + TimeoutToken(15), TimeoutToken(15) + SharedToken()):
+        assert isinstance(total, TimeoutToken)
+        assert len(total._tokens) == 1
+        assert isinstance(total._tokens[0], SharedToken)
+        assert not total._tokens[0]._tokens
+
+    total = SharedToken() + SharedToken()
+
+    assert isinstance(total, SimpleToken)
+    assert len(total._tokens) == 2
+
+
+def test_token_with_embedded_tokens_cannot_be_pickled():
+    token = SharedToken(TimeoutToken(15))
+
+    with pytest.raises(TypeError, match=match('Only the flag of a SharedToken is shared, so a SharedToken with embedded tokens cannot be passed to another process. Pass a snapshot of the token instead.')):
+        pickle.dumps(token)
+
+
+def test_memory_is_freed_with_token():
+    token = SharedToken()
+    name = token._memory.name
+
+    del token
+
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=name)
+
+
+@pytest.mark.parametrize(
+    'start_method',
+    START_METHODS,
+)
+def test_other_process_sees_cancellation(start_method):
+    token = SharedToken()
+
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context(start_method)) as executor:
+        future = executor.submit(wait_for_cancellation, token)
+        sleep(0.1)
+        token.cancel()
+
+        assert future.result(timeout=30) == True
+
+
+@pytest.mark.parametrize(
+    'start_method',
+    START_METHODS,
+)
+def test_other_process_cancels_token(start_method):
+    token = SharedToken()
+
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context(start_method)) as executor:
+        executor.submit(cancel_token, token).result(timeout=30)
+        executor.submit(cancel_token, token).result(timeout=30)
+
+    assert token.cancelled
+    with pytest.raises(CancellationError):
+        token.check()
@@ -2038,3 +2038,36 @@ def test_temp_timeout_token_plus_negative_timeout_token():
     assert isinstance(token, SimpleToken)
     assert not token
     assert not token._tokens
+
+
+@pytest.mark.parametrize(
+    'monotonic',
+    [True, False],
+)
+def test_remaining_time_of_timeout_token(monotonic):
+    token = TimeoutToken(5, monotonic=monotonic)
+
+    assert 4.5 < token.remaining() <= 5
+    assert 4.5 < token.deadline - perf_counter() <= 5
+    assert TimeoutToken(0, monotonic=monotonic).remaining() == 0
+
+
+def test_remaining_time_of_timeout_token_is_the_nearest_of_nested_deadlines():
+    assert 2.5 < TimeoutToken(5, TimeoutToken(3)).remaining() <= 3
+    assert 2.5 < TimeoutToken(3, TimeoutToken(5, monotonic=True)).remaining() <= 3
+    assert 2.5 < TimeoutToken(5, SimpleToken(TimeoutToken(3, monotonic=True))).remaining() <= 3
+    assert 4.5 < TimeoutToken(5, ConditionToken(lambda: False)).remaining() <= 5
+
+
+def test_timeout_token_with_nested_timeouts_is_compared_with_the_clock():
+    near_timeout = TimeoutToken(3)
+    token = TimeoutToken(5, near_timeout)
+    root = SimpleToken(token)
+
+    assert root._timed_tokens == [(perf_counter, near_timeout._deadline, token)]
+
+    token = TimeoutToken(5, TimeoutToken(3, monotonic=True))
+    root = SimpleToken(token)
+
+    assert not root._timed_tokens
+    assert root._tokens_to_poll == [token]